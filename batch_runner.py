@@ -0,0 +1,223 @@
+"""Simulate many complete Library Defender runs in parallel and save per-run results.
+
+Every combination of difficulty, map, seed and policy is one headless run, played
+until game over (or --max-ticks). Results go to a compressed .npz file with one
+array per column, so they load straight into NumPy or pandas for balance tuning.
+
+Run from the repository root:
+
+    python batch_runner.py --seeds 100 --out results.npz
+    python batch_runner.py --difficulty 0 3 --maps default fiction_maze --policy turret --seeds 50
+    python batch_runner.py --spawn-weights weights.json --difficulty-multiplier 0.8 1.0 1.2 1.5
+"""
+import argparse
+import dataclasses
+import functools
+import itertools
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# No window or audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+
+import main
+
+REPO_ROOT = Path(__file__).resolve().parent
+
+MAP_TYPES = ("default",) + tuple(chapter["map_type"] for chapter in main.STORY_CHAPTERS.values())
+MOVES = ('move_up', 'move_down', 'move_left', 'move_right')
+SHUSH_REACH = 100  # Game.shush_attack range
+
+
+def nearest_enemy(game):
+    """The live enemy closest to the player and its squared distance, or (None, None)"""
+    px, py = game.player.x, game.player.y
+    best, best_dist = None, None
+    for enemy in game.enemies.live():
+        dist = (enemy.x - px) ** 2 + (enemy.y - py) ** 2
+        if best_dist is None or dist < best_dist:
+            best, best_dist = enemy, dist
+    return best, best_dist
+
+
+class IdlePolicy:
+    """Stands still and never attacks: a baseline for how long the monsters alone take"""
+    def __init__(self, seed):
+        pass
+
+    def __call__(self, game):
+        return main.NO_INPUT
+
+
+class TurretPolicy:
+    """Stands still, throws at the nearest enemy and shushes anything in reach"""
+    def __init__(self, seed):
+        pass
+
+    def attacks(self, game):
+        enemy, dist = nearest_enemy(game)
+        if enemy is None:
+            return (), ()
+        presses = ('shush',) if dist < SHUSH_REACH * SHUSH_REACH else ()
+        return presses, ((int(enemy.x), int(enemy.y)),)
+
+    def __call__(self, game):
+        presses, clicks = self.attacks(game)
+        return main.TickInput(frozenset(), presses, clicks)
+
+
+class WanderPolicy(TurretPolicy):
+    """Fights like the turret while walking in a random direction that changes every second"""
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.held = frozenset()
+
+    def __call__(self, game):
+        if game.sim_clock.ticks % main.FPS == 0:
+            self.held = frozenset((self.rng.choice(MOVES),))
+        presses, clicks = self.attacks(game)
+        return main.TickInput(self.held, presses, clicks)
+
+
+POLICIES = {
+    'idle': IdlePolicy,
+    'turret': TurretPolicy,
+    'wander': WanderPolicy,
+}
+
+
+def new_game(settings, job):
+    """A headless game at the start of the job's run, with the batch's archetypes and spawn tuning"""
+    difficulty, map_type, seed, policy = job
+    # Rows travel to the workers as plain dicts, since the MappingProxyType table does not pickle
+    rows = settings['archetypes']
+    archetypes = main.monster_archetypes_from_rows(rows) if rows else None
+    game = main.Game(monster_engine=settings['monster_engine'], archetypes=archetypes, headless=True,
+                     input_source=main.PolicyInput(POLICIES[policy](seed)), seed=seed)
+    if settings['difficulty_multiplier']:
+        game.spawn_director = main.SpawnDirector(game.enemy_spawn_delay, game.archetypes,
+                                                 settings['difficulty_multiplier'])
+    game.selected_difficulty = difficulty
+    game.endless_map_type = map_type
+    game.state = main.PLAYING
+    game.restart_game()
+    return game
+
+
+def batch_archetypes(archetypes_path=None, spawn_weights_path=None):
+    """Archetype rows for a batch: a --monster-archetypes table (or the built-in one) with spawn weights swapped in"""
+    archetypes = main.load_monster_archetypes(archetypes_path) if archetypes_path else main.MONSTER_ARCHETYPES
+    if spawn_weights_path:
+        with open(spawn_weights_path) as f:
+            overrides = json.load(f)
+        unknown = set(overrides) - set(archetypes)
+        if unknown:
+            raise ValueError(f"Spawn weights for unknown monster types: {', '.join(sorted(unknown))}")
+        archetypes = {name: dataclasses.replace(row, spawn_weights=tuple(map(tuple, overrides.get(name, ()))))
+                      for name, row in archetypes.items()}
+    elif not archetypes_path:
+        return None
+    rows = {name: dataclasses.asdict(row) for name, row in archetypes.items()}
+    main.monster_archetypes_from_rows(rows)  # Reject a table with nothing to spawn here, not in every worker
+    return rows
+
+
+def simulate(settings, job):
+    """Play one run to the end and return its result row"""
+    game = new_game(settings, job)
+
+    ticks = 0
+    while game.state == main.PLAYING and ticks < settings['max_ticks']:
+        game.update()
+        ticks += 1
+    return {
+        'score': game.score,
+        'wave': game.wave_number,
+        'survival_ms': game.run_time(),
+        'ticks': ticks,
+        'game_over': game.state == main.GAME_OVER,
+        'kills': [game.kills_by_type.get(name, 0) for name in settings['monster_types']],
+    }
+
+
+def save_results(path, jobs, rows, monster_types):
+    """Write one array per column; kills is a (runs, monster types) matrix labelled by monster_types"""
+    difficulty, map_type, seed, policy = zip(*jobs)
+    np.savez_compressed(
+        path,
+        difficulty=np.array(difficulty, dtype=np.int8),
+        map_type=np.array(map_type),
+        seed=np.array(seed, dtype=np.int64),
+        policy=np.array(policy),
+        score=np.array([row['score'] for row in rows], dtype=np.int64),
+        wave=np.array([row['wave'] for row in rows], dtype=np.int32),
+        survival_ms=np.array([row['survival_ms'] for row in rows], dtype=np.float64),
+        ticks=np.array([row['ticks'] for row in rows], dtype=np.int32),
+        game_over=np.array([row['game_over'] for row in rows], dtype=bool),
+        kills=np.array([row['kills'] for row in rows], dtype=np.int32).reshape(len(rows), len(monster_types)),
+        monster_types=np.array(monster_types),
+    )
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--difficulty", type=int, nargs="+", default=[main.DIFFICULTY_EASY, main.DIFFICULTY_NORMAL,
+                                                                      main.DIFFICULTY_HARD, main.DIFFICULTY_EXPERT],
+                        help="difficulty levels to run (0-3)")
+    parser.add_argument("--maps", nargs="+", default=list(MAP_TYPES), choices=MAP_TYPES, help="map types to run")
+    parser.add_argument("--policy", nargs="+", default=list(POLICIES), choices=list(POLICIES), help="player policies")
+    parser.add_argument("--seeds", type=int, default=10, help="runs per combination")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=main.FPS * 60 * 10,
+                        help="stop a run that survives this long (default: 10 simulated minutes)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--monster-engine", action="store_true", help="move enemies with the NumPy monster engine")
+    parser.add_argument("--monster-archetypes", metavar="PATH", help="JSON monster archetype table to test")
+    parser.add_argument("--spawn-weights", metavar="PATH",
+                        help='JSON {"type": [[from_ms, weight], ...]} replacing every spawn weight (types left out '
+                             'never spawn on their own)')
+    parser.add_argument("--difficulty-multiplier", type=float, nargs=4, metavar=("EASY", "NORMAL", "HARD", "EXPERT"),
+                        help="spawn delay multiplier per difficulty, instead of SpawnDirector.DIFFICULTY_MULTIPLIER")
+    parser.add_argument("--out", default="batch_results.npz", help="output .npz file")
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)  # main.py loads sprites relative to the repository root
+    archetypes = batch_archetypes(args.monster_archetypes, args.spawn_weights)
+    multipliers = None
+    if args.difficulty_multiplier:
+        multipliers = dict(zip(main.SpawnDirector.DIFFICULTY_MULTIPLIER, args.difficulty_multiplier))
+    settings = {
+        'monster_engine': args.monster_engine,
+        'archetypes': archetypes,
+        'difficulty_multiplier': multipliers,
+        'monster_types': list(archetypes or main.MONSTER_ARCHETYPES),
+        'max_ticks': args.max_ticks,
+    }
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    jobs = list(itertools.product(args.difficulty, args.maps, seeds, args.policy))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        chunksize = max(1, len(jobs) // (args.workers * 4))
+        rows = list(pool.map(functools.partial(simulate, settings), jobs, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+
+    save_results(args.out, jobs, rows, settings['monster_types'])
+    total_ticks = sum(row['ticks'] for row in rows)
+    print(f"{len(rows)} runs, {total_ticks} ticks in {elapsed:.1f}s ({total_ticks / elapsed:.0f} ticks/s) -> {args.out}")
+    for difficulty in args.difficulty:
+        picked = [row for job, row in zip(jobs, rows) if job[0] == difficulty]
+        score = sum(row['score'] for row in picked) / len(picked)
+        survival = sum(row['survival_ms'] for row in picked) / len(picked) / 1000
+        print(f"  difficulty {difficulty}: mean score {score:.0f}, mean survival {survival:.1f}s")
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,107 @@
+"""Bytes per entity and construction time for the game's entity classes.
+
+Run from the repository root:
+
+    python benchmarks/entity_memory.py
+    python benchmarks/entity_memory.py --baseline HEAD~1   # compare with an older main.py
+"""
+import argparse
+import gc
+import importlib.util
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# No window or audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_game_module(name, path):
+    """Import a main.py under the given module name"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_revision(revision, workdir):
+    """Import main.py as it was at a git revision"""
+    source = subprocess.run(["git", "show", f"{revision}:main.py"], cwd=REPO_ROOT,
+                            check=True, capture_output=True, text=True).stdout
+    path = Path(workdir) / "main_baseline.py"
+    path.write_text(source)
+    return load_game_module("main_baseline", path)
+
+
+def entity_factories(game):
+    """One zero-argument constructor per entity class"""
+    maze = game.LibraryMaze("default")
+    return {
+        "NoisyMonster": lambda: game.NoisyMonster(None, maze),
+        "Book": lambda: game.Book(100, 100, (600, 400)),
+        "PowerUp": lambda: game.PowerUp(),
+    }
+
+
+def measure(factory, count):
+    """Return (bytes kept alive per entity, microseconds per construction)"""
+    random.seed(0)
+    gc.collect()
+    start = time.perf_counter()
+    entities = [factory() for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    del entities
+
+    random.seed(0)
+    gc.collect()
+    entities = []
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(count):
+        entities.append(factory())
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    retained = after - before - sys.getsizeof(entities)  # The holding list is not part of an entity
+    return retained / count, elapsed / count * 1e6
+
+
+def report(label, game, count):
+    results = {}
+    for name, factory in entity_factories(game).items():
+        results[name] = measure(factory, count)
+    print(f"{label}")
+    for name, (size, micros) in results.items():
+        print(f"  {name:<14} {size:8.0f} bytes/entity {micros:8.1f} us/construct")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000, help="entities built per class")
+    parser.add_argument("--baseline", help="git revision whose main.py to measure for comparison")
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)  # main.py loads sprites relative to the repository root
+    with tempfile.TemporaryDirectory() as workdir:
+        if args.baseline:
+            before = report(f"baseline ({args.baseline})", load_revision(args.baseline, workdir), args.count)
+        after = report("working tree", load_game_module("main", REPO_ROOT / "main.py"), args.count)
+
+    if args.baseline:
+        print("change")
+        for name in after:
+            size = after[name][0] / before[name][0] - 1
+            micros = after[name][1] / before[name][1] - 1
+            print(f"  {name:<14} {size:+8.0%} bytes      {micros:+8.0%} time")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Per-frame cost of Game.update, check_collisions and draw_game in fixed scenarios.
+
+Each scenario is one map with a set number of monsters, books and particles. The game
+is topped back up to those numbers before every frame, outside the timed region, so
+every frame measures the same load. Prints JSON with median and p99 milliseconds.
+
+Run from the repository root:
+
+    python benchmarks/scenarios.py --out after.json
+    python benchmarks/scenarios.py --monsters 1000 --maps default --compare after.json
+"""
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# No window or audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Keep stdout clean for the JSON report
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+TIMERS = ("update", "check_collisions", "draw_game")
+
+
+def load_game_module(name, path):
+    """Import a main.py under the given module name"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_game(game, map_type, monster_engine, seed):
+    """A game mid-run on the given map, with nothing spawned yet"""
+    with contextlib.redirect_stdout(sys.stderr):  # Sprite loading chatter
+        state = game.Game(monster_engine=monster_engine, seed=seed)
+    state.high_score_manager.high_scores_file = None  # A stray game over must not touch the real table
+    state.endless_map_type = map_type
+    state.state = game.PLAYING
+    state.restart_game()
+    return state
+
+
+def top_up(game, state, rng, monsters, books, particles):
+    """Bring the scenario back to its entity counts and keep the run from ending"""
+    state.state = game.PLAYING
+    state.noise_level = 0
+    state.shield_timer = state.sim_clock.now()  # Monsters reaching the player are destroyed, not game over
+
+    missing = monsters - len(state.enemies)
+    if missing > 0:
+        state.spawn_enemy([None] * missing)
+
+    for _ in range(books - len(state.books)):
+        x = rng.uniform(game.TILE_SIZE, game.SCREEN_WIDTH - game.TILE_SIZE)
+        y = rng.uniform(game.TILE_SIZE, game.SCREEN_HEIGHT - game.TILE_SIZE)
+        target = (rng.uniform(0, game.SCREEN_WIDTH), rng.uniform(0, game.SCREEN_HEIGHT))
+        state.books.append(game.Book(x, y, target, rng=rng))
+
+    while state.particles.count < particles:
+        burst = min(20, particles - state.particles.count)
+        state.particles.emit(rng.uniform(0, game.SCREEN_WIDTH), rng.uniform(0, game.SCREEN_HEIGHT),
+                             game.GOLD, burst)
+
+
+def run_scenario(game, map_type, monsters, books, particles, frames, warmup, monster_engine, seed):
+    """Return {timer: list of per-frame milliseconds} over the measured frames"""
+    state = build_game(game, map_type, monster_engine, seed)
+    rng = random.Random(seed)
+
+    # check_collisions runs inside update; time it on the way through
+    collisions = []
+    check_collisions = state.check_collisions
+
+    def timed_check_collisions():
+        start = time.perf_counter()
+        check_collisions()
+        collisions.append(time.perf_counter() - start)
+    state.check_collisions = timed_check_collisions
+
+    samples = {name: [] for name in TIMERS}
+    for frame in range(warmup + frames):
+        top_up(game, state, rng, monsters, books, particles)
+        collisions.clear()
+
+        start = time.perf_counter()
+        state.update()
+        update = time.perf_counter() - start
+
+        start = time.perf_counter()
+        state.draw_game()
+        draw = time.perf_counter() - start
+
+        if frame >= warmup:
+            samples["update"].append(update * 1000)
+            samples["check_collisions"].append(sum(collisions) * 1000)
+            samples["draw_game"].append(draw * 1000)
+    return samples
+
+
+def summarize(samples):
+    return {
+        name: {
+            "median_ms": round(float(np.median(values)), 4),
+            "p99_ms": round(float(np.percentile(values, 99)), 4),
+        }
+        for name, values in samples.items()
+    }
+
+
+def compare(results, baseline_path):
+    """Print each scenario's change against an earlier JSON report"""
+    with open(baseline_path) as f:
+        baseline = {(row["map"], row["monsters"], row["books"], row["particles"]): row
+                    for row in json.load(f)["scenarios"]}
+    print(f"change vs {baseline_path} (median, p99)", file=sys.stderr)
+    for row in results["scenarios"]:
+        before = baseline.get((row["map"], row["monsters"], row["books"], row["particles"]))
+        if before is None:
+            continue
+        cells = []
+        for name in TIMERS:
+            median = row[name]["median_ms"] / before[name]["median_ms"] - 1
+            p99 = row[name]["p99_ms"] / before[name]["p99_ms"] - 1
+            cells.append(f"{name} {median:+.0%} {p99:+.0%}")
+        print(f"  {row['map']:<18} {row['monsters']:>5} monsters  " + "  ".join(cells), file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--monsters", type=int, nargs="+", default=[50, 200, 1000], help="monster counts to run")
+    parser.add_argument("--books", type=int, default=300, help="books in flight")
+    parser.add_argument("--particles", type=int, default=2000, help="live particles")
+    parser.add_argument("--maps", nargs="+", help="map types (default: every map)")
+    parser.add_argument("--frames", type=int, default=120, help="measured frames per scenario")
+    parser.add_argument("--warmup", type=int, default=10, help="unmeasured frames first (sprite caches, pools)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--monster-engine", action="store_true", help="move enemies with the NumPy monster engine")
+    parser.add_argument("--out", help="also write the JSON report here")
+    parser.add_argument("--compare", metavar="JSON", help="earlier report to compare against")
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)  # main.py loads sprites relative to the repository root
+    with contextlib.redirect_stdout(sys.stderr):
+        game = load_game_module("main", REPO_ROOT / "main.py")
+    maps = args.maps or ["default"] + [chapter["map_type"] for chapter in game.STORY_CHAPTERS.values()]
+
+    results = {
+        "config": {
+            "frames": args.frames,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "monster_engine": args.monster_engine,
+        },
+        "scenarios": [],
+    }
+    for map_type in maps:
+        for monsters in args.monsters:
+            samples = run_scenario(game, map_type, monsters, args.books, args.particles, args.frames, args.warmup,
+                                   args.monster_engine, args.seed)
+            row = {"map": map_type, "monsters": monsters, "books": args.books, "particles": args.particles}
+            row.update(summarize(samples))
+            results["scenarios"].append(row)
+
+    report = json.dumps(results, indent=2)
+    print(report)
+    if args.out:
+        Path(args.out).write_text(report + "\n")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
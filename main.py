@@ -1,21 +1,40 @@
 import pygame
 import sys
+import time
 import random
 import math
+import heapq
+import hashlib
 import json
 import os
 import numpy as np
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
 from pathlib import Path
 
+# Headless command-line runs never open a window or play sound, so keep SDL off the real devices
+if __name__ == "__main__" and any(arg.split("=")[0] in ("--headless", "--max-speed") for arg in sys.argv[1:]):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
 # Initialize Pygame
 pygame.init()
-pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+try:
+    pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+except pygame.error:
+    pass  # No audio device (e.g. a headless server); SoundManager stays silent
 
 # Constants
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
 
+# Simulation timing
+TICK_MS = 1000 / FPS  # Simulated milliseconds per fixed update tick
+NEVER = -10 ** 9      # Timestamp for timers that have not fired yet
+RENDER_FPS = FPS      # Default cap on drawn frames per second; 0 draws as fast as possible
+
 # Difficulty Levels
 DIFFICULTY_EASY = 0
 DIFFICULTY_NORMAL = 1
@@ -66,6 +85,7 @@ READING_DESK = 3
 LAMP = 4
 CARPET = 5
 ENTRANCE = 6
+WALKABLE_TILES = (EMPTY, CARPET, ENTRANCE)
 
 # Story Mode Constants
 STORY_CHAPTERS = {
@@ -107,19 +127,21 @@ STORY_CHAPTERS = {
 }
 
 class LibraryMaze:
-    def __init__(self, map_type="default"):
+    def __init__(self, map_type="default", rng=random):
         self.width = MAZE_WIDTH
         self.height = MAZE_HEIGHT
         self.map_type = map_type
         self.tiles = [[EMPTY for _ in range(self.width)] for _ in range(self.height)]
-        self.generate_map_layout()
+        self.generate_map_layout(rng)
+        self.build_walkable_mask()
+        self.build_spawn_index()
     
-    def generate_map_layout(self):
+    def generate_map_layout(self, rng=random):
         """Generate different map layouts based on story chapter"""
         if self.map_type == "main_hall":
             self.generate_main_hall()
         elif self.map_type == "fiction_maze":
-            self.generate_fiction_maze()
+            self.generate_fiction_maze(rng)
         elif self.map_type == "reference_fortress":
             self.generate_reference_fortress()
         elif self.map_type == "poetry_garden":
@@ -217,7 +239,7 @@ class LibraryMaze:
                 self.tiles[y][2] = BOOKSHELF
                 self.tiles[y][self.width-3] = BOOKSHELF
     
-    def generate_fiction_maze(self):
+    def generate_fiction_maze(self, rng=random):
         """Chapter 2: Complex maze of fiction bookshelves"""
         # Fill with carpet
         for y in range(self.height):
@@ -237,10 +259,10 @@ class LibraryMaze:
             for x in range(2, self.width-2, 2):
                 self.tiles[y][x] = BOOKSHELF
                 # Create some connecting walls
-                if random.random() > 0.4:
+                if rng.random() > 0.4:
                     if x + 1 < self.width-2:
                         self.tiles[y][x + 1] = BOOKSHELF
-                if random.random() > 0.4:
+                if rng.random() > 0.4:
                     if y + 1 < self.height-2:
                         self.tiles[y + 1][x] = BOOKSHELF
         
@@ -348,6 +370,81 @@ class LibraryMaze:
                 if 0 < center_x + dx < self.width and 0 < center_y + dy < self.height:
                     self.tiles[center_y + dy][center_x + dx] = ENTRANCE
     
+    def build_walkable_mask(self):
+        """Snapshot the generated layout as a uint8 tile array and a boolean walkable mask"""
+        self.tile_array = np.array(self.tiles, dtype=np.uint8)
+        self.walkable = np.isin(self.tile_array, WALKABLE_TILES)
+        # Plain nested lists index faster than NumPy for one point at a time
+        self.walkable_rows = self.walkable.tolist()
+    
+    def build_spawn_index(self, start_tile=(2, 2), edge_band=3):
+        """Flood-fill the cells reachable from the librarian's start and index the spawnable ones"""
+        # Start from the nearest walkable tile, in case furniture covers the start tile
+        start = self.nearest_walkable_tile(*start_tile)
+        self.reachable = np.zeros_like(self.walkable)
+        if start is not None:
+            self.reachable[start[1], start[0]] = True
+            frontier = deque([start])
+            while frontier:
+                tile_x, tile_y = frontier.popleft()
+                for nx, ny in ((tile_x + 1, tile_y), (tile_x - 1, tile_y), (tile_x, tile_y + 1), (tile_x, tile_y - 1)):
+                    if (0 <= nx < self.width and 0 <= ny < self.height
+                            and self.walkable_rows[ny][nx] and not self.reachable[ny, nx]):
+                        self.reachable[ny, nx] = True
+                        frontier.append((nx, ny))
+        
+        # Tile centres of every reachable cell, for teleports
+        rows, cols = np.nonzero(self.reachable)
+        self.reachable_xs = cols * TILE_SIZE + TILE_SIZE / 2
+        self.reachable_ys = rows * TILE_SIZE + TILE_SIZE / 2
+        self.nearby_cells = {}  # (tile_x, tile_y, radius) -> indices into the reachable arrays
+        
+        # Monsters enter from the right and bottom edges; dense maps fall back to any reachable cell
+        on_edge = (cols >= self.width - 1 - edge_band) | (rows >= self.height - 1 - edge_band)
+        if not on_edge.any():
+            on_edge[:] = True
+        self.spawn_xs = self.reachable_xs[on_edge].tolist()
+        self.spawn_ys = self.reachable_ys[on_edge].tolist()
+    
+    def nearest_walkable_tile(self, tile_x, tile_y):
+        """Breadth-first search outwards from a tile for the closest walkable one"""
+        seen = {(tile_x, tile_y)}
+        frontier = deque([(tile_x, tile_y)])
+        while frontier:
+            x, y = frontier.popleft()
+            if self.walkable_rows[y][x]:
+                return x, y
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if 0 <= nx < self.width and 0 <= ny < self.height and (nx, ny) not in seen:
+                    seen.add((nx, ny))
+                    frontier.append((nx, ny))
+        return None
+    
+    def random_spawn_point(self, rng=random):
+        """Centre of a random reachable cell near the right or bottom edge, or None if nothing is reachable"""
+        if not self.spawn_xs:
+            return None
+        index = rng.randrange(len(self.spawn_xs))
+        return self.spawn_xs[index], self.spawn_ys[index]
+    
+    def random_point_near(self, x, y, radius, rng=random):
+        """Centre of a random reachable cell within radius pixels (per axis) of (x, y)'s tile, or None"""
+        tile_x = int(x // TILE_SIZE)
+        tile_y = int(y // TILE_SIZE)
+        key = (tile_x, tile_y, radius)
+        nearby = self.nearby_cells.get(key)
+        if nearby is None:
+            # Worked out once per tile, then every pick is a single random index
+            centre_x = tile_x * TILE_SIZE + TILE_SIZE / 2
+            centre_y = tile_y * TILE_SIZE + TILE_SIZE / 2
+            nearby = np.flatnonzero((np.abs(self.reachable_xs - centre_x) <= radius)
+                                    & (np.abs(self.reachable_ys - centre_y) <= radius)).tolist()
+            self.nearby_cells[key] = nearby
+        if not nearby:
+            return None
+        index = nearby[rng.randrange(len(nearby))]
+        return float(self.reachable_xs[index]), float(self.reachable_ys[index])
+    
     def is_walkable(self, x, y):
         """Check if a position is walkable"""
         tile_x = int(x // TILE_SIZE)
@@ -356,8 +453,29 @@ class LibraryMaze:
         if tile_x < 0 or tile_x >= self.width or tile_y < 0 or tile_y >= self.height:
             return False
             
-        tile_type = self.tiles[tile_y][tile_x]
-        return tile_type in [EMPTY, CARPET, ENTRANCE]
+        return self.walkable_rows[tile_y][tile_x]
+    
+    def box_walkable(self, x, y, width, height):
+        """Check that all four corners of a width x height box at (x, y) are walkable"""
+        left = int(x // TILE_SIZE)
+        right = int((x + width) // TILE_SIZE)
+        top = int(y // TILE_SIZE)
+        bottom = int((y + height) // TILE_SIZE)
+        
+        if left < 0 or right >= self.width or top < 0 or bottom >= self.height:
+            return False
+        
+        rows = self.walkable_rows
+        return rows[top][left] and rows[top][right] and rows[bottom][left] and rows[bottom][right]
+    
+    def are_walkable(self, xs, ys):
+        """Batched is_walkable for arrays of pixel coordinates"""
+        tile_xs = np.floor_divide(xs, TILE_SIZE).astype(np.intp)
+        tile_ys = np.floor_divide(ys, TILE_SIZE).astype(np.intp)
+        inside = (tile_xs >= 0) & (tile_xs < self.width) & (tile_ys >= 0) & (tile_ys < self.height)
+        tile_xs = np.clip(tile_xs, 0, self.width - 1)
+        tile_ys = np.clip(tile_ys, 0, self.height - 1)
+        return inside & self.walkable[tile_ys, tile_xs]
     
     def get_tile_at(self, x, y):
         """Get tile type at pixel coordinates"""
@@ -369,13 +487,220 @@ class LibraryMaze:
             
         return self.tiles[tile_y][tile_x]
 
+class FlowField:
+    """Shortest-path directions from every tile to the player's tile, shared by all monsters"""
+    
+    # (dx, dy, cost) for the 8 neighbours of a tile
+    NEIGHBOURS = [
+        (1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+        (1, 1, math.sqrt(2)), (1, -1, math.sqrt(2)), (-1, 1, math.sqrt(2)), (-1, -1, math.sqrt(2))
+    ]
+    
+    def __init__(self, maze):
+        self.maze = maze
+        self.walkable = maze.walkable
+        self.goal = None
+        # Pixel centre of the next tile on the way to the goal, NaN where there is none
+        self.next_x = np.full((maze.height, maze.width), np.nan)
+        self.next_y = np.full((maze.height, maze.width), np.nan)
+    
+    def update(self, x, y):
+        """Re-solve the field if the player has moved onto a different tile"""
+        goal = (int(x // TILE_SIZE), int(y // TILE_SIZE))
+        if goal == self.goal:
+            return False
+        self.goal = goal
+        self.solve()
+        return True
+    
+    def solve(self):
+        """Dijkstra outwards from the goal tile over walkable tiles"""
+        width, height = self.maze.width, self.maze.height
+        walkable = self.walkable
+        self.next_x.fill(np.nan)
+        self.next_y.fill(np.nan)
+        
+        goal_x, goal_y = self.goal
+        if not (0 <= goal_x < width and 0 <= goal_y < height):
+            return
+        
+        distance = {self.goal: 0.0}
+        heap = [(0.0, goal_x, goal_y)]
+        while heap:
+            dist, tx, ty = heapq.heappop(heap)
+            if dist > distance[(tx, ty)]:
+                continue
+            for dx, dy, cost in self.NEIGHBOURS:
+                nx, ny = tx + dx, ty + dy
+                if not (0 <= nx < width and 0 <= ny < height) or not walkable[ny, nx]:
+                    continue
+                # No cutting corners past shelves and desks
+                if dx and dy and not (walkable[ny, tx] and walkable[ty, nx]):
+                    continue
+                new_dist = dist + cost
+                if new_dist < distance.get((nx, ny), float('inf')):
+                    distance[(nx, ny)] = new_dist
+                    heapq.heappush(heap, (new_dist, nx, ny))
+                    # Stepping from (nx, ny) to (tx, ty) is the way home
+                    self.next_x[ny, nx] = tx * TILE_SIZE + TILE_SIZE // 2
+                    self.next_y[ny, nx] = ty * TILE_SIZE + TILE_SIZE // 2
+    
+    def next_step(self, x, y):
+        """Centre of the next tile towards the player, or None when in the goal tile or unreachable"""
+        tile_x = int(x // TILE_SIZE)
+        tile_y = int(y // TILE_SIZE)
+        if tile_x < 0 or tile_x >= self.maze.width or tile_y < 0 or tile_y >= self.maze.height:
+            return None
+        step_x = self.next_x[tile_y, tile_x]
+        if step_x != step_x:  # NaN
+            return None
+        return step_x.item(), self.next_y[tile_y, tile_x].item()
+    
+    def passable(self, x, y):
+        """Whether a monster centred at (x, y) stands on a walkable tile (or the player's tile)"""
+        if self.maze.is_walkable(x, y):
+            return True
+        return (int(x // TILE_SIZE), int(y // TILE_SIZE)) == self.goal
+    
+    def passable_points(self, xs, ys):
+        """Vectorised passable for arrays of monster centres"""
+        passable = self.maze.are_walkable(xs, ys)
+        if self.goal is not None:
+            passable |= ((np.floor_divide(xs, TILE_SIZE) == self.goal[0]) &
+                         (np.floor_divide(ys, TILE_SIZE) == self.goal[1]))
+        return passable
+    
+    def next_steps(self, xs, ys):
+        """Vectorised next_step; NaN where a monster should chase directly"""
+        tile_xs = np.floor(xs / TILE_SIZE).astype(np.intp)
+        tile_ys = np.floor(ys / TILE_SIZE).astype(np.intp)
+        inside = (tile_xs >= 0) & (tile_xs < self.maze.width) & (tile_ys >= 0) & (tile_ys < self.maze.height)
+        tile_xs = np.clip(tile_xs, 0, self.maze.width - 1)
+        tile_ys = np.clip(tile_ys, 0, self.maze.height - 1)
+        step_xs = np.where(inside, self.next_x[tile_ys, tile_xs], np.nan)
+        step_ys = np.where(inside, self.next_y[tile_ys, tile_xs], np.nan)
+        return step_xs, step_ys
+
+class SpatialGrid:
+    """Uniform hash grid bucketing entities by the TILE_SIZE cell under their position"""
+    def __init__(self, cell_size=TILE_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.entity_cells = {}
+        self.max_extent = 0  # Largest entity size inserted, used to pad queries
+    
+    def clear(self):
+        """Remove every entity from the grid"""
+        self.cells.clear()
+        self.entity_cells.clear()
+        self.max_extent = 0
+    
+    def rebuild(self, entities):
+        """Re-bucket all entities at their current positions"""
+        self.clear()
+        for entity in entities:
+            self.insert(entity)
+    
+    def insert(self, entity):
+        """Add an entity to the cell containing its position"""
+        key = (int(entity.x // self.cell_size), int(entity.y // self.cell_size))
+        self.cells.setdefault(key, []).append(entity)
+        self.entity_cells[entity] = key
+        self.max_extent = max(self.max_extent, entity.width, entity.height)
+    
+    def remove(self, entity):
+        """Drop an entity (e.g. one that was just defeated) from the grid"""
+        key = self.entity_cells.pop(entity, None)
+        if key is not None:
+            self.cells[key].remove(entity)
+    
+    def move(self, entity):
+        """Re-bucket an entity after it has moved, if it changed cell"""
+        key = (int(entity.x // self.cell_size), int(entity.y // self.cell_size))
+        old_key = self.entity_cells.get(entity)
+        if old_key is not None and old_key != key:
+            self.cells[old_key].remove(entity)
+            self.cells.setdefault(key, []).append(entity)
+            self.entity_cells[entity] = key
+    
+    def query(self, left, top, right, bottom):
+        """Return entities in the cells that could overlap the given box"""
+        pad = self.max_extent
+        size = self.cell_size
+        min_cx = int((left - pad) // size)
+        max_cx = int((right + pad) // size)
+        min_cy = int((top - pad) // size)
+        max_cy = int((bottom + pad) // size)
+        
+        found = []
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+    
+    def entities_within(self, x, y, r):
+        """Return entities whose position lies within radius r of (x, y)"""
+        size = self.cell_size
+        r_squared = r * r
+        found = []
+        for cy in range(int((y - r) // size), int((y + r) // size) + 1):
+            for cx in range(int((x - r) // size), int((x + r) // size) + 1):
+                bucket = self.cells.get((cx, cy))
+                if bucket:
+                    for entity in bucket:
+                        dx = entity.x - x
+                        dy = entity.y - y
+                        if dx * dx + dy * dy <= r_squared:
+                            found.append(entity)
+        return found
+
+class EntityList(list):
+    """Entity list with deferred removal: kill() flags an entity, compact() drops the flagged ones in one pass"""
+    def __init__(self, entities=()):
+        super().__init__(entities)
+        self.dead_count = 0
+    
+    def kill(self, entity):
+        """Flag an entity for removal; returns False if it was already dead"""
+        if entity.dead:
+            return False
+        entity.dead = True
+        self.dead_count += 1
+        return True
+    
+    def live(self):
+        """Iterate over entities not yet killed, without copying the list"""
+        for entity in self:
+            if not entity.dead:
+                yield entity
+    
+    def compact(self):
+        """Drop killed entities, keeping the survivors in order; returns the dropped ones"""
+        if not self.dead_count:
+            return []
+        survivors = []
+        dropped = []
+        for entity in self:
+            (dropped if entity.dead else survivors).append(entity)
+        self[:] = survivors
+        self.dead_count = 0
+        return dropped
+
+def hitboxes_overlap(a, b):
+    """Axis-aligned overlap test for two (left, top, width, height) boxes"""
+    return (a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and
+            a[1] < b[1] + b[3] and b[1] < a[1] + a[3])
+
 class SpriteManager:
-    def __init__(self):
+    def __init__(self, load=True):
         self.sprites = {}
         self.sprite_path = Path("sprites")
-        self.sprite_path.mkdir(exist_ok=True)
         self.current_character = "female"  # Default character
-        self.load_sprites()
+        if load:  # Headless games never draw, so they skip the images
+            self.sprite_path.mkdir(exist_ok=True)
+            self.load_sprites()
     
     def load_sprites(self):
         """Load all sprite images from the sprites directory"""
@@ -400,7 +725,9 @@ class SpriteManager:
                 sprite_file = self.sprite_path / filename
                 if sprite_file.exists():
                     try:
-                        image = pygame.image.load(str(sprite_file)).convert_alpha()
+                        image = pygame.image.load(str(sprite_file))
+                        if pygame.display.get_surface() is not None:
+                            image = image.convert_alpha()
                         # Scale to appropriate size for our game
                         scaled_image = pygame.transform.scale(image, (30, 35))
                         self.sprites[sprite_name] = scaled_image
@@ -518,34 +845,106 @@ class SpriteManager:
         self.load_sprites()
 
 class SoundManager:
-    def __init__(self):
-        self.sounds = {}
-        self.generate_sounds()
+    STALE_TEMP_SECONDS = 60  # A .tmp this old is a crashed write, not one another instance is still making
+    
+    def __init__(self, enabled=True):
+        self.sounds = {}  # Stays empty when disabled, which makes play() a no-op
+        # Synthesized buffers from earlier launches, next to main.py whatever the working directory
+        self.cache_path = Path(__file__).resolve().parent / "sound_cache"
+        self.cache_files_used = set()
+        if enabled and pygame.mixer.get_init():
+            self.generate_sounds()
+    
+    def generator_fingerprint(self, code, seen=None):
+        """Hash input for a generator's bytecode and every SoundManager helper it reaches"""
+        if seen is None:
+            seen = set()
+        if code in seen:
+            return []
+        seen.add(code)
+        
+        parts = [code.co_code]
+        for const in code.co_consts:
+            if hasattr(const, 'co_code'):  # Nested code object, e.g. a comprehension
+                parts.extend(self.generator_fingerprint(const, seen))
+            else:
+                parts.append(repr(const).encode())
+        for name in code.co_names:
+            helper = getattr(SoundManager, name, None)
+            if hasattr(helper, '__code__'):
+                parts.extend(self.generator_fingerprint(helper.__code__, seen))
+        return parts
+    
+    def load_or_generate(self, generator, *args):
+        """Load a synthesized sound from the on-disk cache, generating and caching it on a miss"""
+        # Key on the generator, its arguments, its code and the mixer format (rate, size, channels)
+        key = hashlib.sha1(repr((generator.__name__, args, pygame.mixer.get_init())).encode())
+        for part in self.generator_fingerprint(generator.__code__):
+            key.update(part)
+        cache_file = self.cache_path / f"{generator.__name__}_{key.hexdigest()[:16]}.npy"
+        self.cache_files_used.add(cache_file.name)
+        
+        try:
+            if cache_file.exists():
+                return pygame.sndarray.make_sound(np.load(cache_file, mmap_mode='r'))
+        except (OSError, ValueError):
+            pass  # Unreadable or truncated entry - regenerate below
+        
+        sound = generator(*args)
+        try:
+            self.cache_path.mkdir(exist_ok=True)
+            temp_file = cache_file.with_suffix('.tmp')
+            with open(temp_file, 'wb') as f:
+                np.save(f, pygame.sndarray.array(sound))
+            os.replace(temp_file, cache_file)
+        except OSError:
+            pass  # Caching is best effort (e.g. read-only install)
+        return sound
+    
+    def prune_cache(self):
+        """Delete cached buffers whose key no longer matches any sound, e.g. after a generator changed"""
+        if not self.cache_path.is_dir():
+            return
+        for entry in self.cache_path.iterdir():
+            if entry.suffix not in ('.npy', '.tmp') or entry.name in self.cache_files_used:
+                continue
+            try:
+                if entry.suffix == '.tmp' and time.time() - entry.stat().st_mtime < self.STALE_TEMP_SECONDS:
+                    continue  # Another running instance may still be writing it
+                entry.unlink()
+            except OSError:
+                pass  # Best effort, like writing the cache
+    
+    def sample_times(self, duration, sample_rate=22050):
+        """Sample indices for a clip of the given duration"""
+        return np.arange(int(duration * sample_rate), dtype=np.float64)
+    
+    def make_sound(self, wave):
+        """Turn a mono float wave in [-1, 1] into a stereo pygame Sound"""
+        samples = (wave * 32767).astype(np.int16)
+        return pygame.sndarray.make_sound(np.column_stack((samples, samples)))
     
     def generate_tone(self, frequency, duration, volume=0.5, fade_out=0.1):
         """Generate a tone using numpy"""
         sample_rate = 22050
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
+        i = self.sample_times(duration, sample_rate)
+        frames = len(i)
         
         # Generate sine wave
-        for i in range(frames):
-            wave = volume * np.sin(2 * np.pi * frequency * i / sample_rate)
-            # Add some harmonics for richer sound
-            wave += volume * 0.3 * np.sin(4 * np.pi * frequency * i / sample_rate)
-            wave += volume * 0.1 * np.sin(6 * np.pi * frequency * i / sample_rate)
-            
-            # Fade out
-            if fade_out > 0 and i > frames * (1 - fade_out):
-                fade_factor = 1 - (i - frames * (1 - fade_out)) / (frames * fade_out)
-                wave *= fade_factor
-            
-            arr[i] = [wave, wave]
+        phase = 2 * np.pi * frequency * i / sample_rate
+        wave = volume * np.sin(phase)
+        # Add some harmonics for richer sound
+        wave += volume * 0.3 * np.sin(2 * phase)
+        wave += volume * 0.1 * np.sin(3 * phase)
+        
+        # Fade out
+        if fade_out > 0:
+            fade_start = frames * (1 - fade_out)
+            fading = i > fade_start
+            wave[fading] *= 1 - (i[fading] - fade_start) / (frames * fade_out)
         
         # Convert to pygame sound
-        arr = (arr * 32767).astype(np.int16)
-        sound = pygame.sndarray.make_sound(arr)
-        return sound
+        return self.make_sound(wave)
     
     def generate_noise(self, duration, volume=0.3):
         """Generate white noise"""
@@ -559,40 +958,43 @@ class SoundManager:
         """Generate all game sounds"""
         try:
             # Book throwing sounds - multiple variations
-            self.sounds['book_throw'] = self.generate_whoosh(200, 0.15)
-            self.sounds['book_throw_2'] = self.generate_whoosh(180, 0.12)
-            self.sounds['book_throw_3'] = self.generate_whoosh(220, 0.18)
+            self.sounds['book_throw'] = self.load_or_generate(self.generate_whoosh, 200, 0.15)
+            self.sounds['book_throw_2'] = self.load_or_generate(self.generate_whoosh, 180, 0.12)
+            self.sounds['book_throw_3'] = self.load_or_generate(self.generate_whoosh, 220, 0.18)
             
             # Shush sound variations
-            self.sounds['shush'] = self.generate_shush_sound()
-            self.sounds['shush_whisper'] = self.generate_whisper_sound()
+            self.sounds['shush'] = self.load_or_generate(self.generate_shush_sound)
+            self.sounds['shush_whisper'] = self.load_or_generate(self.generate_whisper_sound)
             
             # Enemy defeat sounds by type
-            self.sounds['enemy_defeat'] = self.generate_tone(523, 0.2, 0.4, 0.5)  # C5
-            self.sounds['student_defeat'] = self.generate_tone(440, 0.15, 0.3, 0.6)  # A4
-            self.sounds['animal_defeat'] = self.generate_meow_sound()
-            self.sounds['ghost_defeat'] = self.generate_ethereal_sound()
-            self.sounds['chaos_lord_defeat'] = self.generate_boss_defeat_sound()
-            self.sounds['literary_villain_defeat'] = self.generate_tone(330, 0.25, 0.4, 0.6)  # Dark academic defeat
+            self.sounds['enemy_defeat'] = self.load_or_generate(self.generate_tone, 523, 0.2, 0.4, 0.5)  # C5
+            self.sounds['student_defeat'] = self.load_or_generate(self.generate_tone, 440, 0.15, 0.3, 0.6)  # A4
+            self.sounds['animal_defeat'] = self.load_or_generate(self.generate_meow_sound)
+            self.sounds['ghost_defeat'] = self.load_or_generate(self.generate_ethereal_sound)
+            self.sounds['chaos_lord_defeat'] = self.load_or_generate(self.generate_boss_defeat_sound)
+            self.sounds['literary_villain_defeat'] = self.load_or_generate(self.generate_tone, 330, 0.25, 0.4, 0.6)  # Dark academic defeat
             
             # Power-up sounds
-            self.sounds['power_up'] = self.generate_power_up_chord()
-            self.sounds['coffee_pickup'] = self.generate_coffee_sound()
-            self.sounds['book_pickup'] = self.generate_page_flip_sound()
-            self.sounds['aura_pickup'] = self.generate_mystical_sound()
-            self.sounds['freeze_pickup'] = self.generate_clock_sound()
+            self.sounds['power_up'] = self.load_or_generate(self.generate_power_up_chord)
+            self.sounds['coffee_pickup'] = self.load_or_generate(self.generate_coffee_sound)
+            self.sounds['book_pickup'] = self.load_or_generate(self.generate_page_flip_sound)
+            self.sounds['aura_pickup'] = self.load_or_generate(self.generate_mystical_sound)
+            self.sounds['freeze_pickup'] = self.load_or_generate(self.generate_clock_sound)
             
             # Ambient and UI sounds
-            self.sounds['game_over'] = self.generate_dramatic_chord()
-            self.sounds['menu_select'] = self.generate_tone(440, 0.1, 0.3, 0.5)
-            self.sounds['noise_warning'] = self.generate_rumble()
-            self.sounds['new_high_score'] = self.generate_victory_fanfare()
-            self.sounds['player_hit'] = self.generate_tone(200, 0.3, 0.5, 0.7)  # Low hurt sound
+            self.sounds['game_over'] = self.load_or_generate(self.generate_dramatic_chord)
+            self.sounds['menu_select'] = self.load_or_generate(self.generate_tone, 440, 0.1, 0.3, 0.5)
+            self.sounds['noise_warning'] = self.load_or_generate(self.generate_rumble)
+            self.sounds['new_high_score'] = self.load_or_generate(self.generate_victory_fanfare)
+            self.sounds['player_hit'] = self.load_or_generate(self.generate_tone, 200, 0.3, 0.5, 0.7)  # Low hurt sound
             
             # Background ambience
-            self.sounds['library_ambience'] = self.generate_library_ambience()
-            self.sounds['page_turn'] = self.generate_page_turn_sound()
-            self.sounds['footsteps'] = self.generate_footstep_sound()
+            self.sounds['library_ambience'] = self.load_or_generate(self.generate_library_ambience)
+            self.sounds['page_turn'] = self.load_or_generate(self.generate_page_turn_sound)
+            self.sounds['footsteps'] = self.load_or_generate(self.generate_footstep_sound)
+            
+            # Only once every sound is loaded is it safe to call the rest of the cache stale
+            self.prune_cache()
             
         except Exception as e:
             print(f"Could not generate sounds: {e}")
@@ -604,42 +1006,32 @@ class SoundManager:
     def generate_whoosh(self, base_freq, duration):
         """Generate a whoosh sound for book throwing"""
         sample_rate = 22050
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
-        
-        for i in range(frames):
-            # Frequency sweep from high to low
-            freq = base_freq + (100 * (1 - i/frames))
-            # Volume envelope that fades
-            volume = 0.3 * (1 - i/frames) * np.sin(np.pi * i/frames)
-            
-            wave = volume * np.sin(2 * np.pi * freq * i / sample_rate)
-            # Add some noise for texture
-            noise = 0.1 * volume * np.random.uniform(-1, 1)
-            arr[i] = [wave + noise, wave + noise]
-        
-        arr = (arr * 32767).astype(np.int16)
-        return pygame.sndarray.make_sound(arr)
+        i = self.sample_times(duration, sample_rate)
+        progress = i / len(i)
+        
+        # Frequency sweep from high to low
+        freq = base_freq + (100 * (1 - progress))
+        # Volume envelope that fades
+        volume = 0.3 * (1 - progress) * np.sin(np.pi * progress)
+        
+        wave = volume * np.sin(2 * np.pi * freq * i / sample_rate)
+        # Add some noise for texture
+        noise = 0.1 * volume * np.random.uniform(-1, 1, len(i))
+        return self.make_sound(wave + noise)
     
     def generate_shush_sound(self):
         """Generate a realistic shush sound"""
-        duration = 0.4
         sample_rate = 22050
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
+        i = self.sample_times(0.4, sample_rate)
         
-        for i in range(frames):
-            # High frequency noise filtered
-            noise = np.random.uniform(-1, 1)
-            # Apply high-pass filter effect
-            filtered_noise = noise * (0.7 + 0.3 * np.sin(20 * np.pi * i / sample_rate))
-            
-            # Volume envelope
-            volume = 0.4 * np.exp(-3 * i / frames)
-            arr[i] = [filtered_noise * volume, filtered_noise * volume]
+        # High frequency noise filtered
+        noise = np.random.uniform(-1, 1, len(i))
+        # Apply high-pass filter effect
+        filtered_noise = noise * (0.7 + 0.3 * np.sin(20 * np.pi * i / sample_rate))
         
-        arr = (arr * 32767).astype(np.int16)
-        return pygame.sndarray.make_sound(arr)
+        # Volume envelope
+        volume = 0.4 * np.exp(-3 * i / len(i))
+        return self.make_sound(filtered_noise * volume)
     
     def generate_whisper_sound(self):
         """Generate a soft whisper sound"""
@@ -647,75 +1039,56 @@ class SoundManager:
     
     def generate_meow_sound(self):
         """Generate a cat meow sound"""
-        duration = 0.3
         sample_rate = 22050
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
+        i = self.sample_times(0.3, sample_rate)
+        frames = len(i)
         
-        for i in range(frames):
-            # Two-tone meow: starts high, goes low
-            if i < frames // 2:
-                freq = 800 + 200 * np.sin(10 * np.pi * i / frames)
-            else:
-                freq = 400 + 100 * np.sin(5 * np.pi * i / frames)
-            
-            volume = 0.3 * np.sin(np.pi * i / frames)
-            wave = volume * np.sin(2 * np.pi * freq * i / sample_rate)
-            arr[i] = [wave, wave]
+        # Two-tone meow: starts high, goes low
+        freq = np.where(i < frames // 2,
+                        800 + 200 * np.sin(10 * np.pi * i / frames),
+                        400 + 100 * np.sin(5 * np.pi * i / frames))
         
-        arr = (arr * 32767).astype(np.int16)
-        return pygame.sndarray.make_sound(arr)
+        volume = 0.3 * np.sin(np.pi * i / frames)
+        return self.make_sound(volume * np.sin(2 * np.pi * freq * i / sample_rate))
     
     def generate_ethereal_sound(self):
         """Generate an ethereal ghost sound"""
-        duration = 0.4
         sample_rate = 22050
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
-        
-        for i in range(frames):
-            # Multiple overlapping sine waves for ethereal effect
-            freq1 = 220 + 50 * np.sin(3 * np.pi * i / frames)
-            freq2 = 440 + 30 * np.sin(5 * np.pi * i / frames)
-            freq3 = 880 + 20 * np.sin(7 * np.pi * i / frames)
-            
-            volume = 0.2 * (1 - i / frames)
-            wave = volume * (np.sin(2 * np.pi * freq1 * i / sample_rate) +
-                           0.5 * np.sin(2 * np.pi * freq2 * i / sample_rate) +
-                           0.25 * np.sin(2 * np.pi * freq3 * i / sample_rate))
-            arr[i] = [wave, wave]
-        
-        arr = (arr * 32767).astype(np.int16)
-        return pygame.sndarray.make_sound(arr)
+        i = self.sample_times(0.4, sample_rate)
+        progress = i / len(i)
+        
+        # Multiple overlapping sine waves for ethereal effect
+        freq1 = 220 + 50 * np.sin(3 * np.pi * progress)
+        freq2 = 440 + 30 * np.sin(5 * np.pi * progress)
+        freq3 = 880 + 20 * np.sin(7 * np.pi * progress)
+        
+        volume = 0.2 * (1 - progress)
+        wave = volume * (np.sin(2 * np.pi * freq1 * i / sample_rate) +
+                         0.5 * np.sin(2 * np.pi * freq2 * i / sample_rate) +
+                         0.25 * np.sin(2 * np.pi * freq3 * i / sample_rate))
+        return self.make_sound(wave)
     
     def generate_boss_defeat_sound(self):
         """Generate a dramatic boss defeat sound"""
-        duration = 0.8
         sample_rate = 22050
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
+        i = self.sample_times(0.8, sample_rate)
         
         # Dramatic chord progression
         chord_freqs = [130.81, 164.81, 196.00, 261.63]  # C3, E3, G3, C4
         
-        for i in range(frames):
-            volume = 0.4 * (1 - (i / frames)**2)  # Quadratic fade
-            wave = 0
-            for freq in chord_freqs:
-                wave += (1/len(chord_freqs)) * np.sin(2 * np.pi * freq * i / sample_rate)
-            
-            wave *= volume
-            arr[i] = [wave, wave]
+        volume = 0.4 * (1 - (i / len(i))**2)  # Quadratic fade
+        wave = np.zeros(len(i))
+        for freq in chord_freqs:
+            wave += (1/len(chord_freqs)) * np.sin(2 * np.pi * freq * i / sample_rate)
         
-        arr = (arr * 32767).astype(np.int16)
-        return pygame.sndarray.make_sound(arr)
+        return self.make_sound(wave * volume)
     
     def generate_power_up_chord(self):
         """Generate an ascending power-up chord"""
-        duration = 0.5
         sample_rate = 22050
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
+        i = self.sample_times(0.5, sample_rate)
+        frames = len(i)
+        wave = np.zeros(frames)
         
         # C major arpeggio
         notes = [261.63, 329.63, 392.00, 523.25]  # C, E, G, C
@@ -725,15 +1098,12 @@ class SoundManager:
             start_frame = note_idx * note_duration
             end_frame = min(start_frame + note_duration + note_duration//2, frames)
             
-            for i in range(start_frame, end_frame):
-                local_i = i - start_frame
-                local_duration = end_frame - start_frame
-                volume = 0.3 * np.sin(np.pi * local_i / local_duration)
-                wave = volume * np.sin(2 * np.pi * freq * i / sample_rate)
-                arr[i] += [wave, wave]
+            # Each note overlaps the next by half a note
+            note_i = i[start_frame:end_frame]
+            volume = 0.3 * np.sin(np.pi * (note_i - start_frame) / (end_frame - start_frame))
+            wave[start_frame:end_frame] += volume * np.sin(2 * np.pi * freq * note_i / sample_rate)
         
-        arr = (arr * 32767).astype(np.int16)
-        return pygame.sndarray.make_sound(arr)
+        return self.make_sound(wave)
     
     def generate_coffee_sound(self):
         """Generate a coffee percolating sound"""
@@ -749,19 +1119,16 @@ class SoundManager:
     
     def generate_clock_sound(self):
         """Generate a clock ticking sound"""
-        duration = 0.3
         sample_rate = 22050
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
+        i = self.sample_times(0.3, sample_rate)
+        wave = np.zeros(len(i))
         
         # Sharp tick sound
-        for i in range(min(frames, 1000)):  # Very short duration
-            volume = 0.4 * np.exp(-5 * i / 1000)
-            wave = volume * np.sin(2 * np.pi * 1000 * i / sample_rate)
-            arr[i] = [wave, wave]
+        tick = i[:1000]  # Very short duration
+        volume = 0.4 * np.exp(-5 * tick / 1000)
+        wave[:len(tick)] = volume * np.sin(2 * np.pi * 1000 * tick / sample_rate)
         
-        arr = (arr * 32767).astype(np.int16)
-        return pygame.sndarray.make_sound(arr)
+        return self.make_sound(wave)
     
     def generate_dramatic_chord(self):
         """Generate a dramatic game over chord"""
@@ -769,20 +1136,14 @@ class SoundManager:
     
     def generate_rumble(self):
         """Generate a low rumble for noise warning"""
-        duration = 0.6
         sample_rate = 22050
-        frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2))
-        
-        for i in range(frames):
-            # Low frequency rumble with slight variation
-            freq = 40 + 20 * np.sin(2 * np.pi * i / frames)
-            volume = 0.3 * np.sin(np.pi * i / frames)
-            wave = volume * np.sin(2 * np.pi * freq * i / sample_rate)
-            arr[i] = [wave, wave]
+        i = self.sample_times(0.6, sample_rate)
+        progress = i / len(i)
         
-        arr = (arr * 32767).astype(np.int16)
-        return pygame.sndarray.make_sound(arr)
+        # Low frequency rumble with slight variation
+        freq = 40 + 20 * np.sin(2 * np.pi * progress)
+        volume = 0.3 * np.sin(np.pi * progress)
+        return self.make_sound(volume * np.sin(2 * np.pi * freq * i / sample_rate))
     
     def generate_victory_fanfare(self):
         """Generate a victory fanfare for high scores"""
@@ -817,14 +1178,14 @@ class SoundManager:
             self.play(base_name)
 
 class HighScoreManager:
-    def __init__(self):
-        self.high_scores_file = "high_scores.json"
+    def __init__(self, high_scores_file="high_scores.json"):
+        self.high_scores_file = high_scores_file  # None keeps scores in memory only
         self.high_scores = self.load_high_scores()
     
     def load_high_scores(self):
         """Load high scores from file"""
         try:
-            if os.path.exists(self.high_scores_file):
+            if self.high_scores_file and os.path.exists(self.high_scores_file):
                 with open(self.high_scores_file, 'r') as f:
                     return json.load(f)
             return []
@@ -833,6 +1194,8 @@ class HighScoreManager:
     
     def save_high_scores(self):
         """Save high scores to file"""
+        if not self.high_scores_file:
+            return
         try:
             with open(self.high_scores_file, 'w') as f:
                 json.dump(self.high_scores, f, indent=2)
@@ -851,11 +1214,286 @@ class HighScoreManager:
         """Get the high scores list"""
         return self.high_scores
 
-class Game:
+class CachedFont:
+    """Default-font wrapper whose plain antialiased renders come from the shared TextCache"""
+    def __init__(self, text_cache, size):
+        self.text_cache = text_cache
+        self.size_px = size
+        self.font = pygame.font.Font(None, size)
+    
+    def render(self, text, antialias, color, background=None, cache=True):
+        """Drop-in for pygame.font.Font.render; pass cache=False for colours that change every frame"""
+        if antialias and background is None:
+            return self.text_cache.render(text, self.size_px, color, cache=cache)
+        return self.font.render(text, antialias, color, background)
+    
+    def __getattr__(self, name):
+        # size(), get_linesize() and friends go straight to the real font
+        return getattr(self.font, name)
+
+class TextCache:
+    """Font registry keyed by size plus a bounded LRU of rendered text surfaces"""
+    def __init__(self, max_entries=256):
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+    
+    def get_font(self, size):
+        """Load the default font at this size once and reuse it"""
+        font = self.fonts.get(size)
+        if font is None:
+            font = CachedFont(self, size)
+            self.fonts[size] = font
+        return font
+    
+    def render(self, text, size, color, shadow=None, cache=True):
+        """Rendered text; with a shadow (dx, dy) offset a black copy is composited underneath"""
+        if not cache:
+            # Animated colours would only churn the LRU, so render them straight through
+            surface = self.get_font(size).font.render(text, True, color)
+            return self.composite_shadow(surface, color, shadow) if shadow else surface
+        
+        key = (text, size, tuple(color), shadow)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        
+        self.misses += 1
+        surface = self.get_font(size).font.render(text, True, color)
+        if shadow:
+            surface = self.composite_shadow(surface, color, shadow)
+        
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)  # Evict the least recently used
+        return surface
+    
+    def composite_shadow(self, surface, color, shadow):
+        """Merge text over its black shadow so one blit matches drawing shadow then text"""
+        dx, dy = shadow
+        width, height = surface.get_size()
+        glyph_alpha = pygame.surfarray.array_alpha(surface) / 255.0
+        
+        # The shadow shares the glyph coverage, just offset
+        text_alpha = np.zeros((width + dx, height + dy))
+        shadow_alpha = np.zeros((width + dx, height + dy))
+        text_alpha[:width, :height] = glyph_alpha
+        shadow_alpha[dx:, dy:] = glyph_alpha
+        alpha = text_alpha + shadow_alpha * (1 - text_alpha)
+        
+        # Straight (non-premultiplied) colour: text colour fading to black where only shadow shows
+        text_share = np.divide(text_alpha, alpha, out=np.zeros_like(alpha), where=alpha > 0)
+        composite = pygame.Surface((width + dx, height + dy), pygame.SRCALPHA)
+        pygame.surfarray.pixels3d(composite)[...] = (np.array(tuple(color)[:3]) * text_share[..., None]).round()
+        pygame.surfarray.pixels_alpha(composite)[...] = (alpha * 255).round()
+        return composite
+
+@dataclass(frozen=True)
+class TickInput:
+    """Player input consumed by one simulation tick"""
+    held: frozenset = frozenset()  # Bound actions held down, e.g. 'move_up'
+    presses: tuple = ()            # One-shot actions pressed since the previous tick ('shoot', 'shush')
+    clicks: tuple = ()             # Left-click positions since the previous tick
+
+NO_INPUT = TickInput()
+
+class KeyboardInput:
+    """Live input: held keys are polled every tick, presses and clicks queue up from pygame events"""
     def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Library Defender 📚")
+        self.presses = []
+        self.clicks = []
+    
+    def press(self, action):
+        self.presses.append(action)
+    
+    def click(self, pos):
+        self.clicks.append(pos)
+    
+    def next_tick(self, game):
+        pressed = pygame.key.get_pressed()
+        held = frozenset(action for action, key in game.key_bindings.items() if pressed[key])
+        tick_input = TickInput(held, tuple(self.presses), tuple(self.clicks))
+        self.presses.clear()
+        self.clicks.clear()
+        return tick_input
+
+class ScriptedInput:
+    """Feeds a prepared sequence of TickInputs, one per tick, then no input once it runs out"""
+    def __init__(self, ticks=()):
+        self.ticks = iter(ticks)
+    
+    def press(self, action):
+        pass  # Scripted runs ignore the real keyboard
+    
+    def click(self, pos):
+        pass
+    
+    def next_tick(self, game):
+        return next(self.ticks, NO_INPUT)
+
+class PolicyInput:
+    """Asks a policy, any callable taking the game, for each tick's TickInput; used by bots and batch runs"""
+    def __init__(self, policy):
+        self.policy = policy
+    
+    def press(self, action):
+        pass
+    
+    def click(self, pos):
+        pass
+    
+    def next_tick(self, game):
+        return self.policy(game)
+
+class InputRecording:
+    """One run's seed, settings and per-tick input, compact enough to keep as a repeatable workload"""
+    VERSION = 1
+    HELD_ACTIONS = ('move_up', 'move_down', 'move_left', 'move_right')  # Only movement is read from held keys
+    
+    def __init__(self, settings):
+        self.settings = settings  # Seed and options that restart the run exactly, see Game.run_settings
+        self.held = []            # [bitmask of HELD_ACTIONS, ticks] runs
+        self.presses = []         # [tick, action]
+        self.clicks = []          # [tick, x, y]
+        self.ticks = 0
+        self.result = None        # How the run ended, to check replays against
+    
+    def append(self, tick_input):
+        mask = 0
+        for bit, action in enumerate(self.HELD_ACTIONS):
+            if action in tick_input.held:
+                mask |= 1 << bit
+        if self.held and self.held[-1][0] == mask:
+            self.held[-1][1] += 1
+        else:
+            self.held.append([mask, 1])
+        for action in tick_input.presses:
+            self.presses.append([self.ticks, action])
+        for x, y in tick_input.clicks:
+            self.clicks.append([self.ticks, x, y])
+        self.ticks += 1
+    
+    def inputs(self):
+        """Yield the recorded TickInputs in order"""
+        presses = {}
+        for tick, action in self.presses:
+            presses.setdefault(tick, []).append(action)
+        clicks = {}
+        for tick, x, y in self.clicks:
+            clicks.setdefault(tick, []).append((x, y))
+        held_sets = [frozenset(action for bit, action in enumerate(self.HELD_ACTIONS) if mask >> bit & 1)
+                     for mask in range(1 << len(self.HELD_ACTIONS))]
+        tick = 0
+        for mask, count in self.held:
+            for _ in range(count):
+                yield TickInput(held_sets[mask], tuple(presses.get(tick, ())), tuple(clicks.get(tick, ())))
+                tick += 1
+    
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump({
+                'version': self.VERSION,
+                'settings': self.settings,
+                'ticks': self.ticks,
+                'held': self.held,
+                'presses': self.presses,
+                'clicks': self.clicks,
+                'result': self.result,
+            }, f, separators=(',', ':'))
+    
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if data.get('version') != cls.VERSION:
+            raise ValueError(f"Unsupported recording version: {data.get('version')}")
+        recording = cls(data['settings'])
+        recording.held = data['held']
+        recording.presses = data['presses']
+        recording.clicks = data['clicks']
+        recording.ticks = data['ticks']
+        recording.result = data['result']
+        return recording
+
+class RunRandom:
+    """Separate seeded random streams for one run, so drawing or sound can never shift what happens in play"""
+    def __init__(self, seed):
+        self.seed = seed
+        self.maze = random.Random(f"{seed}:maze")      # Map layout
+        self.spawn = random.Random(f"{seed}:spawn")    # Monster types, stats, spawn points and teleports, power-ups
+        self.combat = random.Random(f"{seed}:combat")  # Thrown books and their special effects
+        self.effects = np.random.default_rng(seed)     # Particles
+
+class SimClock:
+    """Fixed-timestep game time: real frame time fills an accumulator that is drained in TICK_MS ticks"""
+    def __init__(self, tick_ms=TICK_MS, max_ticks_per_frame=5):
+        self.tick_ms = tick_ms
+        self.max_ticks_per_frame = max_ticks_per_frame  # Beyond this a slow frame drops time instead of spiralling
+        self.ticks = 0
+        self.accumulator = 0.0
+    
+    def now(self):
+        """Simulated milliseconds since the clock started; only advances while the game is played"""
+        return self.ticks * self.tick_ms
+    
+    def step(self):
+        """Advance by one fixed tick"""
+        self.ticks += 1
+    
+    def restart(self):
+        """Start counting game time from zero again; pending real time stays in the accumulator"""
+        self.ticks = 0
+    
+    def advance(self, elapsed_ms):
+        """Add real elapsed time and return how many ticks are due"""
+        self.accumulator += elapsed_ms
+        due = int(self.accumulator // self.tick_ms)
+        if due > self.max_ticks_per_frame:
+            due = self.max_ticks_per_frame
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= due * self.tick_ms
+        return due
+    
+    def alpha(self):
+        """How far real time has run into the next tick, from 0 to 1, for render interpolation"""
+        return min(self.accumulator / self.tick_ms, 1.0)
+
+class Game:
+    # Screen regions draw_ui repaints every frame, refreshed as a whole in dirty-rect mode
+    UI_REGIONS = [
+        pygame.Rect(0, 0, 340, 40),                             # Score
+        pygame.Rect(0, 45, 200, 120),                           # Power-up status
+        pygame.Rect(SCREEN_WIDTH - 280, 0, 280, 125),           # Battle status and collection
+        pygame.Rect(0, SCREEN_HEIGHT - 32, 450, 32),            # Controls line
+    ]
+    # Entities that moved further than this in one tick teleported or respawned and are drawn without interpolation
+    MAX_INTERPOLATION_STEP = TILE_SIZE * 2
+    
+    def __init__(self, monster_engine=False, dirty_rects=False, archetypes=None, render_fps=RENDER_FPS,
+                 headless=False, input_source=None, seed=None, record_path=None):
+        # Headless games never open a window, draw or play sounds, and take input from input_source only
+        self.headless = headless
+        if headless:
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Library Defender 📚")
+        if input_source is None:
+            input_source = ScriptedInput() if headless else KeyboardInput()
+        self.input_source = input_source
         self.clock = pygame.time.Clock()
+        self.sim_clock = SimClock()  # Gameplay time, advanced in fixed ticks by update() and restarted every run
+        self.seed = seed  # Seed for every run, or None to pick a fresh one per run
+        self.rng = None   # RunRandom streams of the current run
+        self.record_path = record_path  # Save each run's inputs here for replaying
+        self.recording = None
+        self.render_fps = render_fps
+        self.previous_positions = {}  # Entity -> (x, y) at the start of the latest tick
         self.running = True
         
         # Game state
@@ -867,10 +1505,11 @@ class Game:
         self.menu_selection = 0  # Current menu selection
         
         # Managers
-        self.sound_manager = SoundManager()
-        self.high_score_manager = HighScoreManager()
+        self.sound_manager = SoundManager(enabled=not headless)
+        self.high_score_manager = HighScoreManager(None if headless else "high_scores.json")
         self.library_maze = LibraryMaze()
-        self.sprite_manager = SpriteManager()
+        self.sprite_manager = SpriteManager(load=not headless)
+        self.text_cache = TextCache()
         
         # Key bindings (customizable)
         self.key_bindings = {
@@ -888,14 +1527,14 @@ class Game:
         
         # Initialize game objects (will be properly set in reset_game)
         self.player = None
-        self.enemies = []
-        self.books = []
+        self.enemies = EntityList()
+        self.books = EntityList()
         
         # Literary features
         self.collected_books = set()  # Track unique books found
         self.discovered_authors = set()  # Track authors encountered
         self.current_quote = ""
-        self.quote_timer = 0
+        self.quote_timer = NEVER
         self.quote_author = ""
         self.reading_level = 1  # Bibliophile progression
         
@@ -904,54 +1543,80 @@ class Game:
         self.current_chapter = 1
         self.chapter_objective = ""
         self.chapter_progress = 0
-        self.chapter_timer = 0
+        self.chapter_timer = NEVER
         self.is_story_mode = False
+        self.endless_map_type = "default"  # Map used outside story mode
         
         # Noise meter
         self.noise_level = 0
         self.max_noise = 100
         
         # Enemy spawn timer
-        self.enemy_spawn_timer = 0
+        self.enemy_spawn_timer = NEVER
         self.enemy_spawn_delay = 1500  # milliseconds (will be adjusted by difficulty)
+        self.spawn_director = SpawnDirector(self.enemy_spawn_delay)
+        self.next_wave = []  # Monster types for the next wave, planned ahead
         
         # Book throwing cooldown
-        self.book_cooldown = 0
+        self.book_cooldown = NEVER
         self.book_cooldown_delay = 300  # milliseconds
         
         # Shush attack cooldown
-        self.shush_cooldown = 0
+        self.shush_cooldown = NEVER
         self.shush_cooldown_delay = 1000  # milliseconds
-        self.shush_effect_timer = 0
+        self.shush_effect_timer = NEVER
         self.shush_effect_duration = 500  # milliseconds
         
         # Power-ups
-        self.power_ups = []
-        self.power_up_spawn_timer = 0
+        self.power_ups = EntityList()
+        self.power_up_spawn_timer = NEVER
         self.power_up_spawn_delay = 10000  # 10 seconds
         
         # Player power-up effects
-        self.speed_boost_timer = 0
+        self.speed_boost_timer = NEVER
         self.speed_boost_duration = 5000  # 5 seconds
-        self.mega_book_timer = 0
+        self.mega_book_timer = NEVER
         self.mega_book_duration = 3000  # 3 seconds
-        self.silence_aura_timer = 0
+        self.silence_aura_timer = NEVER
         self.silence_aura_duration = 8000  # 8 seconds
-        self.time_freeze_timer = 0
+        self.time_freeze_timer = NEVER
         self.time_freeze_duration = 4000  # 4 seconds
         
         # New power-up effects
-        self.shield_timer = 0
+        self.shield_timer = NEVER
         self.shield_duration = 5000  # 5 seconds
-        self.multi_shot_timer = 0
+        self.multi_shot_timer = NEVER
         self.multi_shot_duration = 4000  # 4 seconds
-        self.magnet_timer = 0
+        self.magnet_timer = NEVER
         self.magnet_duration = 6000  # 6 seconds
-        self.freeze_time_timer = 0
+        self.freeze_time_timer = NEVER
         self.freeze_time_duration = 3000  # 3 seconds
         
         # Particle effects
-        self.particles = []
+        self.particles = ParticleSystem()
+        
+        # Optional batched NumPy movement for large enemy counts
+        self.use_monster_engine = monster_engine
+        self.monster_engine = None
+        self.flow_field = None
+        
+        # Monster types and the pool spawns draw from (rebuilt with each game)
+        self.archetypes = archetypes if archetypes is not None else MONSTER_ARCHETYPES
+        self.monster_pool = None
+        
+        # Spatial indexes for collisions and area effects (refreshed every tick)
+        self.enemy_grid = SpatialGrid()
+        self.power_up_grid = SpatialGrid()
+        
+        # Pre-rendered library background (rebuilt whenever the maze changes)
+        self.background_surface = None
+        self.background_maze = None
+        
+        # Dirty-rect rendering: only repaint what moved (None forces a full frame)
+        self.use_dirty_rects = dirty_rects
+        self.last_draw_rects = None
+        self.shush_effect_rect = None
+        self.quote_rect = None
         
         # Settings mode
         self.setting_key = None  # Which key is being rebound
@@ -961,34 +1626,60 @@ class Game:
     
     def reset_game(self):
         """Reset game to initial state"""
+        self.last_draw_rects = None
+        # A run is fixed by its seed and inputs: fresh clock and random streams
+        self.finish_recording()  # Keep the run being left, if it was played at all
+        self.sim_clock.restart()
+        self.rng = RunRandom(self.seed if self.seed is not None else random.randrange(2 ** 32))
+        self.particles.rng = self.rng.effects
+        
         # Create appropriate map for story mode
         if self.is_story_mode and self.current_chapter in STORY_CHAPTERS:
             chapter_data = STORY_CHAPTERS[self.current_chapter]
-            self.library_maze = LibraryMaze(chapter_data["map_type"])
+            self.library_maze = LibraryMaze(chapter_data["map_type"], self.rng.maze)
             self.chapter_objective = chapter_data["objective"]
             self.chapter_progress = 0
-            self.chapter_timer = pygame.time.get_ticks()
+            self.chapter_timer = self.sim_clock.now()
         else:
-            self.library_maze = LibraryMaze("default")
+            self.library_maze = LibraryMaze(self.endless_map_type, self.rng.maze)
+        if not self.headless:
+            self.bake_library_background()
         
         self.player = Librarian(self.library_maze, self.sprite_manager)
-        self.enemies = []
-        self.books = []
-        self.power_ups = []
-        self.particles = []
+        self.enemies = EntityList()
+        self.flow_field = FlowField(self.library_maze)
+        if self.use_monster_engine:
+            self.monster_engine = MonsterEngine(self.library_maze, self.flow_field)
+        self.monster_pool = MonsterPool(self.archetypes, self.monster_engine)
+        if self.spawn_director.archetypes is not self.archetypes:
+            # Spawn weights come from the archetype table, so a new table needs new bands
+            self.spawn_director = SpawnDirector(self.enemy_spawn_delay, self.archetypes)
+        self.books = EntityList()
+        self.power_ups = EntityList()
+        self.particles.clear()
+        self.kills_by_type = {}  # monster_type -> enemies defeated this run
         
         # Reset timers
         self.noise_level = 0
-        self.enemy_spawn_timer = 0
-        self.power_up_spawn_timer = 0
-        self.book_cooldown = 0
-        self.shush_cooldown = 0
-        self.shush_effect_timer = 0
+        self.enemy_spawn_timer = NEVER
+        self.power_up_spawn_timer = NEVER
+        self.book_cooldown = NEVER
+        self.shush_cooldown = NEVER
+        self.shush_effect_timer = NEVER
         self.wave_number = 1  # Start with wave 1
-        self.speed_boost_timer = 0
-        self.mega_book_timer = 0
-        self.silence_aura_timer = 0
-        self.time_freeze_timer = 0
+        self.previous_positions = {}
+        self.next_wave = self.spawn_director.plan_wave(2, self.selected_difficulty, self.run_time(), self.rng.spawn)
+        self.speed_boost_timer = NEVER
+        self.mega_book_timer = NEVER
+        self.silence_aura_timer = NEVER
+        self.time_freeze_timer = NEVER
+        self.shield_timer = NEVER
+        self.multi_shot_timer = NEVER
+        self.magnet_timer = NEVER
+        self.freeze_time_timer = NEVER
+        
+        if self.record_path:
+            self.recording = InputRecording(self.run_settings())
         
     def handle_events(self):
         for event in pygame.event.get():
@@ -1183,21 +1874,11 @@ class Game:
                 self.state = MENU
     
     def handle_playing_events(self, event):
+        # Attacks are queued and fire on the next simulation tick
         if event.key == self.key_bindings['shush']:
-            # Shush attack (with cooldown)
-            current_time = pygame.time.get_ticks()
-            if current_time - self.shush_cooldown > self.shush_cooldown_delay:
-                self.shush_attack()
-                self.shush_cooldown = current_time
-                self.shush_effect_timer = current_time
-                self.sound_manager.play('shush')
+            self.input_source.press('shush')
         elif event.key == self.key_bindings['shoot']:
-            # Keyboard shooting (with cooldown)
-            current_time = pygame.time.get_ticks()
-            if current_time - self.book_cooldown > self.book_cooldown_delay:
-                self.throw_book_keyboard()
-                self.book_cooldown = current_time
-                self.sound_manager.play_random_variant('book_throw', 3)
+            self.input_source.press('shoot')
         elif event.key == pygame.K_ESCAPE:
             # Go to settings
             self.state = SETTINGS
@@ -1205,10 +1886,30 @@ class Game:
     
     def handle_playing_mouse(self, event):
         if event.button == 1:  # Left mouse button
+            self.input_source.click(event.pos)
+    
+    def apply_input(self, tick_input):
+        """Fire the attacks pressed or clicked since the previous tick, subject to their cooldowns"""
+        for action in tick_input.presses:
+            current_time = self.sim_clock.now()
+            if action == 'shush':
+                # Shush attack (with cooldown)
+                if current_time - self.shush_cooldown > self.shush_cooldown_delay:
+                    self.shush_attack()
+                    self.shush_cooldown = current_time
+                    self.shush_effect_timer = current_time
+                    self.sound_manager.play('shush')
+            elif action == 'shoot':
+                # Keyboard shooting (with cooldown)
+                if current_time - self.book_cooldown > self.book_cooldown_delay:
+                    self.throw_book_keyboard()
+                    self.book_cooldown = current_time
+                    self.sound_manager.play_random_variant('book_throw', 3)
+        for pos in tick_input.clicks:
             # Throw book towards mouse position (with cooldown)
-            current_time = pygame.time.get_ticks()
+            current_time = self.sim_clock.now()
             if current_time - self.book_cooldown > self.book_cooldown_delay:
-                self.throw_book_mouse(event.pos)
+                self.throw_book_mouse(pos)
                 self.book_cooldown = current_time
                 self.sound_manager.play_random_variant('book_throw', 3)
     
@@ -1247,14 +1948,118 @@ class Game:
             self.setting_key = None
             self.sound_manager.play('menu_select')
     
+    def run_time(self):
+        """Simulated milliseconds since the current run began"""
+        return self.sim_clock.now()
+    
+    def run_settings(self):
+        """Everything besides the inputs that a replay needs to restart this run exactly"""
+        custom = self.archetypes is not MONSTER_ARCHETYPES
+        return {
+            'seed': self.rng.seed,
+            'difficulty': self.selected_difficulty,
+            'story_mode': self.is_story_mode,
+            'chapter': self.current_chapter,
+            'map_type': self.endless_map_type,
+            'monster_engine': self.use_monster_engine,
+            'archetypes': {name: asdict(row) for name, row in self.archetypes.items()} if custom else None,
+        }
+    
+    def run_result(self):
+        """How the current run stands, with a digest of every live position to catch any drift"""
+        positions = [(self.player.x, self.player.y)]
+        positions.extend((enemy.monster_type, enemy.x, enemy.y, enemy.health) for enemy in self.enemies.live())
+        return {
+            'ticks': self.sim_clock.ticks,
+            'score': self.score,
+            'wave': self.wave_number,
+            'game_over': self.state == GAME_OVER,
+            'digest': hashlib.sha1(repr(positions).encode()).hexdigest()[:16],
+        }
+    
+    def finish_recording(self):
+        """Save the run recorded so far, if recording"""
+        if self.recording is None or not self.recording.ticks:
+            return
+        self.recording.result = self.run_result()
+        self.recording.save(self.record_path)
+        self.recording = None
+    
+    def start_replay(self, recording):
+        """Restart a recorded run with its settings, driven by its recorded inputs"""
+        settings = recording.settings
+        self.seed = settings['seed']
+        self.selected_difficulty = settings['difficulty']
+        self.is_story_mode = settings['story_mode']
+        self.current_chapter = settings['chapter']
+        self.endless_map_type = settings['map_type']
+        self.use_monster_engine = settings['monster_engine']
+        self.monster_engine = None
+        archetypes = settings['archetypes']
+        self.archetypes = monster_archetypes_from_rows(archetypes) if archetypes else MONSTER_ARCHETYPES
+        self.input_source = ScriptedInput(recording.inputs())
+        self.state = PLAYING
+        self.restart_game()
+    
     def update(self):
+        """Advance the game by one fixed simulation tick"""
         if self.state != PLAYING or not self.player:
             return
-            
+        
+        if not self.headless:
+            self.snapshot_positions()
+        tick_input = self.input_source.next_tick(self)
+        if self.recording is not None:
+            self.recording.append(tick_input)
+        self.apply_input(tick_input)
+        self.sim_clock.step()
+        self.update_world(tick_input.held)
+        
+        # Drop everything killed this tick in one linear pass; defeated monsters go back to the pool
+        self.monster_pool.release(self.enemies.compact())
+        self.books.compact()
+        self.power_ups.compact()
+        
+        # Check win condition - all monsters killed
+        if self.state == PLAYING and len(self.enemies) == 0 and len(self.books) == 0:
+            # All monsters defeated! Spawn next wave or end game
+            self.spawn_next_wave()
+        
+        if self.state != PLAYING:
+            self.finish_recording()
+    
+    def snapshot_positions(self):
+        """Remember where the player and every entity stood before this tick"""
+        previous = {self.player: (self.player.x, self.player.y)}
+        for group in (self.enemies, self.books, self.power_ups):
+            for entity in group:
+                previous[entity] = (entity.x, entity.y)
+        self.previous_positions = previous
+    
+    def interpolate_positions(self, alpha):
+        """Move entities back to where they were alpha of the way through the last tick; returns their tick positions"""
+        previous = self.previous_positions
+        limit = self.MAX_INTERPOLATION_STEP
+        moved = []
+        for entity in (self.player, *self.enemies, *self.books, *self.power_ups):
+            start = previous.get(entity)
+            if start is None:
+                continue  # Spawned this tick
+            x, y = entity.x, entity.y
+            dx = x - start[0]
+            dy = y - start[1]
+            if (dx == 0 and dy == 0) or abs(dx) + abs(dy) > limit:
+                continue
+            moved.append((entity, x, y))
+            entity.x = start[0] + dx * alpha
+            entity.y = start[1] + dy * alpha
+        return moved
+    
+    def update_world(self, held):
+        """Advance the player, effects, enemies, books and power-ups by one tick"""
         # Update player and track movement direction for keyboard shooting
-        keys = pygame.key.get_pressed()
         old_x, old_y = self.player.x, self.player.y
-        self.player.update(self.key_bindings)
+        self.player.update(held)
         
         # Track last movement direction for keyboard shooting
         if self.player.x != old_x or self.player.y != old_y:
@@ -1267,51 +2072,39 @@ class Game:
             elif self.player.y < old_y:
                 self.last_move_direction = {'x': 0, 'y': -1}  # Up
         
+        # Refresh the spatial indexes used by area effects this tick
+        self.enemy_grid.rebuild(self.enemies)
+        self.power_up_grid.rebuild(self.power_ups)
+        
         # Check power-up effects
-        current_time = pygame.time.get_ticks()
+        current_time = self.sim_clock.now()
         if current_time - self.speed_boost_timer > self.speed_boost_duration:
             self.player.speed = 5  # Reset to normal speed
         
         # Handle magnet effect - automatically collect nearby power-ups
         if current_time - self.magnet_timer < self.magnet_duration:
-            for power_up in self.power_ups[:]:
-                distance = math.sqrt((power_up.x - self.player.x)**2 + (power_up.y - self.player.y)**2)
-                if distance <= 100:  # Magnet range
-                    # Move power-up toward player
-                    dx = self.player.x - power_up.x
-                    dy = self.player.y - power_up.y
-                    dist = math.sqrt(dx*dx + dy*dy)
-                    if dist > 0:
-                        power_up.x += (dx / dist) * 5
-                        power_up.y += (dy / dist) * 5
+            for power_up in self.power_up_grid.entities_within(self.player.x, self.player.y, 100):  # Magnet range
+                # Move power-up toward player
+                dx = self.player.x - power_up.x
+                dy = self.player.y - power_up.y
+                dist = math.sqrt(dx*dx + dy*dy)
+                if dist > 0:
+                    power_up.x += (dx / dist) * 5
+                    power_up.y += (dy / dist) * 5
         
         # Silence aura effect - automatically damages nearby enemies
         if current_time - self.silence_aura_timer < self.silence_aura_duration:
-            for enemy in self.enemies[:]:
-                distance = math.sqrt((enemy.x - self.player.x)**2 + (enemy.y - self.player.y)**2)
-                if distance <= 60:  # Smaller than shush range
-                    enemy.health -= 1
-                    if enemy.health <= 0:
-                        self.create_particles(enemy.x, enemy.y, enemy.color)
-                        if enemy in self.enemies:  # Safety check
-                            self.enemies.remove(enemy)
-                        score_bonus = 20 if enemy.monster_type == "chaos_lord" else 10
-                        self.score += score_bonus
+            for enemy in self.enemy_grid.entities_within(self.player.x, self.player.y, 60):  # Smaller than shush range
+                enemy.health -= 1
+                if enemy.health <= 0:
+                    self.create_particles(enemy.x, enemy.y, enemy.color)
+                    self.remove_enemy(enemy)
+                    score_bonus = 20 if enemy.monster_type == "chaos_lord" else 10
+                    self.score += score_bonus
         
         # Spawn enemies (with increasing difficulty)
-        current_time = pygame.time.get_ticks()
-        # Decrease spawn delay over time (minimum 500ms)
-        time_difficulty_factor = max(0.5, 1.0 - (current_time / 120000))  # 2 minutes to reach max difficulty
-        
-        # Apply difficulty multiplier
-        difficulty_multiplier = {
-            DIFFICULTY_EASY: 0.7,
-            DIFFICULTY_NORMAL: 1.0,
-            DIFFICULTY_HARD: 1.4,
-            DIFFICULTY_EXPERT: 1.8
-        }
-        
-        current_spawn_delay = int(self.enemy_spawn_delay * time_difficulty_factor * difficulty_multiplier[self.selected_difficulty])
+        current_time = self.sim_clock.now()
+        current_spawn_delay = self.spawn_director.spawn_delay(self.selected_difficulty, self.run_time())
         
         if current_time - self.enemy_spawn_timer > current_spawn_delay:
             self.spawn_enemy()
@@ -1323,16 +2116,29 @@ class Game:
             self.power_up_spawn_timer = current_time
         
         # Update enemies (with time freeze effect)
-        current_time = pygame.time.get_ticks()
+        current_time = self.sim_clock.now()
         time_frozen = current_time - self.time_freeze_timer < self.time_freeze_duration
         freeze_time_active = current_time - self.freeze_time_timer < self.freeze_time_duration
         
-        for enemy in self.enemies[:]:
-            if not time_frozen and not freeze_time_active:  # Only move if time isn't frozen
+        enemies_move = not time_frozen and not freeze_time_active  # Only move if time isn't frozen
+        if enemies_move:
+            # Re-solved only when the player steps onto a new tile
+            self.flow_field.update(self.player.x + self.player.width // 2,
+                                   self.player.y + self.player.height // 2)
+        if enemies_move and self.monster_engine is not None:
+            # Chase step for every enemy in one batched pass
+            self.monster_engine.step(self.player.x + self.player.width // 2,
+                                     self.player.y + self.player.height // 2)
+            for enemy in self.enemies.live():
+                self.enemy_grid.move(enemy)
+        
+        for enemy in self.enemies.live():
+            if enemies_move and self.monster_engine is None:
                 # Give enemy the player's position for chasing
                 enemy.player_x = self.player.x + self.player.width // 2
                 enemy.player_y = self.player.y + self.player.height // 2
                 enemy.update()
+                self.enemy_grid.move(enemy)
             
             # Check if enemy touches player (GAME OVER)
             if (abs(enemy.x - self.player.x) < 30 and abs(enemy.y - self.player.y) < 30):
@@ -1340,8 +2146,7 @@ class Game:
                 if current_time - self.shield_timer < self.shield_duration:
                     # Shield protects player - destroy enemy instead
                     self.create_particles(enemy.x, enemy.y, enemy.color)
-                    if enemy in self.enemies:  # Safety check
-                        self.enemies.remove(enemy)
+                    self.remove_enemy(enemy)
                     self.score += 10
                     self.sound_manager.play('enemy_defeat')
                 else:
@@ -1357,20 +2162,18 @@ class Game:
             if enemy.monster_type == "exploding_bomb" and enemy.health <= 0:
                 # Create explosion effect - damage nearby enemies and player
                 explosion_radius = 80
-                for nearby_enemy in self.enemies[:]:
+                for nearby_enemy in self.enemy_grid.entities_within(enemy.x, enemy.y, explosion_radius):
                     if nearby_enemy != enemy:
-                        distance = math.sqrt((nearby_enemy.x - enemy.x)**2 + (nearby_enemy.y - enemy.y)**2)
-                        if distance < explosion_radius:
-                            nearby_enemy.health -= 2  # Explosion damage
-                            if nearby_enemy.health <= 0:
-                                self.create_particles(nearby_enemy.x, nearby_enemy.y, nearby_enemy.color)
-                                if nearby_enemy in self.enemies:  # Safety check
-                                    self.enemies.remove(nearby_enemy)
-                                self.score += 10
+                        nearby_enemy.health -= 2  # Explosion damage
+                        if nearby_enemy.health <= 0:
+                            self.create_particles(nearby_enemy.x, nearby_enemy.y, nearby_enemy.color)
+                            self.remove_enemy(nearby_enemy)
+                            self.score += 10
                 
                 # Check if player is in explosion radius
-                player_distance = math.sqrt((self.player.x - enemy.x)**2 + (self.player.y - enemy.y)**2)
-                if player_distance < explosion_radius:
+                player_dx = self.player.x - enemy.x
+                player_dy = self.player.y - enemy.y
+                if player_dx * player_dx + player_dy * player_dy < explosion_radius * explosion_radius:
                     # Player takes damage from explosion
                     if current_time - self.shield_timer > self.shield_duration:  # Shield doesn't protect from explosion
                         self.state = GAME_OVER
@@ -1382,92 +2185,61 @@ class Game:
             
             # Remove enemies that go off-screen (they escaped, no penalty)
             if enemy.x < -50 or enemy.x > SCREEN_WIDTH + 50 or enemy.y < -50 or enemy.y > SCREEN_HEIGHT + 50:
-                self.enemies.remove(enemy)
+                self.remove_enemy(enemy, escaped=True)
         
         # Update books
-        for book in self.books[:]:
+        for book in self.books.live():
             book.update()
             # Remove books that go off-screen
             if (book.x > SCREEN_WIDTH or book.x < -book.width or 
                 book.y > SCREEN_HEIGHT or book.y < -book.height):
-                self.books.remove(book)
+                self.books.kill(book)
         
         # Update power-ups
-        for power_up in self.power_ups[:]:
+        for power_up in self.power_ups.live():
             power_up.update()
             if power_up.x < -50:  # Remove power-ups that go off-screen
-                self.power_ups.remove(power_up)
+                self.power_ups.kill(power_up)
         
         # Update particles
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.life <= 0:
-                self.particles.remove(particle)
+        self.particles.update()
         
         # Check collisions
         self.check_collisions()
-        
-        # Check win condition - all monsters killed
-        if len(self.enemies) == 0 and len(self.books) == 0:
-            # All monsters defeated! Spawn next wave or end game
-            self.spawn_next_wave()
     
-    def spawn_enemy(self):
+    def spawn_enemy(self, enemy_types=None):
         # More variety in enemy types based on time and difficulty
-        current_time = pygame.time.get_ticks()
-        
-        # Adjust spawn rates based on difficulty
-        difficulty_multiplier = {
-            DIFFICULTY_EASY: 0.7,
-            DIFFICULTY_NORMAL: 1.0,
-            DIFFICULTY_HARD: 1.4,
-            DIFFICULTY_EXPERT: 1.8
-        }
+        if enemy_types is None:
+            enemy_types = self.spawn_director.spawn_group(self.selected_difficulty, self.run_time(), self.rng.spawn)
         
-        # Spawn multiple enemies on higher difficulties
-        spawn_count = 1
-        if self.selected_difficulty >= DIFFICULTY_HARD and random.random() < 0.4:
-            spawn_count = 2
-        if self.selected_difficulty == DIFFICULTY_EXPERT and random.random() < 0.3:
-            spawn_count = 3
-        # Even on normal difficulty, occasionally spawn 2 enemies
-        if self.selected_difficulty == DIFFICULTY_NORMAL and random.random() < 0.15:
-            spawn_count = 2
-            
-        for _ in range(spawn_count):
-            if current_time > 60000:  # After 1 minute, add chaos lords and literary villains
-                enemy_type = random.choices(
-                        ["student", "animal", "ghost", "chaos_lord", "literary_villain", "book_worm", "noise_demon"],
-                        weights=[25, 20, 15, 15, 10, 10, 5]
-                )[0]
-            elif current_time > 30000:  # After 30 seconds, add more ghosts and literary villains
-                enemy_type = random.choices(
-                        ["student", "animal", "ghost", "literary_villain", "book_worm"],
-                        weights=[30, 25, 20, 15, 10]
-                )[0]
-            else:
-                enemy_type = random.choices(
-                        ["student", "animal", "ghost", "book_worm"],
-                        weights=[40, 30, 20, 10]
-                )[0]
-            
-            enemy = NoisyMonster(enemy_type, self.library_maze)
+        for enemy_type in enemy_types:
+            enemy = self.monster_pool.acquire(enemy_type, self.library_maze, self.flow_field, self.rng.spawn)
             self.enemies.append(enemy)
+            self.enemy_grid.insert(enemy)
+    
+    def remove_enemy(self, enemy, escaped=False):
+        """Take an enemy out of play; it leaves self.enemies when the tick ends"""
+        if not self.enemies.kill(enemy):
+            return  # Already defeated earlier this tick
+        if not escaped:
+            self.kills_by_type[enemy.monster_type] = self.kills_by_type.get(enemy.monster_type, 0) + 1
+        self.enemy_grid.remove(enemy)
+        self.previous_positions.pop(enemy, None)  # The pool may hand this object out again before the next snapshot
+        if self.monster_engine is not None:
+            self.monster_engine.release(enemy)
     
     def spawn_next_wave(self):
         """Spawn the next wave of enemies when all are defeated"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.sim_clock.now()
         
         # Increase wave difficulty
         wave_number = getattr(self, 'wave_number', 1) + 1
         self.wave_number = wave_number
         
-        # Spawn more enemies each wave
-        enemies_to_spawn = min(3 + wave_number, 8)  # Cap at 8 enemies per wave
-        
-        for _ in range(enemies_to_spawn):
-            # Spawn enemies immediately (no delay to avoid freezing)
-            self.spawn_enemy()
+        # Spawn the wave planned while the last one was fought (no delay to avoid freezing)
+        self.spawn_enemy(self.next_wave)
+        self.next_wave = self.spawn_director.plan_wave(wave_number + 1, self.selected_difficulty, self.run_time(),
+                                                       self.rng.spawn)
         
         # Bonus score for clearing wave
         wave_bonus = wave_number * 100
@@ -1479,12 +2251,13 @@ class Game:
         self.quote_timer = current_time
     
     def spawn_power_up(self):
-        power_up = PowerUp()
+        power_up = PowerUp(self.rng.spawn)
         self.power_ups.append(power_up)
+        self.power_up_grid.insert(power_up)
     
     def throw_book_mouse(self, target_pos):
         # Create a book that moves towards the mouse position
-        current_time = pygame.time.get_ticks()
+        current_time = self.sim_clock.now()
         is_mega_book = current_time - self.mega_book_timer < self.mega_book_duration
         is_multi_shot = current_time - self.multi_shot_timer < self.multi_shot_duration
         
@@ -1513,18 +2286,18 @@ class Game:
                 
                 book = Book(self.player.x + self.player.width, 
                            self.player.y + self.player.height // 2, 
-                           new_target, is_mega_book)
+                           new_target, is_mega_book, rng=self.rng.combat)
                 self.books.append(book)
         else:
             # Single shot
             book = Book(self.player.x + self.player.width, 
                        self.player.y + self.player.height // 2, 
-                       target_pos, is_mega_book)
+                       target_pos, is_mega_book, rng=self.rng.combat)
             self.books.append(book)
     
     def throw_book_keyboard(self):
         # Create a book that moves in the last movement direction
-        current_time = pygame.time.get_ticks()
+        current_time = self.sim_clock.now()
         is_mega_book = current_time - self.mega_book_timer < self.mega_book_duration
         is_multi_shot = current_time - self.multi_shot_timer < self.multi_shot_duration
         
@@ -1555,104 +2328,99 @@ class Game:
                 new_target_x = start_x + new_dx
                 new_target_y = start_y + new_dy
                 
-                book = Book(start_x, start_y, (new_target_x, new_target_y), is_mega_book)
+                book = Book(start_x, start_y, (new_target_x, new_target_y), is_mega_book, rng=self.rng.combat)
                 self.books.append(book)
         else:
             # Single shot
-            book = Book(start_x, start_y, (target_x, target_y), is_mega_book)
+            book = Book(start_x, start_y, (target_x, target_y), is_mega_book, rng=self.rng.combat)
             self.books.append(book)
     
     def shush_attack(self):
         # AOE attack - silence all enemies in range
         shush_range = 100
-        for enemy in self.enemies[:]:
-            distance = math.sqrt((enemy.x - self.player.x)**2 + (enemy.y - self.player.y)**2)
-            if distance <= shush_range:
-                enemy.health -= 2  # Shush does more damage
-                if enemy.health <= 0:
-                    self.create_particles(enemy.x, enemy.y, enemy.color)
-                    if enemy in self.enemies:  # Safety check
-                        self.enemies.remove(enemy)
-                    score_bonus = 20 if enemy.monster_type == "chaos_lord" else 10
-                    self.score += score_bonus
-                    self.play_enemy_defeat_sound(enemy.monster_type)
+        for enemy in self.enemy_grid.entities_within(self.player.x, self.player.y, shush_range):
+            enemy.health -= 2  # Shush does more damage
+            if enemy.health <= 0:
+                self.create_particles(enemy.x, enemy.y, enemy.color)
+                self.remove_enemy(enemy)
+                score_bonus = 20 if enemy.monster_type == "chaos_lord" else 10
+                self.score += score_bonus
+                self.play_enemy_defeat_sound(enemy.monster_type)
     
     def check_collisions(self):
-        # Check book-enemy collisions
-        for book in self.books[:]:
-            for enemy in self.enemies[:]:
-                if (abs(book.x - enemy.x) < 30 and abs(book.y - enemy.y) < 30):
-                    if book.is_mega:
-                        # Mega book has area damage - damage all nearby enemies
-                        for nearby_enemy in self.enemies[:]:
-                            distance = math.sqrt((nearby_enemy.x - book.x)**2 + (nearby_enemy.y - book.y)**2)
-                            if distance < 80:  # Area of effect
-                                nearby_enemy.health -= 1
-                                if nearby_enemy.health <= 0:
-                                    self.create_particles(nearby_enemy.x, nearby_enemy.y, nearby_enemy.color)
-                                    if nearby_enemy in self.enemies:  # Safety check
-                                        self.enemies.remove(nearby_enemy)
-                                    score_bonus = 20 if nearby_enemy.monster_type == "chaos_lord" else 10
-                                    self.score += score_bonus
-                                    self.play_enemy_defeat_sound(nearby_enemy.monster_type)
+        # Check book-enemy collisions (enemy_grid is kept current by update)
+        for book in self.books.live():
+            enemy = self.find_book_target(book)
+            if enemy is not None:
+                if book.is_mega:
+                    # Mega book has area damage - damage all nearby enemies
+                    for nearby_enemy in self.enemy_grid.entities_within(book.x, book.y, 80):  # Area of effect
+                        nearby_enemy.health -= 1
+                        if nearby_enemy.health <= 0:
+                            self.create_particles(nearby_enemy.x, nearby_enemy.y, nearby_enemy.color)
+                            self.remove_enemy(nearby_enemy)
+                            score_bonus = 20 if nearby_enemy.monster_type == "chaos_lord" else 10
+                            self.score += score_bonus
+                            self.play_enemy_defeat_sound(nearby_enemy.monster_type)
+                else:
+                    # Regular book - single target damage with literary effects
+                    # Handle shielded knight special mechanics
+                    if enemy.monster_type == "shielded_knight" and enemy.shield_health > 0:
+                        # Shield absorbs damage first
+                        enemy.shield_health -= book.damage
+                        if enemy.shield_health <= 0:
+                            enemy.health -= abs(enemy.shield_health)  # Excess damage goes to health
                     else:
-                        # Regular book - single target damage with literary effects
-                        # Handle shielded knight special mechanics
-                        if enemy.monster_type == "shielded_knight" and hasattr(enemy, 'shield_health') and enemy.shield_health > 0:
-                            # Shield absorbs damage first
-                            enemy.shield_health -= book.damage
-                            if enemy.shield_health <= 0:
-                                enemy.health -= abs(enemy.shield_health)  # Excess damage goes to health
-                        else:
-                            enemy.health -= book.damage  # Use book type damage
-                        
-                        # Special effects for magical tomes
-                        if book.book_type == "magical_tome":
-                            # Magical tome has special effects
-                            if random.random() < 0.3:  # 30% chance for special effect
-                                if book.genre == "fantasy":
-                                    # Freeze nearby enemies
-                                    for nearby_enemy in self.enemies[:]:
-                                        if nearby_enemy != enemy:
-                                            distance = math.sqrt((nearby_enemy.x - book.x)**2 + (nearby_enemy.y - book.y)**2)
-                                            if distance < 60:
-                                                nearby_enemy.speed *= 0.5  # Slow down
-                                elif book.genre == "horror":
-                                    # Fear effect - enemies move away
-                                    enemy.speed *= 1.5  # Speed up to run away
-                                elif book.genre == "science":
-                                    # Chain lightning effect
-                                    for nearby_enemy in self.enemies[:]:
-                                        if nearby_enemy != enemy:
-                                            distance = math.sqrt((nearby_enemy.x - book.x)**2 + (nearby_enemy.y - book.y)**2)
-                                            if distance < 80:
-                                                nearby_enemy.health -= 1
+                        enemy.health -= book.damage  # Use book type damage
+                    
+                    # Special effects for magical tomes
+                    if book.book_type == "magical_tome":
+                        # Magical tome has special effects
+                        if self.rng.combat.random() < 0.3:  # 30% chance for special effect
+                            if book.genre == "fantasy":
+                                # Freeze nearby enemies
+                                for nearby_enemy in self.enemy_grid.entities_within(book.x, book.y, 60):
+                                    if nearby_enemy != enemy:
+                                        nearby_enemy.speed *= 0.5  # Slow down
+                            elif book.genre == "horror":
+                                # Fear effect - enemies move away
+                                enemy.speed *= 1.5  # Speed up to run away
+                            elif book.genre == "science":
+                                # Chain lightning effect
+                                for nearby_enemy in self.enemy_grid.entities_within(book.x, book.y, 80):
+                                    if nearby_enemy != enemy:
+                                        nearby_enemy.health -= 1
+                    
+                    if enemy.health <= 0:
+                        self.create_particles(enemy.x, enemy.y, enemy.color)
+                        self.remove_enemy(enemy)
+                        score_bonus = 20 if enemy.monster_type == "chaos_lord" else 10
+                        self.score += score_bonus
+                        self.play_enemy_defeat_sound(enemy.monster_type)
                         
-                        if enemy.health <= 0:
-                            self.create_particles(enemy.x, enemy.y, enemy.color)
-                            if enemy in self.enemies:  # Safety check
-                                self.enemies.remove(enemy)
-                            score_bonus = 20 if enemy.monster_type == "chaos_lord" else 10
-                            self.score += score_bonus
-                            self.play_enemy_defeat_sound(enemy.monster_type)
-                            
-                            # Literary collection system
-                            self.collect_book(book)
-                    if book in self.books:  # Safety check
-                        self.books.remove(book)
-                    break
+                        # Literary collection system
+                        self.collect_book(book)
+                self.books.kill(book)
         
         # Check player-power-up collisions
-        for power_up in self.power_ups[:]:
+        for power_up in self.power_ups.live():
             if (abs(power_up.x - self.player.x) < 40 and 
                 abs(power_up.y - self.player.y) < 50):
                 self.collect_power_up(power_up)
-                if power_up in self.power_ups:  # Safety check
-                    self.power_ups.remove(power_up)
+                self.power_ups.kill(power_up)
                 self.play_power_up_sound(power_up.type)
     
+    def find_book_target(self, book):
+        """Return the first enemy whose hitbox the book overlaps, if any"""
+        book_box = book.get_hitbox()
+        left, top, width, height = book_box
+        for enemy in self.enemy_grid.query(left, top, left + width, top + height):
+            if hitboxes_overlap(book_box, enemy.get_hitbox()):
+                return enemy
+        return None
+    
     def collect_power_up(self, power_up):
-        current_time = pygame.time.get_ticks()
+        current_time = self.sim_clock.now()
         if power_up.type == "coffee":
             self.speed_boost_timer = current_time
             self.player.speed = 8  # Double speed
@@ -1703,7 +2471,7 @@ class Game:
         # Display quote
         self.current_quote = book.quote
         self.quote_author = book.author
-        self.quote_timer = pygame.time.get_ticks()
+        self.quote_timer = self.sim_clock.now()
         
         # Level up reading level
         if len(self.collected_books) >= self.reading_level * 3:
@@ -1721,11 +2489,30 @@ class Game:
         return titles[min(self.reading_level - 1, len(titles) - 1)]
     
     def create_particles(self, x, y, color, count=5):
-        for _ in range(count):
-            particle = Particle(x, y, color)
-            self.particles.append(particle)
+        self.particles.emit(x, y, color, count)
     
     def draw(self):
+        """Render one frame, with moving entities placed between the last two simulation ticks"""
+        if self.headless:
+            return
+        if self.state != PLAYING or not self.previous_positions:
+            self.draw_frame()
+            return
+        
+        moved = self.interpolate_positions(self.sim_clock.alpha())
+        try:
+            self.draw_frame()
+        finally:
+            for entity, x, y in moved:
+                entity.x = x
+                entity.y = y
+    
+    def draw_frame(self):
+        if (self.use_dirty_rects and self.state == PLAYING and self.last_draw_rects is not None
+                and self.background_maze is self.library_maze):
+            self.draw_game_dirty()
+            return
+        
         self.screen.fill(WHITE)
         
         if self.state == MENU:
@@ -1746,12 +2533,58 @@ class Game:
             self.draw_settings()
         
         pygame.display.flip()
+        
+        # Only a plain gameplay frame can be patched up next time
+        if self.use_dirty_rects:
+            self.last_draw_rects = self.get_draw_rects() if self.state == PLAYING else None
     
     def draw_game(self):
         # Draw library background
         self.draw_library_background()
         
         # Draw game objects
+        self.draw_game_objects()
+        
+        # Draw shush effect
+        self.draw_shush_effect()
+        
+        # Draw UI
+        self.draw_ui()
+    
+    def draw_game_dirty(self):
+        """Restore last frame's entity and UI areas from the cached background, redraw, and push only those rects"""
+        for rect in self.last_draw_rects + self.UI_REGIONS:
+            self.screen.blit(self.background_surface, rect, rect)
+        
+        self.draw_game_objects()
+        self.draw_shush_effect()
+        self.draw_ui()
+        
+        draw_rects = self.get_draw_rects()
+        changed = self.last_draw_rects + draw_rects + self.UI_REGIONS
+        if sum(rect.width * rect.height for rect in changed) > SCREEN_WIDTH * SCREEN_HEIGHT // 2:
+            pygame.display.flip()  # Cheaper to push everything than many overlapping rects
+        else:
+            pygame.display.update(changed)
+        self.last_draw_rects = draw_rects
+    
+    def get_draw_rects(self):
+        """Screen areas covered by this frame's game objects and effects"""
+        rects = [self.player.get_draw_rect()]
+        for group in (self.enemies, self.books, self.power_ups):
+            for entity in group:
+                rects.append(entity.get_draw_rect())
+        rects.extend(self.particles.get_draw_rects())
+        if self.shush_effect_rect:
+            rects.append(self.shush_effect_rect)
+        if self.quote_rect:
+            rects.append(self.quote_rect)
+        
+        screen_rect = self.screen.get_rect()
+        return [rect.clip(screen_rect) for rect in rects]
+    
+    def draw_game_objects(self):
+        """Draw the player and every entity over whatever is already on screen"""
         self.player.draw(self.screen)
         for enemy in self.enemies:
             enemy.draw(self.screen)
@@ -1759,14 +2592,7 @@ class Game:
             book.draw(self.screen)
         for power_up in self.power_ups:
             power_up.draw(self.screen)
-        for particle in self.particles:
-            particle.draw(self.screen)
-        
-        # Draw shush effect
-        self.draw_shush_effect()
-        
-        # Draw UI
-        self.draw_ui()
+        self.particles.draw(self.screen)
     
     def draw_menu(self):
         # Modern gradient background
@@ -1823,8 +2649,8 @@ class Game:
         time_offset = pygame.time.get_ticks() * 0.002
         
         # Main title with modern styling and animation
-        title_font = pygame.font.Font(None, 88)
-        subtitle_font = pygame.font.Font(None, 36)
+        title_font = self.text_cache.get_font(88)
+        subtitle_font = self.text_cache.get_font(36)
         
         # Animated title with pulsing glow
         pulse = 1.0 + 0.1 * math.sin(time_offset * 3)
@@ -1853,7 +2679,7 @@ class Game:
         # Ensure color values are valid integers
         color_val = max(0, min(255, int(200 * fade)))
         subtitle_color = (color_val, color_val, color_val)
-        subtitle_text = subtitle_font.render("Defend the Sacred Silence", True, subtitle_color)
+        subtitle_text = subtitle_font.render("Defend the Sacred Silence", True, subtitle_color, cache=False)
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, 180))
         self.screen.blit(subtitle_text, subtitle_rect)
         
@@ -1869,7 +2695,7 @@ class Game:
     def draw_modern_menu_options(self):
         """Draw modern menu options with enhanced animations and effects"""
         time_offset = pygame.time.get_ticks() * 0.003
-        menu_font = pygame.font.Font(None, 38)
+        menu_font = self.text_cache.get_font(38)
         menu_options = [
             ("SPACE", "Endless Mode", "Defend against endless waves"),
             ("S", "Story Mode", "Epic campaign adventure"),
@@ -1930,12 +2756,12 @@ class Game:
             self.screen.blit(title_text, title_rect)
             
             # Description with fade effect
-            desc_font = pygame.font.Font(None, 22)
+            desc_font = self.text_cache.get_font(22)
             desc_alpha = 0.7 + 0.3 * math.sin(time_offset * 1.5 + i)
             # Ensure color values are valid integers
             color_val = max(0, min(255, int(150 * desc_alpha)))
             desc_color = (color_val, color_val, color_val)
-            desc_text = desc_font.render(description, True, desc_color)
+            desc_text = desc_font.render(description, True, desc_color, cache=False)
             desc_rect = desc_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos + 30 + hover_offset))
             self.screen.blit(desc_text, desc_rect)
     
@@ -1969,7 +2795,7 @@ class Game:
         self.screen.blit(panel_surface, panel_rect)
         
         # Enhanced instructions title with glow
-        title_font = pygame.font.Font(None, 28)
+        title_font = self.text_cache.get_font(28)
         title_text = title_font.render("CONTROLS", True, (255, 215, 0))
         title_rect = title_text.get_rect(center=(panel_rect.centerx, panel_rect.y + 25))
         
@@ -1986,7 +2812,7 @@ class Game:
         self.screen.blit(title_text, title_rect)
         
         # Enhanced instructions with icons and animations
-        instruction_font = pygame.font.Font(None, 20)
+        instruction_font = self.text_cache.get_font(20)
         instructions = [
             ("🎮", "WASD / Arrow Keys: Move"),
             ("📚", "Mouse Click / Space: Throw Books"),
@@ -2007,7 +2833,7 @@ class Game:
             self.screen.blit(icon_text, icon_rect)
             
             # Instruction text
-            instruction_text = instruction_font.render(instruction, True, text_color)
+            instruction_text = instruction_font.render(instruction, True, text_color, cache=False)
             instruction_rect = instruction_text.get_rect(center=(panel_rect.centerx, panel_rect.y + 60 + i * 25))
             self.screen.blit(instruction_text, instruction_rect)
     
@@ -2043,7 +2869,7 @@ class Game:
             self.screen.blit(panel_surface, score_panel)
             
             # Enhanced title with glow
-            title_font = pygame.font.Font(None, 26)
+            title_font = self.text_cache.get_font(26)
             title_text = title_font.render("LATEST SCORE", True, (255, 215, 0))
             title_rect = title_text.get_rect(center=(score_panel.centerx, score_panel.y + 25))
             
@@ -2060,7 +2886,7 @@ class Game:
             self.screen.blit(title_text, title_rect)
             
             # Enhanced latest score with pulsing effect
-            score_font = pygame.font.Font(None, 36)
+            score_font = self.text_cache.get_font(36)
             latest_score = high_scores[0] if high_scores else 0
             pulse = 1.0 + 0.1 * math.sin(time_offset * 5)
             # Ensure all color values are valid integers between 0-255
@@ -2068,19 +2894,19 @@ class Game:
             g = max(0, min(255, int(255 * pulse)))
             b = max(0, min(255, int(200 * pulse)))
             score_color = (r, g, b)
-            score_text = score_font.render(f"{latest_score:,}", True, score_color)
+            score_text = score_font.render(f"{latest_score:,}", True, score_color, cache=False)
             score_rect = score_text.get_rect(center=(score_panel.centerx, score_panel.y + 65))
             self.screen.blit(score_text, score_rect)
             
             # Enhanced high score indicator
             if len(high_scores) > 1:
-                high_score_font = pygame.font.Font(None, 20)
+                high_score_font = self.text_cache.get_font(20)
                 high_score_text = high_score_font.render("🏆 HIGH SCORE", True, (255, 215, 0))
                 high_score_rect = high_score_text.get_rect(center=(score_panel.centerx, score_panel.y + 95))
                 self.screen.blit(high_score_text, high_score_rect)
                 
                 # Add achievement indicator
-                achievement_font = pygame.font.Font(None, 16)
+                achievement_font = self.text_cache.get_font(16)
                 achievement_text = achievement_font.render("NEW RECORD!", True, (0, 255, 0))
                 achievement_rect = achievement_text.get_rect(center=(score_panel.centerx, score_panel.y + 115))
                 self.screen.blit(achievement_text, achievement_rect)
@@ -2142,15 +2968,9 @@ class Game:
         # High scores
         high_scores = self.high_score_manager.get_high_scores()
         if high_scores:
-            font = pygame.font.Font(None, 24)
-            scores_title = font.render("HALL OF SCHOLARLY FAME", True, GOLD)
-            scores_rect = scores_title.get_rect(center=(SCREEN_WIDTH//2, 480))
-            shadow = font.render("HALL OF SCHOLARLY FAME", True, BLACK)
-            shadow_rect = shadow.get_rect(center=(SCREEN_WIDTH//2 + 1, 481))
-            self.screen.blit(shadow, shadow_rect)
-            self.screen.blit(scores_title, scores_rect)
-            
-            font = pygame.font.Font(None, 20)
+            self.draw_text("HALL OF SCHOLARLY FAME", 24, GOLD, shadow=(1, 1), center=(SCREEN_WIDTH//2, 480))
+            
+            font = self.text_cache.get_font(20)
             for i, score in enumerate(high_scores[:5]):  # Show top 5
                 score_text = font.render(f"{i+1}. {score} Knowledge Points", True, CREAM)
                 score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, 510 + i * 20))
@@ -2164,7 +2984,7 @@ class Game:
         self.screen.fill(DARK_BROWN)
         
         # Title
-        title_font = pygame.font.Font(None, 64)
+        title_font = self.text_cache.get_font(64)
         title_text = title_font.render("Choose Your Librarian", True, GOLD)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
         self.screen.blit(title_text, title_rect)
@@ -2194,7 +3014,7 @@ class Game:
         else:
             # Draw placeholder
             pygame.draw.circle(self.screen, (255, 182, 193), female_rect.center, 40)
-            font = pygame.font.Font(None, 24)
+            font = self.text_cache.get_font(24)
             text = font.render("Female", True, BLACK)
             text_rect = text.get_rect(center=female_rect.center)
             self.screen.blit(text, text_rect)
@@ -2207,13 +3027,13 @@ class Game:
         else:
             # Draw placeholder
             pygame.draw.circle(self.screen, (173, 216, 230), male_rect.center, 40)
-            font = pygame.font.Font(None, 24)
+            font = self.text_cache.get_font(24)
             text = font.render("Male", True, BLACK)
             text_rect = text.get_rect(center=male_rect.center)
             self.screen.blit(text, text_rect)
         
         # Character labels
-        font = pygame.font.Font(None, 36)
+        font = self.text_cache.get_font(36)
         female_text = font.render("Female Librarian", True, CREAM)
         female_text_rect = female_text.get_rect(center=(female_rect.centerx, female_rect.bottom + 30))
         self.screen.blit(female_text, female_text_rect)
@@ -2223,7 +3043,7 @@ class Game:
         self.screen.blit(male_text, male_text_rect)
         
         # Instructions
-        instruction_font = pygame.font.Font(None, 28)
+        instruction_font = self.text_cache.get_font(28)
         instructions = [
             "Press 1 for Female Librarian",
             "Press 2 for Male Librarian", 
@@ -2238,7 +3058,7 @@ class Game:
             self.screen.blit(text, text_rect)
         
         # Current selection indicator
-        selection_font = pygame.font.Font(None, 32)
+        selection_font = self.text_cache.get_font(32)
         current_text = f"Selected: {self.selected_character.title()} Librarian"
         current_color = GOLD
         text = selection_font.render(current_text, True, current_color)
@@ -2250,12 +3070,12 @@ class Game:
         self.screen.fill(DARK_BROWN)
         
         # Title
-        title_font = pygame.font.Font(None, 64)
+        title_font = self.text_cache.get_font(64)
         title_text = title_font.render("The Great Library Crisis", True, GOLD)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 80))
         self.screen.blit(title_text, title_rect)
         
-        subtitle_font = pygame.font.Font(None, 28)
+        subtitle_font = self.text_cache.get_font(28)
         subtitle_text = subtitle_font.render("Choose Your Chapter", True, CREAM)
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, 120))
         self.screen.blit(subtitle_text, subtitle_rect)
@@ -2284,19 +3104,19 @@ class Game:
             pygame.draw.rect(self.screen, border_color, button_rect, 3)
             
             # Chapter number and title
-            chapter_font = pygame.font.Font(None, 32)
+            chapter_font = self.text_cache.get_font(32)
             chapter_title = f"Chapter {chapter_num}: {chapter_data['title']}"
             title_text = chapter_font.render(chapter_title, True, text_color)
             self.screen.blit(title_text, (button_rect.x + 20, button_rect.y + 10))
             
             # Description
-            desc_font = pygame.font.Font(None, 20)
+            desc_font = self.text_cache.get_font(20)
             desc_text = desc_font.render(chapter_data['description'], True, text_color)
             self.screen.blit(desc_text, (button_rect.x + 20, button_rect.y + 35))
             
             # Lock icon for locked chapters
             if not is_unlocked:
-                lock_font = pygame.font.Font(None, 40)
+                lock_font = self.text_cache.get_font(40)
                 lock_text = lock_font.render("🔒", True, WARM_GRAY)
                 self.screen.blit(lock_text, (button_rect.right - 50, button_rect.y + 10))
         
@@ -2304,13 +3124,13 @@ class Game:
         back_button = pygame.Rect(50, 500, 100, 40)
         pygame.draw.rect(self.screen, BURGUNDY, back_button)
         pygame.draw.rect(self.screen, GOLD, back_button, 2)
-        back_font = pygame.font.Font(None, 24)
+        back_font = self.text_cache.get_font(24)
         back_text = back_font.render("Back", True, CREAM)
         back_text_rect = back_text.get_rect(center=back_button.center)
         self.screen.blit(back_text, back_text_rect)
         
         # Instructions
-        instruction_font = pygame.font.Font(None, 20)
+        instruction_font = self.text_cache.get_font(20)
         instructions = [
             "Click on unlocked chapters or press 1-5",
             "Complete chapters to unlock the next ones",
@@ -2327,12 +3147,12 @@ class Game:
         self.screen.fill(DARK_BROWN)
         
         # Title
-        title_font = pygame.font.Font(None, 64)
+        title_font = self.text_cache.get_font(64)
         title_text = title_font.render("Choose Your Challenge", True, GOLD)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
         self.screen.blit(title_text, title_rect)
         
-        subtitle_font = pygame.font.Font(None, 28)
+        subtitle_font = self.text_cache.get_font(28)
         subtitle_text = subtitle_font.render("Select Difficulty Level", True, CREAM)
         subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, 140))
         self.screen.blit(subtitle_text, subtitle_rect)
@@ -2358,25 +3178,25 @@ class Game:
                 pygame.draw.rect(self.screen, GOLD, button_rect, 2)
             
             # Difficulty name
-            name_font = pygame.font.Font(None, 36)
+            name_font = self.text_cache.get_font(36)
             name_text = name_font.render(f"{i+1}. {name}", True, WHITE if self.selected_difficulty == i else GOLD)
             name_rect = name_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos + 20))
             self.screen.blit(name_text, name_rect)
             
             # Description
-            desc_font = pygame.font.Font(None, 20)
+            desc_font = self.text_cache.get_font(20)
             desc_text = desc_font.render(description, True, CREAM)
             desc_rect = desc_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos + 40))
             self.screen.blit(desc_text, desc_rect)
         
         # Back button
-        back_font = pygame.font.Font(None, 32)
+        back_font = self.text_cache.get_font(32)
         back_text = back_font.render("ESC - Back to Main Menu", True, GOLD)
         back_rect = back_text.get_rect(center=(100, 620))
         self.screen.blit(back_text, back_rect)
         
         # Instructions
-        instruction_font = pygame.font.Font(None, 24)
+        instruction_font = self.text_cache.get_font(24)
         instructions = [
             "Press 1-4 to select difficulty or click on buttons",
             "SPACE or ENTER to confirm and return to main menu"
@@ -2404,9 +3224,19 @@ class Game:
             pygame.draw.line(self.screen, GOLD, (x, 95), (x + 12, 95), 1)
     
     def draw_library_background(self):
-        """Draw the maze-based library layout with enhanced graphics"""
+        """Draw the maze-based library layout from the pre-rendered cache"""
+        if self.background_surface is None or self.background_maze is not self.library_maze:
+            self.bake_library_background()
+        self.screen.blit(self.background_surface, (0, 0))
+    
+    def bake_library_background(self):
+        """Render the static library layout once into an off-screen surface"""
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Seed the decorative details per map so they stay put between frames
+        rng = random.Random(self.library_maze.map_type)
+        
         # Create gradient background
-        self.draw_gradient_background()
+        self.draw_gradient_background(surface)
         
         # Draw each tile with enhanced graphics
         for y in range(self.library_maze.height):
@@ -2415,13 +3245,19 @@ class Game:
                 pixel_x = x * TILE_SIZE
                 pixel_y = y * TILE_SIZE
                 
-                self.draw_enhanced_tile(pixel_x, pixel_y, tile_type)
+                self.draw_enhanced_tile(surface, pixel_x, pixel_y, tile_type, rng)
         
         # Add atmospheric lighting and shadows
-        self.draw_ambient_lighting()
-        self.draw_dynamic_shadows()
+        self.draw_ambient_lighting(surface)
+        self.draw_dynamic_shadows(surface)
+        
+        # Match the display format so the per-frame blit is a plain copy
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        self.background_surface = surface
+        self.background_maze = self.library_maze
     
-    def draw_gradient_background(self):
+    def draw_gradient_background(self, surface):
         """Draw a subtle gradient background"""
         for y in range(SCREEN_HEIGHT):
             # Create a subtle gradient from dark brown to slightly lighter
@@ -2431,62 +3267,62 @@ class Game:
             g = max(0, min(255, int(DARK_BROWN[1] + (15 * ratio))))
             b = max(0, min(255, int(DARK_BROWN[2] + (10 * ratio))))
             color = (r, g, b)
-            pygame.draw.line(self.screen, color, (0, y), (SCREEN_WIDTH, y))
+            pygame.draw.line(surface, color, (0, y), (SCREEN_WIDTH, y))
     
-    def draw_enhanced_tile(self, x, y, tile_type):
+    def draw_enhanced_tile(self, surface, x, y, tile_type, rng=random):
         """Draw enhanced tile with better graphics"""
         if tile_type == WALL:
             # Enhanced stone wall with depth
             # Main wall
-            pygame.draw.rect(self.screen, (80, 60, 40), (x, y, TILE_SIZE, TILE_SIZE))
+            pygame.draw.rect(surface, (80, 60, 40), (x, y, TILE_SIZE, TILE_SIZE))
             # Highlight
-            pygame.draw.line(self.screen, (120, 100, 60), (x, y), (x + TILE_SIZE, y), 2)
-            pygame.draw.line(self.screen, (120, 100, 60), (x, y), (x, y + TILE_SIZE), 2)
+            pygame.draw.line(surface, (120, 100, 60), (x, y), (x + TILE_SIZE, y), 2)
+            pygame.draw.line(surface, (120, 100, 60), (x, y), (x, y + TILE_SIZE), 2)
             # Shadow
-            pygame.draw.line(self.screen, (40, 30, 20), (x + TILE_SIZE - 1, y), (x + TILE_SIZE - 1, y + TILE_SIZE), 2)
-            pygame.draw.line(self.screen, (40, 30, 20), (x, y + TILE_SIZE - 1), (x + TILE_SIZE, y + TILE_SIZE - 1), 2)
+            pygame.draw.line(surface, (40, 30, 20), (x + TILE_SIZE - 1, y), (x + TILE_SIZE - 1, y + TILE_SIZE), 2)
+            pygame.draw.line(surface, (40, 30, 20), (x, y + TILE_SIZE - 1), (x + TILE_SIZE, y + TILE_SIZE - 1), 2)
             # Stone texture
             for i in range(3):
-                stone_x = x + random.randint(2, TILE_SIZE - 4)
-                stone_y = y + random.randint(2, TILE_SIZE - 4)
-                pygame.draw.circle(self.screen, (100, 80, 50), (stone_x, stone_y), 1)
+                stone_x = x + rng.randint(2, TILE_SIZE - 4)
+                stone_y = y + rng.randint(2, TILE_SIZE - 4)
+                pygame.draw.circle(surface, (100, 80, 50), (stone_x, stone_y), 1)
                 
         elif tile_type == BOOKSHELF:
             # Enhanced bookshelf with 3D effect
             # Main shelf
-            pygame.draw.rect(self.screen, (101, 67, 33), (x, y, TILE_SIZE, TILE_SIZE))
+            pygame.draw.rect(surface, (101, 67, 33), (x, y, TILE_SIZE, TILE_SIZE))
             # Books with different colors
             book_colors = [(139, 69, 19), (160, 82, 45), (210, 180, 140), (101, 67, 33)]
             for i in range(4):
                 book_x = x + 2 + i * 6
                 book_color = book_colors[i % len(book_colors)]
-                pygame.draw.rect(self.screen, book_color, (book_x, y + 2, 5, TILE_SIZE - 4))
+                pygame.draw.rect(surface, book_color, (book_x, y + 2, 5, TILE_SIZE - 4))
                 # Book spine details
-                pygame.draw.line(self.screen, (255, 215, 0), (book_x + 1, y + 4), (book_x + 1, y + TILE_SIZE - 4), 1)
+                pygame.draw.line(surface, (255, 215, 0), (book_x + 1, y + 4), (book_x + 1, y + TILE_SIZE - 4), 1)
             # Shelf shadow
-            pygame.draw.line(self.screen, (60, 40, 20), (x, y + TILE_SIZE - 1), (x + TILE_SIZE, y + TILE_SIZE - 1), 2)
+            pygame.draw.line(surface, (60, 40, 20), (x, y + TILE_SIZE - 1), (x + TILE_SIZE, y + TILE_SIZE - 1), 2)
             
         elif tile_type == LAMP:
             # Enhanced lamp with glow effect
             # Lamp post
-            pygame.draw.rect(self.screen, (139, 69, 19), (x + 12, y + 8, 6, TILE_SIZE - 8))
+            pygame.draw.rect(surface, (139, 69, 19), (x + 12, y + 8, 6, TILE_SIZE - 8))
             # Lamp head
-            pygame.draw.circle(self.screen, (255, 215, 0), (x + 15, y + 8), 8)
-            pygame.draw.circle(self.screen, (255, 255, 200), (x + 15, y + 8), 6)
+            pygame.draw.circle(surface, (255, 215, 0), (x + 15, y + 8), 8)
+            pygame.draw.circle(surface, (255, 255, 200), (x + 15, y + 8), 6)
             # Glow effect
             glow_surface = pygame.Surface((20, 20), pygame.SRCALPHA)
             pygame.draw.circle(glow_surface, (255, 215, 0, 50), (10, 10), 10)
-            self.screen.blit(glow_surface, (x + 5, y - 2))
+            surface.blit(glow_surface, (x + 5, y - 2))
             
         else:  # WALKABLE
             # Enhanced walkable area with subtle pattern
-            pygame.draw.rect(self.screen, (139, 119, 101), (x, y, TILE_SIZE, TILE_SIZE))
+            pygame.draw.rect(surface, (139, 119, 101), (x, y, TILE_SIZE, TILE_SIZE))
             # Subtle wood grain effect
             for i in range(2):
                 grain_y = y + 4 + i * 8
-                pygame.draw.line(self.screen, (120, 100, 80), (x + 2, grain_y), (x + TILE_SIZE - 2, grain_y), 1)
+                pygame.draw.line(surface, (120, 100, 80), (x + 2, grain_y), (x + TILE_SIZE - 2, grain_y), 1)
     
-    def draw_dynamic_shadows(self):
+    def draw_dynamic_shadows(self, surface):
         """Draw dynamic shadows for depth"""
         # Create shadow overlay
         shadow_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
@@ -2500,7 +3336,7 @@ class Game:
                     pygame.draw.rect(shadow_surface, (0, 0, 0, 30), 
                                    (shadow_x, shadow_y, TILE_SIZE, TILE_SIZE))
         
-        self.screen.blit(shadow_surface, (0, 0))
+        surface.blit(shadow_surface, (0, 0))
     
     def draw_tile(self, x, y, tile_type):
         """Draw a single tile with enhanced graphics"""
@@ -2584,7 +3420,7 @@ class Game:
             pygame.draw.line(self.screen, WARM_GRAY, (x, y + 10), (x + TILE_SIZE, y + 20), 1)
             pygame.draw.line(self.screen, WARM_GRAY, (x + 5, y), (x + 15, y + TILE_SIZE), 1)
     
-    def draw_ambient_lighting(self):
+    def draw_ambient_lighting(self, surface):
         """Add atmospheric lighting effects"""
         # Find all lamps and create light circles around them
         for y in range(self.library_maze.height):
@@ -2600,11 +3436,12 @@ class Game:
                         light_surface.set_alpha(alpha)
                         light_surface.fill(AMBER)
                         light_rect = light_surface.get_rect(center=(center_x, center_y))
-                        self.screen.blit(light_surface, light_rect)
+                        surface.blit(light_surface, light_rect)
     
     def draw_shush_effect(self):
         # Draw shush effect circle if recently used
-        current_time = pygame.time.get_ticks()
+        self.shush_effect_rect = None
+        current_time = self.sim_clock.now()
         if current_time - self.shush_effect_timer < self.shush_effect_duration:
             # Calculate alpha based on time remaining
             time_remaining = self.shush_effect_duration - (current_time - self.shush_effect_timer)
@@ -2621,7 +3458,7 @@ class Game:
             # Blit the effect centered on the player
             effect_x = self.player.x + self.player.width // 2 - 100
             effect_y = self.player.y + self.player.height // 2 - 100
-            self.screen.blit(shush_surface, (effect_x, effect_y))
+            self.shush_effect_rect = self.screen.blit(shush_surface, (effect_x, effect_y))
     
     def draw_ui(self):
         # Draw wave counter and score info
@@ -2638,7 +3475,7 @@ class Game:
         pygame.draw.rect(self.screen, DARK_BROWN, (meter_x, meter_y, meter_width, meter_height))
         
         # Wave and enemy count display
-        font = pygame.font.Font(None, 20)
+        font = self.text_cache.get_font(20)
         wave_text = font.render(f"Wave: {getattr(self, 'wave_number', 1)} | Enemies: {len(self.enemies)}", True, WHITE)
         text_rect = wave_text.get_rect(center=(meter_x + meter_width//2, meter_y + meter_height//2))
         self.screen.blit(wave_text, text_rect)
@@ -2648,48 +3485,29 @@ class Game:
         self.screen.blit(label_text, (meter_x, meter_y - 20))
         
         # Draw score with scholarly styling
-        font = pygame.font.Font(None, 32)
-        score_text = font.render(f"Knowledge Gained: {self.score}", True, CREAM)
         # Add shadow
-        shadow_text = font.render(f"Knowledge Gained: {self.score}", True, BLACK)
-        self.screen.blit(shadow_text, (12, 12))
-        self.screen.blit(score_text, (10, 10))
+        self.draw_text(f"Knowledge Gained: {self.score}", 32, CREAM, shadow=(2, 2), topleft=(10, 10))
         
         # Draw power-up status with ornate styling
-        current_time = pygame.time.get_ticks()
+        current_time = self.sim_clock.now()
         if current_time - self.speed_boost_timer < self.speed_boost_duration:
-            font = pygame.font.Font(None, 24)
-            speed_text = font.render("☕ SCHOLAR'S VIGOR!", True, AMBER)
             # Add glow effect
-            shadow_text = font.render("☕ SCHOLAR'S VIGOR!", True, BLACK)
-            self.screen.blit(shadow_text, (12, 52))
-            self.screen.blit(speed_text, (10, 50))
+            self.draw_text("☕ SCHOLAR'S VIGOR!", 24, AMBER, shadow=(2, 2), topleft=(10, 50))
         
         if current_time - self.mega_book_timer < self.mega_book_duration:
-            font = pygame.font.Font(None, 24)
-            mega_text = font.render("📖 ANCIENT WISDOM!", True, GOLD)
-            shadow_text = font.render("📖 ANCIENT WISDOM!", True, BLACK)
-            self.screen.blit(shadow_text, (12, 82))
-            self.screen.blit(mega_text, (10, 80))
+            self.draw_text("📖 ANCIENT WISDOM!", 24, GOLD, shadow=(2, 2), topleft=(10, 80))
         
         if current_time - self.silence_aura_timer < self.silence_aura_duration:
-            font = pygame.font.Font(None, 24)
-            aura_text = font.render("🔮 AURA OF SILENCE!", True, (100, 149, 237))
-            shadow_text = font.render("🔮 AURA OF SILENCE!", True, BLACK)
-            self.screen.blit(shadow_text, (12, 112))
-            self.screen.blit(aura_text, (10, 110))
+            self.draw_text("🔮 AURA OF SILENCE!", 24, (100, 149, 237), shadow=(2, 2), topleft=(10, 110))
         
         if current_time - self.time_freeze_timer < self.time_freeze_duration:
-            font = pygame.font.Font(None, 24)
-            freeze_text = font.render("⏰ TIME STANDS STILL!", True, (255, 215, 0))
-            shadow_text = font.render("⏰ TIME STANDS STILL!", True, BLACK)
-            self.screen.blit(shadow_text, (12, 142))
-            self.screen.blit(freeze_text, (10, 140))
+            self.draw_text("⏰ TIME STANDS STILL!", 24, (255, 215, 0), shadow=(2, 2), topleft=(10, 140))
         
         # Literary quote display
+        self.quote_rect = None
         if self.current_quote and (current_time - self.quote_timer) < 4000:  # Show for 4 seconds
             # Quote text
-            quote_font = pygame.font.Font(None, 22)
+            quote_font = self.text_cache.get_font(22)
             quote_lines = self.wrap_text(f'"{self.current_quote}"', quote_font, SCREEN_WIDTH - 120)
             
             # Calculate dynamic height based on number of lines
@@ -2700,6 +3518,7 @@ class Game:
             
             # Quote background - positioned at bottom with dynamic height
             quote_bg = pygame.Rect(50, SCREEN_HEIGHT - quote_height - 20, SCREEN_WIDTH - 100, quote_height)
+            self.quote_rect = quote_bg
             pygame.draw.rect(self.screen, (0, 0, 0, 180), quote_bg)
             pygame.draw.rect(self.screen, GOLD, quote_bg, 2)
             
@@ -2711,18 +3530,18 @@ class Game:
                 y_offset += line_height
             
             # Author attribution
-            author_font = pygame.font.Font(None, 18)
+            author_font = self.text_cache.get_font(18)
             author_text = author_font.render(f"— {self.quote_author}", True, GOLD)
             self.screen.blit(author_text, (quote_bg.right - 150, quote_bg.bottom - 20))
         
         # Bibliophile progress (top-right corner)
-        progress_font = pygame.font.Font(None, 20)
+        progress_font = self.text_cache.get_font(20)
         title_text = progress_font.render(f"{self.get_bibliophile_title()}", True, GOLD)
         title_rect = title_text.get_rect()
         title_rect.topright = (SCREEN_WIDTH - 15, meter_y + 50)
         self.screen.blit(title_text, title_rect)
         
-        collection_font = pygame.font.Font(None, 16)
+        collection_font = self.text_cache.get_font(16)
         collection_text = collection_font.render(f"Genres: {len(self.collected_books)}/9", True, CREAM)
         collection_rect = collection_text.get_rect()
         collection_rect.topright = (SCREEN_WIDTH - 15, meter_y + 72)
@@ -2734,11 +3553,18 @@ class Game:
         self.screen.blit(authors_text, authors_rect)
         
         # Draw controls with scholarly elegance
-        font = pygame.font.Font(None, 16)
-        controls_text = font.render("Click/X: Cast Tomes | Space: Silence | Arrows: Move | ESC: Settings | R: Restart", True, CREAM)
-        shadow_text = font.render("Click/X: Cast Tomes | Space: Silence | Arrows: Move | ESC: Settings | R: Restart", True, BLACK)
-        self.screen.blit(shadow_text, (12, SCREEN_HEIGHT - 28))
-        self.screen.blit(controls_text, (10, SCREEN_HEIGHT - 30))
+        self.draw_text("Click/X: Cast Tomes | Space: Silence | Arrows: Move | ESC: Settings | R: Restart", 16, CREAM,
+                       shadow=(2, 2), topleft=(10, SCREEN_HEIGHT - 30))
+    
+    def draw_text(self, text, size, color, shadow=None, cache=True, **anchor):
+        """Blit cached text (plus its composited drop shadow) placed like Rect(**anchor); returns the text rect"""
+        surface = self.text_cache.render(text, size, color, shadow, cache)
+        dx, dy = shadow or (0, 0)
+        text_rect = pygame.Rect(0, 0, surface.get_width() - dx, surface.get_height() - dy)
+        for name, value in anchor.items():
+            setattr(text_rect, name, value)
+        self.screen.blit(surface, text_rect.topleft)
+        return text_rect
     
     def wrap_text(self, text, font, max_width):
         """Wrap text to fit within given width"""
@@ -2775,42 +3601,22 @@ class Game:
         pygame.draw.rect(self.screen, RICH_BROWN, (55, 105, SCREEN_WIDTH - 110, SCREEN_HEIGHT - 210), 3)
         
         # Title with scholarly elegance
-        font = pygame.font.Font(None, 64)
-        game_over_text = font.render("THE LIBRARIAN WAS CAUGHT!", True, BURGUNDY)
-        text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 80))
         # Add shadow
-        shadow_text = font.render("THE LIBRARIAN WAS CAUGHT!", True, BLACK)
-        shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH//2 + 2, SCREEN_HEIGHT//2 - 78))
-        self.screen.blit(shadow_text, shadow_rect)
-        self.screen.blit(game_over_text, text_rect)
+        self.draw_text("THE LIBRARIAN WAS CAUGHT!", 64, BURGUNDY, shadow=(2, 2),
+                       center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 80))
         
         # Final score with scholarly styling
-        font = pygame.font.Font(None, 36)
-        score_text = font.render(f"Knowledge Preserved: {self.score}", True, CREAM)
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40))
-        shadow_text = font.render(f"Knowledge Preserved: {self.score}", True, BLACK)
-        shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH//2 + 1, SCREEN_HEIGHT//2 - 39))
-        self.screen.blit(shadow_text, shadow_rect)
-        self.screen.blit(score_text, score_rect)
+        self.draw_text(f"Knowledge Preserved: {self.score}", 36, CREAM, shadow=(1, 1),
+                       center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 40))
         
         # High score notification
         if self.is_new_high_score:
-            font = pygame.font.Font(None, 28)
-            high_score_text = font.render("🌟 NEW SCHOLARLY ACHIEVEMENT! 🌟", True, GOLD)
-            high_score_rect = high_score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 5))
-            shadow_text = font.render("🌟 NEW SCHOLARLY ACHIEVEMENT! 🌟", True, BLACK)
-            shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH//2 + 1, SCREEN_HEIGHT//2 - 4))
-            self.screen.blit(shadow_text, shadow_rect)
-            self.screen.blit(high_score_text, high_score_rect)
+            self.draw_text("🌟 NEW SCHOLARLY ACHIEVEMENT! 🌟", 28, GOLD, shadow=(1, 1),
+                           center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 5))
         
         # Restart instruction with scholarly language
-        font = pygame.font.Font(None, 24)
-        restart_text = font.render("R: Begin Anew | ESC: Return to Main Hall", True, GOLD)
-        restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 30))
-        shadow_text = font.render("R: Begin Anew | ESC: Return to Main Hall", True, BLACK)
-        shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH//2 + 1, SCREEN_HEIGHT//2 + 31))
-        self.screen.blit(shadow_text, shadow_rect)
-        self.screen.blit(restart_text, restart_rect)
+        self.draw_text("R: Begin Anew | ESC: Return to Main Hall", 24, GOLD, shadow=(1, 1),
+                       center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 30))
         
         # Decorative elements
         # Corner ornaments
@@ -2831,16 +3637,9 @@ class Game:
         pygame.draw.rect(self.screen, RICH_BROWN, (105, 85, SCREEN_WIDTH - 210, SCREEN_HEIGHT - 170), 3)
         
         # Title
-        font = pygame.font.Font(None, 48)
-        title_text = font.render("SCHOLARLY CONTROLS", True, GOLD)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 130))
-        shadow_text = font.render("SCHOLARLY CONTROLS", True, BLACK)
-        shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH//2 + 2, 132))
-        self.screen.blit(shadow_text, shadow_rect)
-        self.screen.blit(title_text, title_rect)
+        self.draw_text("SCHOLARLY CONTROLS", 48, GOLD, shadow=(2, 2), center=(SCREEN_WIDTH//2, 130))
         
         # Key binding display
-        font = pygame.font.Font(None, 24)
         y_offset = 180
         
         key_names = {
@@ -2873,10 +3672,7 @@ class Game:
             if self.setting_key and instruction.endswith("..."):
                 color = GOLD
             
-            text = font.render(instruction, True, color)
-            shadow = font.render(instruction, True, BLACK)
-            self.screen.blit(shadow, (SCREEN_WIDTH//2 - text.get_width()//2 + 1, y_offset + i * 30 + 1))
-            self.screen.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, y_offset + i * 30))
+            self.draw_text(instruction, 24, color, shadow=(1, 1), midtop=(SCREEN_WIDTH//2, y_offset + i * 30))
         
         # Decorative elements
         pygame.draw.circle(self.screen, GOLD, (120, 100), 6)
@@ -2892,14 +3688,46 @@ class Game:
     def run(self):
         while self.running:
             self.handle_events()
-            self.update()
+            # Simulate at a fixed rate however often frames are drawn; a slow frame just runs more ticks
+            for _ in range(self.sim_clock.advance(self.clock.tick(self.render_fps))):
+                self.update()
             self.draw()
-            self.clock.tick(FPS)
         
+        self.finish_recording()  # Keep a run that was quit midway
         pygame.quit()
         sys.exit()
+    
+    def run_headless(self, ticks, restart=True):
+        """Step the simulation as fast as possible without drawing; returns throughput stats"""
+        if self.state != PLAYING:
+            self.state = PLAYING
+            self.restart_game()
+        runs = 1
+        simulated = 0  # Counted here, since the clock restarts with every run
+        start = time.perf_counter()
+        for _ in range(ticks):
+            if self.state != PLAYING:
+                if not restart:
+                    break
+                self.state = PLAYING
+                self.restart_game()
+                runs += 1
+            self.update()
+            simulated += 1
+        elapsed = time.perf_counter() - start
+        self.finish_recording()  # Keep the run the tick budget cut off
+        return {
+            'ticks': simulated,
+            'seconds': elapsed,
+            'ticks_per_second': simulated / elapsed if elapsed > 0 else float('inf'),
+            'runs': runs,
+        }
 
 class Librarian:
+    # Baked procedural bodies shared by every librarian, keyed by (character, direction, animation_frame)
+    sprite_cache = {}
+    SPRITE_CANVAS = 96  # Big enough for the body, arms and held book
+    
     def __init__(self, maze, sprite_manager=None):
         self.x = TILE_SIZE * 2  # Start in entrance area
         self.y = TILE_SIZE * 2
@@ -2915,26 +3743,26 @@ class Librarian:
         self.facing_direction = 'down'  # up, down, left, right
         self.is_moving = False
     
-    def update(self, key_bindings):
-        keys = pygame.key.get_pressed()
+    def update(self, held):
+        """Move one tick according to the held movement actions"""
         old_x, old_y = self.x, self.y
         new_x, new_y = self.x, self.y
         
         self.is_moving = False
         
-        if keys[key_bindings['move_up']]:
+        if 'move_up' in held:
             new_y -= self.speed
             self.facing_direction = 'up'
             self.is_moving = True
-        if keys[key_bindings['move_down']]:
+        if 'move_down' in held:
             new_y += self.speed
             self.facing_direction = 'down'
             self.is_moving = True
-        if keys[key_bindings['move_left']]:
+        if 'move_left' in held:
             new_x -= self.speed
             self.facing_direction = 'left'
             self.is_moving = True
-        if keys[key_bindings['move_right']]:
+        if 'move_right' in held:
             new_x += self.speed
             self.facing_direction = 'right'
             self.is_moving = True
@@ -2959,18 +3787,11 @@ class Librarian:
     def can_move_to(self, x, y):
         """Check if the librarian can move to the given position"""
         # Check all four corners of the librarian
-        corners = [
-            (x, y),                           # Top-left
-            (x + self.width, y),              # Top-right
-            (x, y + self.height),             # Bottom-left
-            (x + self.width, y + self.height) # Bottom-right
-        ]
-        
-        for corner_x, corner_y in corners:
-            if not self.maze.is_walkable(corner_x, corner_y):
-                return False
-        
-        return True
+        return self.maze.box_walkable(x, y, self.width, self.height)
+    
+    def get_draw_rect(self):
+        """Screen area draw() can touch: sprite or procedural body, bob and shadow"""
+        return pygame.Rect(self.x - 12, self.y - 18, self.width + 26, self.height + 26)
     
     def draw(self, screen):
         # Try to use sprite first, fall back to procedural graphics
@@ -3018,23 +3839,69 @@ class Librarian:
     
     def draw_procedural(self, screen):
         """Draw using procedural graphics (enhanced cute version)"""
-        # Ultra-cute enhanced librarian with better proportions and details
+        # Cute shadow with rounded edges
+        shadow_y = self.y + self.height - 1
+        pygame.draw.ellipse(screen, (0, 0, 0, 80), (self.x + 2, shadow_y, self.width - 4, 6))
+        
+        # Blit the baked body; standing still always looks like frame 0
+        character = self.sprite_manager.current_character if self.sprite_manager else None
+        frame = self.animation_frame if self.is_moving else None
+        key = (character, self.facing_direction, frame)
+        baked = Librarian.sprite_cache.get(key)
+        if baked is None:
+            baked = self.bake_sprite()
+            Librarian.sprite_cache[key] = baked
+        sprite, (offset_x, offset_y) = baked
+        screen.blit(sprite, (int(self.x) + offset_x, int(self.y) + offset_y))
+        
+        # Sparkles around the book
         center_x = self.x + self.width // 2
         center_y = self.y + self.height // 2
+        book_x = center_x + 12
+        book_y = self.get_body_y(center_y) - 8
+        if self.facing_direction == 'left':
+            book_x = center_x - 16
+        sparkle_offset = math.sin(pygame.time.get_ticks() * 0.01) * 2
+        pygame.draw.circle(screen, GOLD, (book_x - 3, book_y + int(sparkle_offset)), 1)
+        pygame.draw.circle(screen, GOLD, (book_x + 13, book_y + 4 - int(sparkle_offset)), 1)
         
+        # Power-up aura effects
+        self.draw_power_up_effects(screen)
+    
+    def get_body_y(self, center_y):
+        """Vertical centre of the torso, bobbing with the walk cycle"""
         # Animation offset for walking
         walk_offset = 0
         bounce_offset = 0
         if self.is_moving:
             walk_offset = 1.5 * math.sin(self.animation_frame * math.pi / 2)
             bounce_offset = 1 * abs(math.sin(self.animation_frame * math.pi / 2))
+        return center_y - 2 + walk_offset - bounce_offset
+    
+    def bake_sprite(self):
+        """Render draw_shape once onto a transparent canvas, cropped to the pixels it touched"""
+        canvas = pygame.Surface((self.SPRITE_CANVAS, self.SPRITE_CANVAS), pygame.SRCALPHA)
+        origin = self.SPRITE_CANVAS // 3
+        self.draw_shape(canvas, origin, origin)
+        
+        crop = canvas.get_bounding_rect()
+        sprite = canvas.subsurface(crop).copy()
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite, (crop.x - origin, crop.y - origin)
+    
+    def draw_shape(self, screen, x, y):
+        # Ultra-cute enhanced librarian with better proportions and details, top-left corner at (x, y)
+        center_x = x + self.width // 2
+        center_y = y + self.height // 2
         
-        # Cute shadow with rounded edges
-        shadow_y = self.y + self.height - 1
-        pygame.draw.ellipse(screen, (0, 0, 0, 80), (self.x + 2, shadow_y, self.width - 4, 6))
+        # Animation offset for walking
+        bounce_offset = 0
+        if self.is_moving:
+            bounce_offset = 1 * abs(math.sin(self.animation_frame * math.pi / 2))
         
         # Body position with cute bouncing
-        body_y = center_y - 2 + walk_offset - bounce_offset
+        body_y = self.get_body_y(center_y)
         
         # Cute legs with walking animation
         leg_offset = 0
@@ -3134,14 +4001,6 @@ class Librarian:
         pygame.draw.line(screen, GOLD, (book_x + 2, book_y + 2), (book_x + 8, book_y + 2), 1)
         pygame.draw.line(screen, GOLD, (book_x + 2, book_y + 4), (book_x + 8, book_y + 4), 1)
         pygame.draw.line(screen, GOLD, (book_x + 2, book_y + 6), (book_x + 8, book_y + 6), 1)
-        
-        # Sparkles around the book
-        sparkle_offset = math.sin(pygame.time.get_ticks() * 0.01) * 2
-        pygame.draw.circle(screen, GOLD, (book_x - 3, book_y + int(sparkle_offset)), 1)
-        pygame.draw.circle(screen, GOLD, (book_x + 13, book_y + 4 - int(sparkle_offset)), 1)
-        
-        # Power-up aura effects
-        self.draw_power_up_effects(screen)
     
     def draw_power_up_effects(self, screen):
         """Draw power-up aura effects around the character"""
@@ -3152,109 +4011,182 @@ class Librarian:
         # Note: We would need a reference to the game to check power-up timers
         # For now, this is a placeholder - we'll need to pass game reference or timers
 
+# Monster archetypes: one row per monster type, replaceable from a JSON file
+@dataclass(frozen=True)
+class MonsterArchetype:
+    """Look, noise, speed, toughness and spawn weight shared by every monster of a type"""
+    color: tuple
+    noise_value: tuple  # Inclusive (low, high) for random.randint
+    speed: tuple        # (low, high) for random.uniform
+    health: int = 1     # Most enemies die in one hit
+    width: int = 25
+    height: int = 25
+    teleport_delay: int = 0   # Milliseconds between teleports
+    shield_health: int = 0    # Hits the shield absorbs
+    explosion_delay: int = 0  # Milliseconds before exploding
+    spawn_weights: tuple = ()  # ((from ms, weight), ...) for regular spawns; empty means waves never pick it
+
+MONSTER_ARCHETYPES = MappingProxyType({
+    "student": MonsterArchetype(
+        color=(255, 200, 200),  # Light pink
+        noise_value=(8, 12),
+        speed=(2.0, 3.0),  # Faster
+        spawn_weights=((0, 40), (30000, 30), (60000, 25)),
+    ),
+    "animal": MonsterArchetype(
+        color=(200, 150, 100),  # Brown
+        noise_value=(5, 10),
+        speed=(1.5, 2.5),  # Faster
+        spawn_weights=((0, 30), (30000, 25), (60000, 20)),
+    ),
+    "ghost": MonsterArchetype(
+        color=(200, 200, 255),  # Light blue
+        noise_value=(10, 15),
+        speed=(2.5, 3.5),  # Much faster
+        spawn_weights=((0, 20), (60000, 15)),
+    ),
+    "chaos_lord": MonsterArchetype(
+        color=(255, 100, 100),  # Dark red
+        noise_value=(20, 25),
+        speed=(0.5, 1.0),
+        health=3,  # Takes 3 hits
+        width=35,
+        height=35,
+        spawn_weights=((60000, 15),),  # Joins after 1 minute
+    ),
+    "literary_villain": MonsterArchetype(
+        color=(75, 0, 130),  # Dark purple
+        noise_value=(15, 20),
+        speed=(0.8, 1.3),
+        health=2,  # Tougher than normal enemies
+        width=30,
+        height=30,
+        spawn_weights=((30000, 15), (60000, 10)),  # Joins after 30 seconds
+    ),
+    "book_worm": MonsterArchetype(
+        color=(139, 69, 19),  # Saddle brown
+        noise_value=(6, 12),
+        speed=(3.0, 4.0),  # Very fast
+        width=20,
+        height=20,
+        spawn_weights=((0, 10),),
+    ),
+    "noise_demon": MonsterArchetype(
+        color=(255, 0, 255),  # Magenta
+        noise_value=(25, 30),
+        speed=(0.3, 0.8),
+        health=4,  # Very tough
+        width=40,
+        height=40,
+        spawn_weights=((60000, 5),),  # Joins after 1 minute
+    ),
+    "boss_monster": MonsterArchetype(
+        color=(139, 0, 0),  # Dark red
+        noise_value=(30, 40),
+        speed=(0.5, 1.0),
+        health=8,  # Boss health
+        width=50,
+        height=50,
+    ),
+    "swarm_enemy": MonsterArchetype(
+        color=(255, 165, 0),  # Orange
+        noise_value=(3, 6),
+        speed=(4.0, 5.0),  # Very fast
+        width=15,
+        height=15,
+    ),
+    "teleporting_ghost": MonsterArchetype(
+        color=(128, 0, 128),  # Purple
+        noise_value=(12, 18),
+        speed=(1.0, 2.0),
+        health=2,
+        teleport_delay=3000,  # 3 seconds
+    ),
+    "shielded_knight": MonsterArchetype(
+        color=(70, 70, 70),  # Dark gray
+        noise_value=(10, 15),
+        speed=(0.8, 1.2),
+        health=3,
+        shield_health=2,  # Shield takes 2 hits
+        width=30,
+        height=30,
+    ),
+    "exploding_bomb": MonsterArchetype(
+        color=(255, 69, 0),  # Red-orange
+        noise_value=(15, 20),
+        speed=(1.5, 2.5),
+        width=20,
+        height=20,
+        explosion_delay=5000,  # 5 seconds before explosion
+    )
+})
+
+# Default fallback for any unknown monster types
+FALLBACK_ARCHETYPE = MonsterArchetype(color=(128, 128, 128), noise_value=(8, 12), speed=(1.0, 1.5))
+
+def load_monster_archetypes(path):
+    """Read an archetype table from JSON: {"type": {"color": [r, g, b], "noise_value": [lo, hi], ...}}"""
+    with open(path, 'r') as f:
+        return monster_archetypes_from_rows(json.load(f))
+
+def monster_archetypes_from_rows(rows):
+    """Build an archetype table from plain {"type": {field: value}} rows, as found in JSON"""
+    archetypes = {}
+    for monster_type, fields in rows.items():
+        # JSON lists become tuples so the rows stay hashable and immutable
+        fields = {name: tuple(value) if isinstance(value, list) else value for name, value in fields.items()}
+        if 'spawn_weights' in fields:
+            fields['spawn_weights'] = tuple(tuple(step) for step in fields['spawn_weights'])
+        archetypes[monster_type] = MonsterArchetype(**fields)
+    if not any(row.spawn_weights for row in archetypes.values()):
+        raise ValueError("No monster type in the archetype table has spawn_weights, so nothing would spawn")
+    return MappingProxyType(archetypes)
+
 class NoisyMonster:
-    def __init__(self, monster_type=None, maze=None):
+    # Fixed layout: every field a monster can have, type-specific ones included
+    __slots__ = (
+        'maze', 'flow_field', 'rng', 'dead', 'monster_type', 'x', 'y', 'width', 'height',
+        'color', 'noise_value', 'speed', 'health',
+        'teleport_timer', 'teleport_delay', 'shield_health', 'explosion_timer', 'explosion_delay',
+        'target_x', 'target_y', 'path_update_timer', 'player_x', 'player_y', 'sparkle_frame',
+    )
+    
+    # Baked sprites shared by every monster, keyed by (type, width, height, variant)
+    sprite_cache = {}
+    SPRITE_CANVAS = 128  # Big enough for the largest monster plus its health bar
+    SPARKLE_FRAMES = 8   # Pre-baked sparkle patterns for teleporting ghosts
+    
+    def __init__(self, monster_type=None, maze=None, flow_field=None, archetypes=MONSTER_ARCHETYPES, rng=random):
+        self.reset(monster_type, maze, flow_field, archetypes, rng)
+    
+    def reset(self, monster_type=None, maze=None, flow_field=None, archetypes=MONSTER_ARCHETYPES, rng=random):
+        """(Re)initialise every field from the type's archetype, so pooled monsters come back fresh"""
         self.maze = maze
+        self.flow_field = flow_field  # Shared FlowField towards the player, if any
+        self.rng = rng  # Random stream for stats, spawn points and teleports
+        self.dead = False  # Set by EntityList.kill, dropped at the end of the tick
         self.width = 25
         self.height = 25
-        self.monster_type = monster_type or random.choice([
-            "student", "animal", "ghost", "chaos_lord", 
-            "literary_villain", "book_worm", "noise_demon",
-            "boss_monster", "swarm_enemy", "teleporting_ghost", 
-            "shielded_knight", "exploding_bomb"
-        ])
-        self.health = 1  # Most enemies die in one hit
+        self.monster_type = monster_type or rng.choice(tuple(archetypes))
         
         # Find a valid spawn position near the edges
         self.find_spawn_position()
         
         # Different colors and properties for different monster types
-        if self.monster_type == "student":
-            self.color = (255, 200, 200)  # Light pink
-            self.noise_value = random.randint(8, 12)
-            self.speed = random.uniform(2.0, 3.0)  # Faster
-        elif self.monster_type == "animal":
-            self.color = (200, 150, 100)  # Brown
-            self.noise_value = random.randint(5, 10)
-            self.speed = random.uniform(1.5, 2.5)  # Faster
-        elif self.monster_type == "ghost":
-            self.color = (200, 200, 255)  # Light blue
-            self.noise_value = random.randint(10, 15)
-            self.speed = random.uniform(2.5, 3.5)  # Much faster
-        elif self.monster_type == "chaos_lord":
-            self.color = (255, 100, 100)  # Dark red
-            self.noise_value = random.randint(20, 25)
-            self.speed = random.uniform(0.5, 1.0)
-            self.health = 3  # Takes 3 hits
-            self.width = 35
-            self.height = 35
-        elif self.monster_type == "literary_villain":
-            self.color = (75, 0, 130)  # Dark purple
-            self.noise_value = random.randint(15, 20)
-            self.speed = random.uniform(0.8, 1.3)
-            self.health = 2  # Tougher than normal enemies
-            self.width = 30
-            self.height = 30
-        elif self.monster_type == "book_worm":
-            self.color = (139, 69, 19)  # Saddle brown
-            self.noise_value = random.randint(6, 12)
-            self.speed = random.uniform(3.0, 4.0)  # Very fast
-            self.health = 1
-            self.width = 20
-            self.height = 20
-        elif self.monster_type == "noise_demon":
-            self.color = (255, 0, 255)  # Magenta
-            self.noise_value = random.randint(25, 30)
-            self.speed = random.uniform(0.3, 0.8)
-            self.health = 4  # Very tough
-            self.width = 40
-            self.height = 40
-        elif self.monster_type == "boss_monster":
-            self.color = (139, 0, 0)  # Dark red
-            self.noise_value = random.randint(30, 40)
-            self.speed = random.uniform(0.5, 1.0)
-            self.health = 8  # Boss health
-            self.width = 50
-            self.height = 50
-        elif self.monster_type == "swarm_enemy":
-            self.color = (255, 165, 0)  # Orange
-            self.noise_value = random.randint(3, 6)
-            self.speed = random.uniform(4.0, 5.0)  # Very fast
-            self.health = 1
-            self.width = 15
-            self.height = 15
-        elif self.monster_type == "teleporting_ghost":
-            self.color = (128, 0, 128)  # Purple
-            self.noise_value = random.randint(12, 18)
-            self.speed = random.uniform(1.0, 2.0)
-            self.health = 2
-            self.width = 25
-            self.height = 25
-            self.teleport_timer = 0
-            self.teleport_delay = 3000  # 3 seconds
-        elif self.monster_type == "shielded_knight":
-            self.color = (70, 70, 70)  # Dark gray
-            self.noise_value = random.randint(10, 15)
-            self.speed = random.uniform(0.8, 1.2)
-            self.health = 3
-            self.shield_health = 2  # Shield takes 2 hits
-            self.width = 30
-            self.height = 30
-        elif self.monster_type == "exploding_bomb":
-            self.color = (255, 69, 0)  # Red-orange
-            self.noise_value = random.randint(15, 20)
-            self.speed = random.uniform(1.5, 2.5)
-            self.health = 1
-            self.width = 20
-            self.height = 20
-            self.explosion_timer = 0
-            self.explosion_delay = 5000  # 5 seconds before explosion
-        else:
-            # Default fallback for any unknown monster types
-            self.color = (128, 128, 128)  # Gray
-            self.noise_value = random.randint(8, 12)
-            self.speed = random.uniform(1.0, 1.5)
-            self.health = 1
+        archetype = archetypes.get(self.monster_type, FALLBACK_ARCHETYPE)
+        self.color = archetype.color
+        self.noise_value = rng.randint(*archetype.noise_value)
+        self.speed = rng.uniform(*archetype.speed)
+        self.health = archetype.health
+        self.width = archetype.width
+        self.height = archetype.height
+        
+        # Type-specific abilities stay at zero unless the archetype uses them
+        self.teleport_timer = 0
+        self.teleport_delay = archetype.teleport_delay
+        self.shield_health = archetype.shield_health
+        self.explosion_timer = 0
+        self.explosion_delay = archetype.explosion_delay
         
         # AI pathfinding - will be set to chase player
         self.target_x = SCREEN_WIDTH // 2  # Start by heading to center
@@ -3262,32 +4194,24 @@ class NoisyMonster:
         self.path_update_timer = 0
         self.player_x = 0  # Player position for chasing
         self.player_y = 0
+        self.sparkle_frame = 0
+    
+    def get_hitbox(self):
+        """Collision box (left, top, width, height) centred on the drawn monster"""
+        return (self.x - self.width / 2, self.y - self.height / 2, self.width, self.height)
     
     def find_spawn_position(self):
         """Find a valid spawn position in walkable areas"""
-        attempts = 0
-        while attempts < 50:  # Prevent infinite loop
-            # Try to spawn near the edges of walkable areas
-            if random.choice([True, False]):
-                # Spawn from right side
-                self.x = SCREEN_WIDTH - 50
-                self.y = random.randint(TILE_SIZE, SCREEN_HEIGHT - TILE_SIZE - self.height)
-            else:
-                # Spawn from bottom
-                self.x = random.randint(TILE_SIZE, SCREEN_WIDTH - TILE_SIZE - self.width)
-                self.y = SCREEN_HEIGHT - 50
-            
-            # Check if spawn position is valid
-            if self.maze and self.can_move_to(self.x, self.y):
-                break
-            elif not self.maze:  # Fallback if no maze
-                self.x = SCREEN_WIDTH + 50
-                self.y = random.randint(50, SCREEN_HEIGHT - 50)
-                break
-            
-            attempts += 1
+        if not self.maze:  # Fallback if no maze
+            self.x = SCREEN_WIDTH + 50
+            self.y = self.rng.randint(50, SCREEN_HEIGHT - 50)
+            return
         
-        if attempts >= 50:  # Fallback spawn
+        # One pick from the maze's precomputed edge cells, all reachable from the player's area
+        point = self.maze.random_spawn_point(self.rng)
+        if point is not None:
+            self.x, self.y = point
+        else:  # Fallback spawn
             self.x = SCREEN_WIDTH - TILE_SIZE
             self.y = SCREEN_HEIGHT // 2
     
@@ -3297,18 +4221,7 @@ class NoisyMonster:
             return True
             
         # Check all four corners of the enemy
-        corners = [
-            (x, y),
-            (x + self.width, y),
-            (x, y + self.height),
-            (x + self.width, y + self.height)
-        ]
-        
-        for corner_x, corner_y in corners:
-            if not self.maze.is_walkable(corner_x, corner_y):
-                return False
-        
-        return True
+        return self.maze.box_walkable(x, y, self.width, self.height)
     
     def can_move_to_simple(self, x, y):
         """Simplified collision detection - only avoid walls, allow movement through most areas"""
@@ -3332,28 +4245,8 @@ class NoisyMonster:
     
     def update(self):
         # Handle special enemy behaviors
-        current_time = pygame.time.get_ticks()
-        
-        # Teleporting ghost special ability
-        if self.monster_type == "teleporting_ghost":
-            self.teleport_timer += 16  # Approximate frame time
-            if self.teleport_timer >= self.teleport_delay:
-                # Teleport to a random position near player
-                if hasattr(self, 'player_x') and hasattr(self, 'player_y'):
-                    offset_x = random.randint(-100, 100)
-                    offset_y = random.randint(-100, 100)
-                    self.x = self.player_x + offset_x
-                    self.y = self.player_y + offset_y
-                    self.teleport_timer = 0
-        
-        # Exploding bomb special ability
-        elif self.monster_type == "exploding_bomb":
-            self.explosion_timer += 16
-            if self.explosion_timer >= self.explosion_delay:
-                # Explode - damage nearby enemies and player
-                # This will be handled in the game's collision detection
-                self.health = 0  # Mark for destruction
-                return
+        if not self.update_behaviour():
+            return
         
         # Simple direct movement towards player
         self.path_update_timer += 1
@@ -3361,7 +4254,7 @@ class NoisyMonster:
         # Update target frequently (chase player)
         if self.path_update_timer % 5 == 0:  # Every 5 frames (very responsive)
             # Try to get player position for chasing
-            if hasattr(self, 'player_x') and hasattr(self, 'player_y') and self.player_x != 0 and self.player_y != 0:
+            if self.player_x != 0 and self.player_y != 0:
                 self.target_x = self.player_x
                 self.target_y = self.player_y
             else:
@@ -3369,29 +4262,42 @@ class NoisyMonster:
                 self.target_x = SCREEN_WIDTH // 2
                 self.target_y = SCREEN_HEIGHT // 2
         
-        # Move towards target with simplified collision detection
+        # Follow the shared flow field around the furniture; chase directly in the player's tile
+        goal_x, goal_y = self.target_x, self.target_y
+        if self.flow_field is not None:
+            step = self.flow_field.next_step(self.x, self.y)
+            if step is not None:
+                goal_x, goal_y = step
+        
         old_x, old_y = self.x, self.y
         
         # Calculate direction to target
-        dx = self.target_x - self.x
-        dy = self.target_y - self.y
+        dx = goal_x - self.x
+        dy = goal_y - self.y
         distance = math.sqrt(dx*dx + dy*dy)
         
         if distance > 2:  # Don't jitter when very close
             # Normalize and apply speed
-            if distance > 0:  # Avoid division by zero
-                move_x = (dx / distance) * self.speed
-                move_y = (dy / distance) * self.speed
-            else:
-                move_x = 0
-                move_y = 0
+            move_x = (dx / distance) * self.speed
+            move_y = (dy / distance) * self.speed
             
             new_x = self.x + move_x
             new_y = self.y + move_y
             
-            # Simplified movement - just move towards player, ignore most obstacles
-            # Only avoid walls, but allow movement through other areas
-            if self.can_move_to_simple(new_x, new_y):
+            if self.flow_field is not None:
+                # Respect the maze, sliding along furniture when blocked diagonally
+                passable = self.flow_field.passable
+                if passable(new_x, new_y):
+                    self.x, self.y = new_x, new_y
+                elif passable(new_x, old_y):  # Try horizontal only
+                    self.x = new_x
+                elif passable(old_x, new_y):  # Try vertical only
+                    self.y = new_y
+                elif not passable(old_x, old_y):
+                    # Stranded inside furniture (e.g. after a teleport) - walk out
+                    self.x, self.y = new_x, new_y
+            # Without a flow field only avoid walls
+            elif self.can_move_to_simple(new_x, new_y):
                 self.x, self.y = new_x, new_y
             elif self.can_move_to_simple(new_x, old_y):  # Try horizontal only
                 self.x = new_x
@@ -3402,97 +4308,168 @@ class NoisyMonster:
                 self.x = new_x
                 self.y = new_y
     
+    def update_behaviour(self):
+        """Advance special abilities; returns False if the monster must not move this frame"""
+        # Teleporting ghost special ability
+        if self.monster_type == "teleporting_ghost":
+            self.teleport_timer += TICK_MS
+            if self.teleport_timer >= self.teleport_delay:
+                # Teleport to a random reachable spot near player
+                if self.maze:
+                    point = self.maze.random_point_near(self.player_x, self.player_y, 100, self.rng)
+                else:
+                    point = (self.player_x + self.rng.randint(-100, 100), self.player_y + self.rng.randint(-100, 100))
+                if point is not None:
+                    self.x, self.y = point
+                self.teleport_timer = 0
+        
+        # Exploding bomb special ability
+        elif self.monster_type == "exploding_bomb":
+            self.explosion_timer += TICK_MS
+            if self.explosion_timer >= self.explosion_delay:
+                # Explode - damage nearby enemies and player
+                # This will be handled in the game's collision detection
+                self.health = 0  # Mark for destruction
+                return False
+        
+        return True
+    
+    def get_draw_rect(self):
+        """Screen area draw() can touch, including health bars and shield rings above the body"""
+        extent = max(self.width, self.height) // 2 + 15
+        return pygame.Rect(self.x - extent, self.y - extent - 10, extent * 2, extent * 2 + 10)
+    
+    def get_draw_variant(self):
+        """The per-instance state that changes a monster's look: health bar, shield or warning light"""
+        if self.monster_type in ("student", "animal", "ghost", "swarm_enemy", "teleporting_ghost"):
+            return None
+        elif self.monster_type == "literary_villain":
+            return self.health if self.health < 2 else None
+        elif self.monster_type == "shielded_knight":
+            return self.shield_health > 0
+        elif self.monster_type == "exploding_bomb":
+            return bool((self.explosion_timer // 500) % 2)
+        return self.health  # Boss-style health bar
+    
     def draw(self, screen):
-        # Draw monster based on type with dark academia styling
+        # Blit the baked sprite for this type, size and look
+        variant = self.get_draw_variant()
+        if self.monster_type == "teleporting_ghost":
+            # Cycle through pre-baked sparkle patterns instead of re-rolling them every frame
+            self.sparkle_frame = (self.sparkle_frame + 1) % self.SPARKLE_FRAMES
+            variant = self.sparkle_frame
+        
+        key = (self.monster_type, self.width, self.height, variant)
+        baked = NoisyMonster.sprite_cache.get(key)
+        if baked is None:
+            baked = self.bake_sprite(variant)
+            NoisyMonster.sprite_cache[key] = baked
+        sprite, (offset_x, offset_y) = baked
+        screen.blit(sprite, (int(self.x) + offset_x, int(self.y) + offset_y))
+    
+    def bake_sprite(self, variant):
+        """Render draw_shape once onto a transparent canvas, cropped to the pixels it touched"""
+        canvas = pygame.Surface((self.SPRITE_CANVAS, self.SPRITE_CANVAS), pygame.SRCALPHA)
+        origin = self.SPRITE_CANVAS // 2
+        self.draw_shape(canvas, origin, origin, rng=random.Random(variant))
+        
+        crop = canvas.get_bounding_rect()
+        sprite = canvas.subsurface(crop).copy()
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite, (crop.x - origin, crop.y - origin)
+    
+    def draw_shape(self, screen, x, y, rng=random):
+        # Draw monster based on type with dark academia styling, centred on (x, y)
         if self.monster_type == "student":
             # Noisy student in modern clothes disrupting the scholarly atmosphere
             # Head
-            pygame.draw.circle(screen, (245, 222, 179), (int(self.x), int(self.y - 8)), 8)
+            pygame.draw.circle(screen, (245, 222, 179), (int(x), int(y - 8)), 8)
             # Messy hair
-            pygame.draw.circle(screen, (255, 182, 193), (int(self.x), int(self.y - 12)), 7)
+            pygame.draw.circle(screen, (255, 182, 193), (int(x), int(y - 12)), 7)
             # Body - casual hoodie
-            pygame.draw.rect(screen, (255, 105, 180), (self.x - 8, self.y - 2, 16, 20))
+            pygame.draw.rect(screen, (255, 105, 180), (x - 8, y - 2, 16, 20))
             # Backpack
-            pygame.draw.rect(screen, (255, 20, 147), (self.x + 6, self.y - 5, 8, 12))
+            pygame.draw.rect(screen, (255, 20, 147), (x + 6, y - 5, 8, 12))
             # Legs
-            pygame.draw.rect(screen, (0, 0, 0), (self.x - 6, self.y + 18, 6, 8))
-            pygame.draw.rect(screen, (0, 0, 0), (self.x + 2, self.y + 18, 6, 8))
+            pygame.draw.rect(screen, (0, 0, 0), (x - 6, y + 18, 6, 8))
+            pygame.draw.rect(screen, (0, 0, 0), (x + 2, y + 18, 6, 8))
             # Eyes - mischievous
-            pygame.draw.circle(screen, BLACK, (int(self.x - 3), int(self.y - 10)), 2)
-            pygame.draw.circle(screen, BLACK, (int(self.x + 3), int(self.y - 10)), 2)
+            pygame.draw.circle(screen, BLACK, (int(x - 3), int(y - 10)), 2)
+            pygame.draw.circle(screen, BLACK, (int(x + 3), int(y - 10)), 2)
             
         elif self.monster_type == "animal":
             # Mischievous cat disrupting the quiet
             # Head
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 10)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), 10)
             # Ears
             pygame.draw.polygon(screen, self.color, [
-                (self.x - 8, self.y - 6),
-                (self.x - 4, self.y - 12),
-                (self.x - 2, self.y - 6)
+                (x - 8, y - 6),
+                (x - 4, y - 12),
+                (x - 2, y - 6)
             ])
             pygame.draw.polygon(screen, self.color, [
-                (self.x + 8, self.y - 6),
-                (self.x + 4, self.y - 12),
-                (self.x + 2, self.y - 6)
+                (x + 8, y - 6),
+                (x + 4, y - 12),
+                (x + 2, y - 6)
             ])
             # Body
-            pygame.draw.ellipse(screen, self.color, (self.x - 8, self.y + 2, 16, 12))
+            pygame.draw.ellipse(screen, self.color, (x - 8, y + 2, 16, 12))
             # Tail
-            pygame.draw.ellipse(screen, self.color, (self.x + 8, self.y + 4, 8, 4))
+            pygame.draw.ellipse(screen, self.color, (x + 8, y + 4, 8, 4))
             # Eyes - glowing
-            pygame.draw.circle(screen, (255, 255, 0), (int(self.x - 3), int(self.y - 2)), 2)
-            pygame.draw.circle(screen, (255, 255, 0), (int(self.x + 3), int(self.y - 2)), 2)
-            pygame.draw.circle(screen, BLACK, (int(self.x - 3), int(self.y - 2)), 1)
-            pygame.draw.circle(screen, BLACK, (int(self.x + 3), int(self.y - 2)), 1)
+            pygame.draw.circle(screen, (255, 255, 0), (int(x - 3), int(y - 2)), 2)
+            pygame.draw.circle(screen, (255, 255, 0), (int(x + 3), int(y - 2)), 2)
+            pygame.draw.circle(screen, BLACK, (int(x - 3), int(y - 2)), 1)
+            pygame.draw.circle(screen, BLACK, (int(x + 3), int(y - 2)), 1)
             
         elif self.monster_type == "ghost":
             # Ancient library ghost - more ethereal and scholarly
             # Main body - wavy, translucent
             points = [
-                (self.x - 12, self.y - 8),
-                (self.x + 12, self.y - 8),
-                (self.x + 10, self.y + 2),
-                (self.x + 6, self.y + 8),
-                (self.x, self.y + 4),
-                (self.x - 6, self.y + 8),
-                (self.x - 10, self.y + 2)
+                (x - 12, y - 8),
+                (x + 12, y - 8),
+                (x + 10, y + 2),
+                (x + 6, y + 8),
+                (x, y + 4),
+                (x - 6, y + 8),
+                (x - 10, y + 2)
             ]
             pygame.draw.polygon(screen, self.color, points)
             # Ethereal glow effect
             pygame.draw.polygon(screen, (200, 200, 255), points, 1)
             # Glowing red eyes
-            pygame.draw.circle(screen, (255, 0, 0), (int(self.x - 4), int(self.y - 4)), 3)
-            pygame.draw.circle(screen, (255, 0, 0), (int(self.x + 4), int(self.y - 4)), 3)
+            pygame.draw.circle(screen, (255, 0, 0), (int(x - 4), int(y - 4)), 3)
+            pygame.draw.circle(screen, (255, 0, 0), (int(x + 4), int(y - 4)), 3)
             # Inner glow
-            pygame.draw.circle(screen, (255, 100, 100), (int(self.x - 4), int(self.y - 4)), 1)
-            pygame.draw.circle(screen, (255, 100, 100), (int(self.x + 4), int(self.y - 4)), 1)
+            pygame.draw.circle(screen, (255, 100, 100), (int(x - 4), int(y - 4)), 1)
+            pygame.draw.circle(screen, (255, 100, 100), (int(x + 4), int(y - 4)), 1)
             
         elif self.monster_type == "literary_villain":
             # Literary villain - dark academic antagonist
             # Main body - dark purple robe
-            pygame.draw.ellipse(screen, self.color, (self.x - 12, self.y - 5, 24, 30))
+            pygame.draw.ellipse(screen, self.color, (x - 12, y - 5, 24, 30))
             
             # Head - pale and menacing
-            pygame.draw.circle(screen, (220, 220, 220), (int(self.x), int(self.y - 8)), 10)
+            pygame.draw.circle(screen, (220, 220, 220), (int(x), int(y - 8)), 10)
             
             # Dark hood
-            pygame.draw.arc(screen, (50, 0, 80), (self.x - 12, self.y - 20, 24, 20), 0, 3.14159, 3)
+            pygame.draw.arc(screen, (50, 0, 80), (x - 12, y - 20, 24, 20), 0, 3.14159, 3)
             
             # Glowing red eyes
-            pygame.draw.circle(screen, (255, 0, 0), (int(self.x - 4), int(self.y - 8)), 3)
-            pygame.draw.circle(screen, (255, 0, 0), (int(self.x + 4), int(self.y - 8)), 3)
+            pygame.draw.circle(screen, (255, 0, 0), (int(x - 4), int(y - 8)), 3)
+            pygame.draw.circle(screen, (255, 0, 0), (int(x + 4), int(y - 8)), 3)
             
             # Evil grimoire
-            pygame.draw.rect(screen, (100, 0, 0), (self.x - 15, self.y - 2, 8, 12))
-            pygame.draw.line(screen, (255, 215, 0), (self.x - 15, self.y + 2), (self.x - 7, self.y + 2), 2)
+            pygame.draw.rect(screen, (100, 0, 0), (x - 15, y - 2, 8, 12))
+            pygame.draw.line(screen, (255, 215, 0), (x - 15, y + 2), (x - 7, y + 2), 2)
             
             # Health bar for tougher enemy
             if self.health < 2:
                 health_bar_width = 25
                 health_bar_height = 3
-                health_x = self.x - health_bar_width // 2
-                health_y = self.y - 25
+                health_x = x - health_bar_width // 2
+                health_y = y - 25
                 
                 pygame.draw.rect(screen, BLACK, (health_x, health_y, health_bar_width, health_bar_height))
                 health_width = (self.health / 2) * health_bar_width
@@ -3501,27 +4478,27 @@ class NoisyMonster:
         elif self.monster_type == "boss_monster":
             # Massive boss enemy - ultimate challenge
             # Main body - huge and menacing
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 25)
-            pygame.draw.circle(screen, (100, 0, 0), (int(self.x), int(self.y)), 25, 4)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), 25)
+            pygame.draw.circle(screen, (100, 0, 0), (int(x), int(y)), 25, 4)
             
             # Multiple horns
             for i, (horn_x, horn_y) in enumerate([(-20, -20), (20, -20), (-10, -25), (10, -25)]):
                 pygame.draw.polygon(screen, (50, 0, 0), [
-                    (self.x + horn_x, self.y + horn_y),
-                    (self.x + horn_x - 3, self.y + horn_y - 8),
-                    (self.x + horn_x + 3, self.y + horn_y - 8)
+                    (x + horn_x, y + horn_y),
+                    (x + horn_x - 3, y + horn_y - 8),
+                    (x + horn_x + 3, y + horn_y - 8)
                 ])
             
             # Glowing eyes
             for i, (eye_x, eye_y) in enumerate([(-12, -8), (12, -8), (-6, 2), (6, 2)]):
-                pygame.draw.circle(screen, (255, 0, 0), (int(self.x + eye_x), int(self.y + eye_y)), 5)
-                pygame.draw.circle(screen, (255, 100, 100), (int(self.x + eye_x), int(self.y + eye_y)), 2)
+                pygame.draw.circle(screen, (255, 0, 0), (int(x + eye_x), int(y + eye_y)), 5)
+                pygame.draw.circle(screen, (255, 100, 100), (int(x + eye_x), int(y + eye_y)), 2)
             
             # Health bar
             health_bar_width = 40
             health_bar_height = 5
-            health_x = self.x - health_bar_width // 2
-            health_y = self.y - 40
+            health_x = x - health_bar_width // 2
+            health_y = y - 40
             pygame.draw.rect(screen, BLACK, (health_x, health_y, health_bar_width, health_bar_height))
             health_width = (self.health / 8) * health_bar_width
             pygame.draw.rect(screen, (255, 0, 0), (health_x, health_y, health_width, health_bar_height))
@@ -3529,108 +4506,652 @@ class NoisyMonster:
         elif self.monster_type == "swarm_enemy":
             # Small, fast swarm enemy
             # Body - small and agile
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 8)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), 8)
             # Wings
-            pygame.draw.ellipse(screen, (255, 200, 0), (self.x - 12, self.y - 4, 8, 4))
-            pygame.draw.ellipse(screen, (255, 200, 0), (self.x + 4, self.y - 4, 8, 4))
+            pygame.draw.ellipse(screen, (255, 200, 0), (x - 12, y - 4, 8, 4))
+            pygame.draw.ellipse(screen, (255, 200, 0), (x + 4, y - 4, 8, 4))
             # Eyes
-            pygame.draw.circle(screen, (255, 255, 0), (int(self.x - 2), int(self.y - 2)), 2)
-            pygame.draw.circle(screen, (255, 255, 0), (int(self.x + 2), int(self.y - 2)), 2)
+            pygame.draw.circle(screen, (255, 255, 0), (int(x - 2), int(y - 2)), 2)
+            pygame.draw.circle(screen, (255, 255, 0), (int(x + 2), int(y - 2)), 2)
             
         elif self.monster_type == "teleporting_ghost":
             # Ghost that can teleport
             # Main body - wavy and ethereal
             points = [
-                (self.x - 10, self.y - 6),
-                (self.x + 10, self.y - 6),
-                (self.x + 8, self.y + 2),
-                (self.x + 4, self.y + 6),
-                (self.x, self.y + 3),
-                (self.x - 4, self.y + 6),
-                (self.x - 8, self.y + 2)
+                (x - 10, y - 6),
+                (x + 10, y - 6),
+                (x + 8, y + 2),
+                (x + 4, y + 6),
+                (x, y + 3),
+                (x - 4, y + 6),
+                (x - 8, y + 2)
             ]
             pygame.draw.polygon(screen, self.color, points)
             # Teleportation sparkles
             for i in range(3):
-                sparkle_x = self.x + random.randint(-15, 15)
-                sparkle_y = self.y + random.randint(-15, 15)
+                sparkle_x = x + rng.randint(-15, 15)
+                sparkle_y = y + rng.randint(-15, 15)
                 pygame.draw.circle(screen, (255, 255, 255), (int(sparkle_x), int(sparkle_y)), 1)
             # Glowing purple eyes
-            pygame.draw.circle(screen, (255, 0, 255), (int(self.x - 3), int(self.y - 3)), 2)
-            pygame.draw.circle(screen, (255, 0, 255), (int(self.x + 3), int(self.y - 3)), 2)
+            pygame.draw.circle(screen, (255, 0, 255), (int(x - 3), int(y - 3)), 2)
+            pygame.draw.circle(screen, (255, 0, 255), (int(x + 3), int(y - 3)), 2)
             
         elif self.monster_type == "shielded_knight":
             # Knight with protective shield
             # Body - armored
-            pygame.draw.rect(screen, self.color, (self.x - 10, self.y - 8, 20, 16))
+            pygame.draw.rect(screen, self.color, (x - 10, y - 8, 20, 16))
             # Shield
-            if hasattr(self, 'shield_health') and self.shield_health > 0:
-                pygame.draw.circle(screen, (200, 200, 255), (int(self.x - 15), int(self.y)), 8)
-                pygame.draw.circle(screen, (100, 100, 255), (int(self.x - 15), int(self.y)), 8, 2)
+            if self.shield_health > 0:
+                pygame.draw.circle(screen, (200, 200, 255), (int(x - 15), int(y)), 8)
+                pygame.draw.circle(screen, (100, 100, 255), (int(x - 15), int(y)), 8, 2)
             # Helmet
-            pygame.draw.circle(screen, (100, 100, 100), (int(self.x), int(self.y - 8)), 8)
+            pygame.draw.circle(screen, (100, 100, 100), (int(x), int(y - 8)), 8)
             # Eyes
-            pygame.draw.circle(screen, (255, 0, 0), (int(self.x - 2), int(self.y - 8)), 2)
-            pygame.draw.circle(screen, (255, 0, 0), (int(self.x + 2), int(self.y - 8)), 2)
+            pygame.draw.circle(screen, (255, 0, 0), (int(x - 2), int(y - 8)), 2)
+            pygame.draw.circle(screen, (255, 0, 0), (int(x + 2), int(y - 8)), 2)
             
         elif self.monster_type == "exploding_bomb":
             # Bomb that explodes after time
             # Main body - bomb shape
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 10)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), 10)
             # Fuse
-            pygame.draw.line(screen, (255, 255, 0), (self.x, self.y - 10), (self.x, self.y - 15), 2)
+            pygame.draw.line(screen, (255, 255, 0), (x, y - 10), (x, y - 15), 2)
             # Warning light
-            if hasattr(self, 'explosion_timer'):
-                if (self.explosion_timer // 500) % 2:  # Blink every 500ms
-                    pygame.draw.circle(screen, (255, 0, 0), (int(self.x), int(self.y)), 3)
+            if (self.explosion_timer // 500) % 2:  # Blink every 500ms
+                pygame.draw.circle(screen, (255, 0, 0), (int(x), int(y)), 3)
             # Danger symbol
-            pygame.draw.line(screen, (255, 255, 255), (self.x - 3, self.y - 3), (self.x + 3, self.y + 3), 2)
-            pygame.draw.line(screen, (255, 255, 255), (self.x + 3, self.y - 3), (self.x - 3, self.y + 3), 2)
+            pygame.draw.line(screen, (255, 255, 255), (x - 3, y - 3), (x + 3, y + 3), 2)
+            pygame.draw.line(screen, (255, 255, 255), (x + 3, y - 3), (x - 3, y + 3), 2)
             
-        else:  # chaos_lord
-            # Powerful boss enemy - larger and more menacing
+        elif self.monster_type in ("chaos_lord", "book_worm", "noise_demon"):
+            # Powerful boss enemy - larger and more menacing (book worms and noise demons share the look)
             # Main body - dark and imposing
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 20)
-            pygame.draw.circle(screen, (150, 0, 0), (int(self.x), int(self.y)), 20, 3)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), 20)
+            pygame.draw.circle(screen, (150, 0, 0), (int(x), int(y)), 20, 3)
             
             # Crown of chaos
             crown_points = [
-                (self.x - 15, self.y - 15),
-                (self.x - 10, self.y - 25),
-                (self.x - 5, self.y - 20),
-                (self.x, self.y - 30),
-                (self.x + 5, self.y - 20),
-                (self.x + 10, self.y - 25),
-                (self.x + 15, self.y - 15)
+                (x - 15, y - 15),
+                (x - 10, y - 25),
+                (x - 5, y - 20),
+                (x, y - 30),
+                (x + 5, y - 20),
+                (x + 10, y - 25),
+                (x + 15, y - 15)
             ]
             pygame.draw.polygon(screen, (100, 0, 0), crown_points)
             
             # Multiple glowing eyes
             for i, (eye_x, eye_y) in enumerate([(-8, -8), (8, -8), (-4, 0), (4, 0)]):
-                pygame.draw.circle(screen, (255, 50, 50), (int(self.x + eye_x), int(self.y + eye_y)), 4)
-                pygame.draw.circle(screen, (255, 150, 150), (int(self.x + eye_x), int(self.y + eye_y)), 2)
+                pygame.draw.circle(screen, (255, 50, 50), (int(x + eye_x), int(y + eye_y)), 4)
+                pygame.draw.circle(screen, (255, 150, 150), (int(x + eye_x), int(y + eye_y)), 2)
             
             # Health indicator
             health_bar_width = 30
             health_bar_height = 4
-            health_x = self.x - health_bar_width // 2
-            health_y = self.y - 35
+            health_x = x - health_bar_width // 2
+            health_y = y - 35
             
             # Background
             pygame.draw.rect(screen, BLACK, (health_x, health_y, health_bar_width, health_bar_height))
             # Health
             health_width = (self.health / 3) * health_bar_width
             pygame.draw.rect(screen, (255, 0, 0), (health_x, health_y, health_width, health_bar_height))
+            
+        else:
+            # Type added by an archetype table: a plain body in its own colour and size
+            body = pygame.Rect(0, 0, self.width, self.height)
+            body.center = (int(x), int(y))
+            pygame.draw.ellipse(screen, self.color, body)
+            pygame.draw.ellipse(screen, BLACK, body, 2)
+            # Eyes
+            eye_y = int(y - self.height // 6)
+            for eye_x in (int(x - self.width // 5), int(x + self.width // 5)):
+                pygame.draw.circle(screen, CREAM, (eye_x, eye_y), 3)
+                pygame.draw.circle(screen, BLACK, (eye_x, eye_y), 1)
+            # One pip per remaining hit once it takes more than one
+            if self.health > 1:
+                for i in range(self.health):
+                    pip_x = int(x - (self.health - 1) * 3 + i * 6)
+                    pygame.draw.circle(screen, (255, 0, 0), (pip_x, body.top - 6), 2)
+
+class MonsterEngine:
+    """Struct-of-arrays store that moves every attached monster in one NumPy pass"""
+    
+    # Columns mirrored from NoisyMonster attributes while a monster is attached
+    FIELDS = {
+        'x': np.float64,
+        'y': np.float64,
+        'speed': np.float64,
+        'target_x': np.float64,
+        'target_y': np.float64,
+        'health': np.int64,
+        'path_update_timer': np.int64,
+    }
+    
+    # Monster types whose update_behaviour has to run in Python every frame
+    BEHAVIOUR_TYPES = ("teleporting_ghost", "exploding_bomb")
+    
+    def __init__(self, maze, flow_field=None, capacity=64):
+        self.flow_field = flow_field
+        self.capacity = capacity
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in self.FIELDS.items()}
+        self.active = np.zeros(capacity, dtype=bool)
+        self.monsters = [None] * capacity
+        self.free_slots = list(range(capacity - 1, -1, -1))
+        self.behaviour_slots = set()
+        self.set_maze(maze)
+    
+    def set_maze(self, maze):
+        """Take a NumPy copy of the maze walls for the batched wall test"""
+        self.maze = maze
+        self.blocked = maze.tile_array == WALL
+    
+    def grow(self):
+        """Double the capacity of every column"""
+        old_capacity = self.capacity
+        self.capacity *= 2
+        for name, column in self.columns.items():
+            grown = np.zeros(self.capacity, dtype=column.dtype)
+            grown[:old_capacity] = column
+            self.columns[name] = grown
+        active = np.zeros(self.capacity, dtype=bool)
+        active[:old_capacity] = self.active
+        self.active = active
+        self.monsters.extend([None] * old_capacity)
+        self.free_slots.extend(range(self.capacity - 1, old_capacity - 1, -1))
+    
+    def attach(self, monster):
+        """Move a monster's state into the arrays and return its slot"""
+        if not self.free_slots:
+            self.grow()
+        slot = self.free_slots.pop()
+        for name in self.FIELDS:
+            self.columns[name][slot] = getattr(monster, '_' + name)
+        self.active[slot] = True
+        self.monsters[slot] = monster
+        if monster.monster_type in self.BEHAVIOUR_TYPES:
+            self.behaviour_slots.add(slot)
+        return slot
+    
+    def release(self, monster):
+        """Copy a monster's state back out of the arrays and free its slot"""
+        slot = monster.slot
+        if slot is None:
+            return
+        for name in self.FIELDS:
+            setattr(monster, '_' + name, self.columns[name][slot].item())
+        monster.slot = None
+        self.active[slot] = False
+        self.monsters[slot] = None
+        self.behaviour_slots.discard(slot)
+        self.free_slots.append(slot)
+    
+    def passable(self, xs, ys):
+        """Vectorised NoisyMonster.can_move_to_simple"""
+        tile_xs = np.floor(xs / TILE_SIZE).astype(np.intp)
+        tile_ys = np.floor(ys / TILE_SIZE).astype(np.intp)
+        inside = ((xs >= 0) & (xs <= SCREEN_WIDTH) & (ys >= 0) & (ys <= SCREEN_HEIGHT) &
+                  (tile_xs >= 0) & (tile_xs < self.maze.width) &
+                  (tile_ys >= 0) & (tile_ys < self.maze.height))
+        tile_xs = np.clip(tile_xs, 0, self.maze.width - 1)
+        tile_ys = np.clip(tile_ys, 0, self.maze.height - 1)
+        return inside & ~self.blocked[tile_ys, tile_xs]
+    
+    def step(self, player_x, player_y):
+        """Run one NoisyMonster.update for every attached monster"""
+        moving = self.active.copy()
+        
+        # Special abilities stay in Python and write through the monster views
+        for slot in list(self.behaviour_slots):
+            monster = self.monsters[slot]
+            monster.player_x = player_x
+            monster.player_y = player_y
+            if not monster.update_behaviour():
+                moving[slot] = False
+        
+        idx = np.flatnonzero(moving)
+        if len(idx) == 0:
+            return
+        
+        columns = self.columns
+        timers = columns['path_update_timer']
+        timers[idx] += 1
+        
+        # Update target every 5 frames (chase player, or centre if unknown)
+        retarget = idx[timers[idx] % 5 == 0]
+        if player_x != 0 and player_y != 0:
+            columns['target_x'][retarget] = player_x
+            columns['target_y'][retarget] = player_y
+        else:
+            columns['target_x'][retarget] = SCREEN_WIDTH // 2
+            columns['target_y'][retarget] = SCREEN_HEIGHT // 2
+        
+        old_x = columns['x'][idx]
+        old_y = columns['y'][idx]
+        goal_x = columns['target_x'][idx]
+        goal_y = columns['target_y'][idx]
+        if self.flow_field is not None:
+            # Follow the shared flow field; chase directly in the player's tile
+            step_x, step_y = self.flow_field.next_steps(old_x, old_y)
+            on_path = ~np.isnan(step_x)
+            goal_x = np.where(on_path, step_x, goal_x)
+            goal_y = np.where(on_path, step_y, goal_y)
+        dx = goal_x - old_x
+        dy = goal_y - old_y
+        distance = np.sqrt(dx * dx + dy * dy)
+        
+        # Don't jitter when very close
+        far = distance > 2
+        idx, old_x, old_y = idx[far], old_x[far], old_y[far]
+        dx, dy, distance = dx[far], dy[far], distance[far]
+        speed = columns['speed'][idx]
+        new_x = old_x + dx / distance * speed
+        new_y = old_y + dy / distance * speed
+        
+        if self.flow_field is not None:
+            # Same fallbacks as the scalar path: both axes, horizontal, vertical, else stay put
+            passable = self.flow_field.passable_points
+            both = passable(new_x, new_y)
+            horizontal = passable(new_x, old_y)
+            vertical = passable(old_x, new_y)
+            stranded = ~passable(old_x, old_y)
+            columns['x'][idx] = np.where(both | horizontal | stranded, new_x, old_x)
+            columns['y'][idx] = np.where(both | (~horizontal & vertical) | stranded, new_y, old_y)
+        else:
+            # Walls only: both axes, horizontal, vertical, then move anyway
+            both = self.passable(new_x, new_y)
+            horizontal = self.passable(new_x, old_y)
+            vertical = self.passable(old_x, new_y)
+            columns['x'][idx] = np.where(~both & ~horizontal & vertical, old_x, new_x)
+            columns['y'][idx] = np.where(~both & horizontal, old_y, new_y)
+
+def _engine_column(name):
+    """Property that reads an EngineMonster field from the engine while attached"""
+    local = '_' + name
+    
+    def getter(self):
+        if self.slot is None:
+            return getattr(self, local)
+        return self.engine.columns[name][self.slot].item()
+    
+    def setter(self, value):
+        if self.slot is None:
+            setattr(self, local, value)
+        else:
+            self.engine.columns[name][self.slot] = value
+    
+    return property(getter, setter)
+
+class EngineMonster(NoisyMonster):
+    """NoisyMonster whose movement state lives in a MonsterEngine"""
+    
+    # Engine fields are kept in the underscored slots only while detached
+    __slots__ = ('engine', 'slot') + tuple('_' + name for name in MonsterEngine.FIELDS)
+    
+    x = _engine_column('x')
+    y = _engine_column('y')
+    speed = _engine_column('speed')
+    target_x = _engine_column('target_x')
+    target_y = _engine_column('target_y')
+    health = _engine_column('health')
+    path_update_timer = _engine_column('path_update_timer')
+    
+    def __init__(self, engine, monster_type=None, maze=None, flow_field=None, archetypes=MONSTER_ARCHETYPES, rng=random):
+        self.engine = engine
+        self.slot = None
+        super().__init__(monster_type, maze, flow_field, archetypes, rng)
+    
+    def reset(self, monster_type=None, maze=None, flow_field=None, archetypes=MONSTER_ARCHETYPES, rng=random):
+        # Fields are set locally while detached, then moved into a fresh engine slot
+        self.engine.release(self)
+        super().reset(monster_type, maze, flow_field, archetypes, rng)
+        self.slot = self.engine.attach(self)
+    
+    def update(self):
+        # Movement is driven by MonsterEngine.step
+        pass
+
+class MonsterPool:
+    """Free list of defeated monsters that spawns reset and hand back out"""
+    def __init__(self, archetypes=MONSTER_ARCHETYPES, engine=None):
+        self.archetypes = archetypes
+        self.engine = engine  # Pooled monsters are EngineMonsters bound to this engine, if given
+        self.free = []
+        self.in_use = 0
+        self.high_water = 0  # Most monsters alive at once
+        self.allocated = 0   # Instances ever constructed
+    
+    def acquire(self, monster_type=None, maze=None, flow_field=None, rng=random):
+        """Return a monster of the given type, reusing a released one when available"""
+        if self.free:
+            monster = self.free.pop()
+            monster.reset(monster_type, maze, flow_field, self.archetypes, rng)
+        else:
+            if self.engine is not None:
+                monster = EngineMonster(self.engine, monster_type, maze, flow_field, self.archetypes, rng)
+            else:
+                monster = NoisyMonster(monster_type, maze, flow_field, self.archetypes, rng)
+            self.allocated += 1
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        return monster
+    
+    def release(self, monsters):
+        """Take back monsters that have left play for good"""
+        self.free.extend(monsters)
+        self.in_use -= len(monsters)
+    
+    def stats(self):
+        """High-water marks for tuning the pool"""
+        return {
+            'in_use': self.in_use,
+            'free': len(self.free),
+            'high_water': self.high_water,
+            'allocated': self.allocated,
+        }
+
+class AliasTable:
+    """Walker/Vose alias table: O(1) weighted choice from one random() call"""
+    def __init__(self, items, weights):
+        self.items = list(items)
+        count = len(self.items)
+        total = float(sum(weights))
+        scaled = [weight * count / total for weight in weights]
+        self.probability = [1.0] * count
+        self.alias = list(range(count))
+        
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            self.probability[low] = scaled[low]
+            self.alias[low] = high
+            # The large column donates what the small one lacks
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+    
+    def sample(self, rng=random):
+        """Pick a column with the integer part of one draw and flip its coin with the fraction"""
+        draw = rng.random() * len(self.items)
+        column = int(draw)
+        if draw - column < self.probability[column]:
+            return self.items[column]
+        return self.items[self.alias[column]]
+
+class SpawnDirector:
+    """Precomputed spawn schedule: type tables per time band, delay curve per difficulty, next wave planned ahead"""
+    # Spawn rates scale with difficulty
+    DIFFICULTY_MULTIPLIER = {
+        DIFFICULTY_EASY: 0.7,
+        DIFFICULTY_NORMAL: 1.0,
+        DIFFICULTY_HARD: 1.4,
+        DIFFICULTY_EXPERT: 1.8
+    }
+    
+    # Spawn delay shrinks linearly, reaching half after 60 seconds (2 minutes to reach zero, clamped at 0.5)
+    CURVE_END = 60000
+    
+    def __init__(self, base_delay=1500, archetypes=MONSTER_ARCHETYPES, difficulty_multiplier=None):
+        self.archetypes = archetypes
+        self.bands = self.time_bands(archetypes)
+        
+        # Spawn delay in ms for every millisecond up to CURVE_END, per difficulty
+        times = np.arange(self.CURVE_END + 1)
+        time_difficulty_factor = np.maximum(0.5, 1.0 - (times / 120000))
+        self.delay_curves = {
+            difficulty: (base_delay * time_difficulty_factor * multiplier).astype(np.int32)
+            for difficulty, multiplier in (difficulty_multiplier or self.DIFFICULTY_MULTIPLIER).items()
+        }
+    
+    @staticmethod
+    def time_bands(archetypes):
+        """(starts after this many ms, alias table) per band, latest first, from each type's spawn_weights"""
+        starts = sorted({start for row in archetypes.values() for start, _ in row.spawn_weights}, reverse=True)
+        bands = []
+        for band_start in starts:
+            types = []
+            weights = []
+            for monster_type, row in archetypes.items():
+                # A type keeps the weight of its latest step that has begun
+                steps = [step for step in row.spawn_weights if step[0] <= band_start]
+                weight = max(steps)[1] if steps else 0
+                if weight > 0:
+                    types.append(monster_type)
+                    weights.append(weight)
+            if types:
+                bands.append((band_start, AliasTable(types, weights)))
+        return bands
+    
+    def spawn_delay(self, difficulty, time):
+        """Milliseconds between regular spawns at this point of the game"""
+        return int(self.delay_curves[difficulty][min(int(time), self.CURVE_END)])
+    
+    def pick_type(self, time, rng=random):
+        """Monster type for a spawn at the given time, from that band's alias table"""
+        for start, table in self.bands:
+            if time > start:
+                return table.sample(rng)
+        return self.bands[-1][1].sample(rng)  # Very first millisecond
+    
+    def spawn_count(self, difficulty, rng=random):
+        """How many monsters one regular spawn brings"""
+        # Spawn multiple enemies on higher difficulties
+        spawn_count = 1
+        if difficulty >= DIFFICULTY_HARD and rng.random() < 0.4:
+            spawn_count = 2
+        if difficulty == DIFFICULTY_EXPERT and rng.random() < 0.3:
+            spawn_count = 3
+        # Even on normal difficulty, occasionally spawn 2 enemies
+        if difficulty == DIFFICULTY_NORMAL and rng.random() < 0.15:
+            spawn_count = 2
+        return spawn_count
+    
+    def spawn_group(self, difficulty, time, rng=random):
+        """Monster types for one regular spawn"""
+        return [self.pick_type(time, rng) for _ in range(self.spawn_count(difficulty, rng))]
+    
+    def plan_wave(self, wave_number, difficulty, time, rng=random):
+        """Monster types for a whole wave, drawn ahead of time so starting it is just spawning"""
+        # Spawn more enemies each wave
+        enemies_to_spawn = min(3 + wave_number, 8)  # Cap at 8 enemies per wave
+        wave = []
+        for _ in range(enemies_to_spawn):
+            wave.extend(self.spawn_group(difficulty, time, rng))
+        return wave
+
+# Book registries: built once at import and shared read-only by every Book
+@dataclass(frozen=True)
+class Genre:
+    """Look, damage and quotations shared by every book of a literary genre"""
+    color: tuple
+    damage: int
+    effect: str
+    quotes: tuple
+    authors: tuple
+
+@dataclass(frozen=True)
+class BookType:
+    """Size, speed and damage shared by every book of a binding type"""
+    width: int
+    height: int
+    speed: int
+    damage: int
+    color: tuple
+    description: str
+
+GENRES = MappingProxyType({
+    "classic": Genre(
+        color=(139, 69, 19),  # Brown leather
+        damage=2,
+        effect="wisdom",
+        quotes=(
+            "It was the best of times, it was the worst of times",
+            "To be or not to be, that is the question",
+            "All happy families are alike",
+            "It is a truth universally acknowledged"
+        ),
+        authors=("Dickens", "Shakespeare", "Tolstoy", "Austen"),
+    ),
+    "mystery": Genre(
+        color=(47, 79, 79),  # Dark slate gray
+        damage=3,
+        effect="investigation",
+        quotes=(
+            "Elementary, my dear Watson",
+            "The butler did it",
+            "Ten little Indians",
+            "Murder on the Orient Express"
+        ),
+        authors=("Doyle", "Christie", "Poe", "Chandler"),
+    ),
+    "fantasy": Genre(
+        color=(138, 43, 226),  # Blue violet
+        damage=4,
+        effect="magic",
+        quotes=(
+            "You shall not pass!",
+            "Winter is coming",
+            "A wizard is never late",
+            "Not all those who wander are lost"
+        ),
+        authors=("Tolkien", "Martin", "Rowling", "Lewis"),
+    ),
+    "romance": Genre(
+        color=(255, 20, 147),  # Deep pink
+        damage=1,
+        effect="charm",
+        quotes=(
+            "Reader, I married him",
+            "You have bewitched me, body and soul",
+            "Whatever our souls are made of",
+            "I am no bird; and no net ensnares me"
+        ),
+        authors=("Brontë", "Austen", "E. Brontë", "C. Brontë"),
+    ),
+    "horror": Genre(
+        color=(139, 0, 0),  # Dark red
+        damage=5,
+        effect="fear",
+        quotes=(
+            "Here's Johnny!",
+            "All work and no play...",
+            "The call is coming from inside the house",
+            "We all float down here"
+        ),
+        authors=("King", "Poe", "Lovecraft", "Shelley"),
+    ),
+    "poetry": Genre(
+        color=(255, 215, 0),  # Gold
+        damage=1,
+        effect="inspiration",
+        quotes=(
+            "Two roads diverged in a yellow wood",
+            "Shall I compare thee to a summer's day?",
+            "Because I could not stop for Death",
+            "I took the one less traveled by"
+        ),
+        authors=("Frost", "Shakespeare", "Dickinson", "Whitman"),
+    ),
+    "philosophy": Genre(
+        color=(75, 0, 130),  # Indigo
+        damage=2,
+        effect="enlightenment",
+        quotes=(
+            "I think, therefore I am",
+            "The unexamined life is not worth living",
+            "God is dead",
+            "Man is condemned to be free"
+        ),
+        authors=("Descartes", "Socrates", "Nietzsche", "Sartre"),
+    ),
+    "history": Genre(
+        color=(160, 82, 45),  # Saddle brown
+        damage=3,
+        effect="knowledge",
+        quotes=(
+            "Those who cannot remember the past...",
+            "History is written by the victors",
+            "The only thing we learn from history...",
+            "A people without history..."
+        ),
+        authors=("Santayana", "Churchill", "Hegel", "Baldwin"),
+    ),
+    "science": Genre(
+        color=(0, 100, 0),  # Dark green
+        damage=3,
+        effect="logic",
+        quotes=(
+            "The important thing is not to stop questioning",
+            "Science is a way of thinking",
+            "Any sufficiently advanced technology...",
+            "The cosmos is within us"
+        ),
+        authors=("Einstein", "Sagan", "Clarke", "Hawking"),
+    )
+})
+GENRE_NAMES = tuple(GENRES)
+
+BOOK_TYPES = MappingProxyType({
+    "paperback": BookType(
+        width=15,
+        height=20,
+        speed=10,
+        damage=1,
+        color=(200, 150, 100),  # Light brown
+        description="Fast and light",
+    ),
+    "hardcover": BookType(
+        width=18,
+        height=22,
+        speed=7,
+        damage=2,
+        color=(139, 69, 19),  # Saddle brown
+        description="Heavy and powerful",
+    ),
+    "encyclopedia": BookType(
+        width=25,
+        height=30,
+        speed=4,
+        damage=4,
+        color=(75, 0, 130),  # Indigo
+        description="Massive damage, slow",
+    ),
+    "magical_tome": BookType(
+        width=20,
+        height=25,
+        speed=8,
+        damage=2,
+        color=(128, 0, 128),  # Purple
+        description="Special effects",
+    )
+})
+BOOK_TYPE_NAMES = tuple(BOOK_TYPES)
 
 class Book:
-    def __init__(self, x, y, target_pos, is_mega=False, genre=None, book_type=None):
+    __slots__ = (
+        'x', 'y', 'dx', 'dy', 'dead', 'is_mega', 'book_type', 'genre', 'type_info', 'genre_info',
+        'width', 'height', 'speed', 'damage', 'color', 'quote', 'author',
+    )
+    
+    # Baked covers shared by every book, keyed by (book_type, genre, is_mega)
+    sprite_cache = {}
+    SPRITE_MARGIN = 8  # Transparent border around the cover while baking
+    
+    def __init__(self, x, y, target_pos, is_mega=False, genre=None, book_type=None, rng=random):
         self.x = x
         self.y = y
+        self.dead = False  # Set by EntityList.kill, dropped at the end of the tick
         self.is_mega = is_mega
         
         # Book type determines base properties
-        self.book_type = book_type or random.choice(["paperback", "hardcover", "encyclopedia", "magical_tome"])
-        self.set_book_type_properties()
+        self.book_type = book_type or rng.choice(BOOK_TYPE_NAMES)
+        self.type_info = BOOK_TYPES.get(self.book_type, BOOK_TYPES["paperback"])
+        self.width = self.type_info.width
+        self.height = self.type_info.height
+        self.speed = self.type_info.speed
+        self.damage = self.type_info.damage
         
         # Adjust size for mega books
         if is_mega:
@@ -3639,17 +5160,12 @@ class Book:
             self.speed *= 1.2
             self.damage *= 2
         
-        # Literary genres with special properties
-        if genre:
-            self.genre = genre
-        else:
-            self.genre = random.choice([
-                "classic", "mystery", "fantasy", "romance", "horror", 
-                "poetry", "philosophy", "history", "science"
-            ])
-        
-        # Genre-specific properties
-        self.set_genre_properties()
+        # Literary genres with special properties and famous quotes
+        self.genre = genre or rng.choice(GENRE_NAMES)
+        self.genre_info = GENRES.get(self.genre, GENRES["classic"])
+        self.damage = self.genre_info.damage
+        self.quote = rng.choice(self.genre_info.quotes)
+        self.author = rng.choice(self.genre_info.authors)
         
         if is_mega:
             self.color = (255, 165, 0)  # Golden mega book
@@ -3668,185 +5184,66 @@ class Book:
             self.dx = 0
             self.dy = 0
     
-    def set_genre_properties(self):
-        """Set genre-specific properties and famous quotes"""
-        genre_data = {
-            "classic": {
-                "color": (139, 69, 19),  # Brown leather
-                "damage": 2,
-                "effect": "wisdom",
-                "quotes": [
-                    "It was the best of times, it was the worst of times",
-                    "To be or not to be, that is the question",
-                    "All happy families are alike",
-                    "It is a truth universally acknowledged"
-                ],
-                "authors": ["Dickens", "Shakespeare", "Tolstoy", "Austen"]
-            },
-            "mystery": {
-                "color": (47, 79, 79),  # Dark slate gray
-                "damage": 3,
-                "effect": "investigation",
-                "quotes": [
-                    "Elementary, my dear Watson",
-                    "The butler did it",
-                    "Ten little Indians",
-                    "Murder on the Orient Express"
-                ],
-                "authors": ["Doyle", "Christie", "Poe", "Chandler"]
-            },
-            "fantasy": {
-                "color": (138, 43, 226),  # Blue violet
-                "damage": 4,
-                "effect": "magic",
-                "quotes": [
-                    "You shall not pass!",
-                    "Winter is coming",
-                    "A wizard is never late",
-                    "Not all those who wander are lost"
-                ],
-                "authors": ["Tolkien", "Martin", "Rowling", "Lewis"]
-            },
-            "romance": {
-                "color": (255, 20, 147),  # Deep pink
-                "damage": 1,
-                "effect": "charm",
-                "quotes": [
-                    "Reader, I married him",
-                    "You have bewitched me, body and soul",
-                    "Whatever our souls are made of",
-                    "I am no bird; and no net ensnares me"
-                ],
-                "authors": ["Brontë", "Austen", "E. Brontë", "C. Brontë"]
-            },
-            "horror": {
-                "color": (139, 0, 0),  # Dark red
-                "damage": 5,
-                "effect": "fear",
-                "quotes": [
-                    "Here's Johnny!",
-                    "All work and no play...",
-                    "The call is coming from inside the house",
-                    "We all float down here"
-                ],
-                "authors": ["King", "Poe", "Lovecraft", "Shelley"]
-            },
-            "poetry": {
-                "color": (255, 215, 0),  # Gold
-                "damage": 1,
-                "effect": "inspiration",
-                "quotes": [
-                    "Two roads diverged in a yellow wood",
-                    "Shall I compare thee to a summer's day?",
-                    "Because I could not stop for Death",
-                    "I took the one less traveled by"
-                ],
-                "authors": ["Frost", "Shakespeare", "Dickinson", "Whitman"]
-            },
-            "philosophy": {
-                "color": (75, 0, 130),  # Indigo
-                "damage": 2,
-                "effect": "enlightenment",
-                "quotes": [
-                    "I think, therefore I am",
-                    "The unexamined life is not worth living",
-                    "God is dead",
-                    "Man is condemned to be free"
-                ],
-                "authors": ["Descartes", "Socrates", "Nietzsche", "Sartre"]
-            },
-            "history": {
-                "color": (160, 82, 45),  # Saddle brown
-                "damage": 3,
-                "effect": "knowledge",
-                "quotes": [
-                    "Those who cannot remember the past...",
-                    "History is written by the victors",
-                    "The only thing we learn from history...",
-                    "A people without history..."
-                ],
-                "authors": ["Santayana", "Churchill", "Hegel", "Baldwin"]
-            },
-            "science": {
-                "color": (0, 100, 0),  # Dark green
-                "damage": 3,
-                "effect": "logic",
-                "quotes": [
-                    "The important thing is not to stop questioning",
-                    "Science is a way of thinking",
-                    "Any sufficiently advanced technology...",
-                    "The cosmos is within us"
-                ],
-                "authors": ["Einstein", "Sagan", "Clarke", "Hawking"]
-            }
-        }
-        
-        data = genre_data.get(self.genre, genre_data["classic"])
-        self.genre_color = data["color"]
-        self.damage = data["damage"]
-        self.effect = data["effect"]
-        self.quote = random.choice(data["quotes"])
-        self.author = random.choice(data["authors"])
-    
-    def set_book_type_properties(self):
-        """Set properties based on book type"""
-        book_type_data = {
-            "paperback": {
-                "width": 15,
-                "height": 20,
-                "speed": 10,
-                "damage": 1,
-                "color": (200, 150, 100),  # Light brown
-                "description": "Fast and light"
-            },
-            "hardcover": {
-                "width": 18,
-                "height": 22,
-                "speed": 7,
-                "damage": 2,
-                "color": (139, 69, 19),  # Saddle brown
-                "description": "Heavy and powerful"
-            },
-            "encyclopedia": {
-                "width": 25,
-                "height": 30,
-                "speed": 4,
-                "damage": 4,
-                "color": (75, 0, 130),  # Indigo
-                "description": "Massive damage, slow"
-            },
-            "magical_tome": {
-                "width": 20,
-                "height": 25,
-                "speed": 8,
-                "damage": 2,
-                "color": (128, 0, 128),  # Purple
-                "description": "Special effects"
-            }
-        }
-        
-        data = book_type_data.get(self.book_type, book_type_data["paperback"])
-        self.width = data["width"]
-        self.height = data["height"]
-        self.speed = data["speed"]
-        self.damage = data["damage"]
-        self.book_color = data["color"]
-        self.description = data["description"]
+    @property
+    def genre_color(self):
+        return self.genre_info.color
+    
+    @property
+    def effect(self):
+        return self.genre_info.effect
+    
+    @property
+    def book_color(self):
+        return self.type_info.color
+    
+    @property
+    def description(self):
+        return self.type_info.description
     
     def update(self):
         self.x += self.dx
         self.y += self.dy
     
+    def get_hitbox(self):
+        """Collision box (left, top, width, height) matching the drawn cover"""
+        return (self.x, self.y, self.width, self.height)
+    
+    def get_draw_rect(self):
+        """Screen area draw() can touch, with room for the mega-book star"""
+        return pygame.Rect(self.x - 4, self.y - 4, self.width + 8, self.height + 8)
+    
     def draw(self, screen):
-        # Draw book with type-specific styling
+        # Blit the baked cover for this type, genre and mega state
+        key = (self.book_type, self.genre, self.is_mega)
+        baked = Book.sprite_cache.get(key)
+        if baked is None:
+            baked = self.bake_sprite()
+            Book.sprite_cache[key] = baked
+        sprite, (offset_x, offset_y) = baked
+        screen.blit(sprite, (int(self.x) + offset_x, int(self.y) + offset_y))
+    
+    def bake_sprite(self):
+        """Render draw_shape once onto a transparent canvas, cropped to the pixels it touched"""
+        margin = self.SPRITE_MARGIN
+        canvas = pygame.Surface((self.width + margin * 2, self.height + margin * 2), pygame.SRCALPHA)
+        self.draw_shape(canvas, margin, margin)
+        
+        crop = canvas.get_bounding_rect()
+        sprite = canvas.subsurface(crop).copy()
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite, (crop.x - margin, crop.y - margin)
+    
+    def draw_shape(self, screen, x, y):
+        # Draw book with type-specific styling, top-left corner at (x, y)
         if self.is_mega:
             # Mega book - enhanced version of book type
-            pygame.draw.rect(screen, self.book_color, (self.x, self.y, self.width, self.height))
+            pygame.draw.rect(screen, self.book_color, (x, y, self.width, self.height))
             # Gold binding for mega books
-            pygame.draw.rect(screen, GOLD, (self.x, self.y, self.width, self.height), 2)
+            pygame.draw.rect(screen, GOLD, (x, y, self.width, self.height), 2)
             # Mystical star symbol
-            center_x = self.x + self.width // 2
-            center_y = self.y + self.height // 2
+            center_x = x + self.width // 2
+            center_y = y + self.height // 2
             pygame.draw.polygon(screen, GOLD, [
                 (center_x, center_y - 8),
                 (center_x + 3, center_y - 3),
@@ -3875,13 +5272,13 @@ class Book:
         else:
             # Book type and genre styling
             # Use book type color as base, genre color for accents
-            pygame.draw.rect(screen, self.book_color, (self.x, self.y, self.width, self.height))
+            pygame.draw.rect(screen, self.book_color, (x, y, self.width, self.height))
             # Add genre color border
-            pygame.draw.rect(screen, self.genre_color, (self.x, self.y, self.width, self.height), 1)
+            pygame.draw.rect(screen, self.genre_color, (x, y, self.width, self.height), 1)
             
             # Genre-specific decorations
-            center_x = self.x + self.width // 2
-            center_y = self.y + self.height // 2
+            center_x = x + self.width // 2
+            center_y = y + self.height // 2
             
             if self.genre == "fantasy":
                 # Magical sparkles
@@ -3914,162 +5311,307 @@ class Book:
                 pygame.draw.circle(screen, GOLD, (center_x, center_y), 3, 1)
             else:  # classic
                 # Classic binding lines
-                pygame.draw.line(screen, GOLD, (self.x + 2, self.y + 5), (self.x + self.width - 2, self.y + 5), 1)
-                pygame.draw.line(screen, GOLD, (self.x + 2, self.y + 8), (self.x + self.width - 2, self.y + 8), 1)
+                pygame.draw.line(screen, GOLD, (x + 2, y + 5), (x + self.width - 2, y + 5), 1)
+                pygame.draw.line(screen, GOLD, (x + 2, y + 8), (x + self.width - 2, y + 8), 1)
             
             # Leather binding effect
-            pygame.draw.rect(screen, tuple(max(0, c - 30) for c in self.color), (self.x, self.y, self.width, self.height), 1)
+            pygame.draw.rect(screen, tuple(max(0, c - 30) for c in self.color), (x, y, self.width, self.height), 1)
 
 class PowerUp:
-    def __init__(self):
+    __slots__ = ('x', 'y', 'width', 'height', 'speed', 'dead', 'type', 'color')
+    
+    # Baked icons shared by every power-up, keyed by type
+    sprite_cache = {}
+    SPRITE_CANVAS = 128  # Centre sits at 64, so float offsets round like they do on screen
+    
+    TYPES = [
+        "coffee", "mega_book", "silence_aura", "time_freeze",
+        "rare_manuscript", "reading_glasses", "bookworm_blessing",
+        "shield", "multi_shot", "magnet", "freeze_time"
+    ]
+    
+    # Colors based on type
+    COLORS = {
+        "coffee": (139, 69, 19),           # Brown
+        "mega_book": (255, 165, 0),        # Orange
+        "silence_aura": (100, 149, 237),   # Cornflower blue
+        "time_freeze": (255, 215, 0),      # Gold
+        "rare_manuscript": (128, 0, 128),  # Purple
+        "reading_glasses": (192, 192, 192), # Silver
+        "bookworm_blessing": (34, 139, 34), # Forest green
+        "shield": (255, 255, 255),         # White
+        "multi_shot": (255, 100, 0),       # Red-orange
+        "magnet": (75, 0, 130),            # Indigo
+        "freeze_time": (0, 255, 255)       # Cyan
+    }
+    
+    def __init__(self, rng=random):
         self.x = SCREEN_WIDTH + 50
-        self.y = random.randint(50, SCREEN_HEIGHT - 50)
+        self.y = rng.randint(50, SCREEN_HEIGHT - 50)
         self.width = 25
         self.height = 25
         self.speed = 2
-        self.type = random.choice([
-            "coffee", "mega_book", "silence_aura", "time_freeze",
-            "rare_manuscript", "reading_glasses", "bookworm_blessing",
-            "shield", "multi_shot", "magnet", "freeze_time"
-        ])
-        
-        # Set colors based on type
-        color_map = {
-            "coffee": (139, 69, 19),           # Brown
-            "mega_book": (255, 165, 0),        # Orange
-            "silence_aura": (100, 149, 237),   # Cornflower blue
-            "time_freeze": (255, 215, 0),      # Gold
-            "rare_manuscript": (128, 0, 128),  # Purple
-            "reading_glasses": (192, 192, 192), # Silver
-            "bookworm_blessing": (34, 139, 34), # Forest green
-            "shield": (255, 255, 255),         # White
-            "multi_shot": (255, 100, 0),       # Red-orange
-            "magnet": (75, 0, 130),            # Indigo
-            "freeze_time": (0, 255, 255)       # Cyan
-        }
-        self.color = color_map.get(self.type, (255, 255, 255))
+        self.dead = False  # Set by EntityList.kill, dropped at the end of the tick
+        self.type = rng.choice(self.TYPES)
+        self.color = self.COLORS.get(self.type, (255, 255, 255))
     
     def update(self):
         self.x -= self.speed
     
+    def get_draw_rect(self):
+        """Screen area draw() can touch, including the outer glow rings"""
+        return pygame.Rect(self.x - 25, self.y - 25, 50, 50)
+    
     def draw(self, screen):
-        # Draw power-up with dark academia styling
+        # Blit the baked icon for this type
+        baked = PowerUp.sprite_cache.get(self.type)
+        if baked is None:
+            baked = self.bake_sprite()
+            PowerUp.sprite_cache[self.type] = baked
+        sprite, (offset_x, offset_y) = baked
+        screen.blit(sprite, (int(self.x) + offset_x, int(self.y) + offset_y))
+    
+    def bake_sprite(self):
+        """Render draw_shape once onto a transparent canvas, cropped to the pixels it touched"""
+        canvas = pygame.Surface((self.SPRITE_CANVAS, self.SPRITE_CANVAS), pygame.SRCALPHA)
+        origin = self.SPRITE_CANVAS // 2
+        self.draw_shape(canvas, origin, origin)
+        
+        crop = canvas.get_bounding_rect()
+        sprite = canvas.subsurface(crop).copy()
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite, (crop.x - origin, crop.y - origin)
+    
+    def draw_shape(self, screen, x, y):
+        # Draw power-up with dark academia styling, centred on (x, y)
         if self.type == "coffee":
             # Vintage coffee cup with steam
-            pygame.draw.circle(screen, (139, 69, 19), (int(self.x), int(self.y)), 12)
+            pygame.draw.circle(screen, (139, 69, 19), (int(x), int(y)), 12)
             # Cup details
-            pygame.draw.arc(screen, GOLD, (self.x - 10, self.y - 8, 20, 16), 0, 3.14, 2)
+            pygame.draw.arc(screen, GOLD, (x - 10, y - 8, 20, 16), 0, 3.14, 2)
             # Handle
-            pygame.draw.arc(screen, GOLD, (self.x + 6, self.y - 4, 8, 8), 1.57, 3.14, 2)
+            pygame.draw.arc(screen, GOLD, (x + 6, y - 4, 8, 8), 1.57, 3.14, 2)
             # Steam
-            pygame.draw.line(screen, CREAM, (self.x - 2, self.y - 12), (self.x - 2, self.y - 18), 1)
-            pygame.draw.line(screen, CREAM, (self.x, self.y - 12), (self.x, self.y - 16), 1)
-            pygame.draw.line(screen, CREAM, (self.x + 2, self.y - 12), (self.x + 2, self.y - 18), 1)
+            pygame.draw.line(screen, CREAM, (x - 2, y - 12), (x - 2, y - 18), 1)
+            pygame.draw.line(screen, CREAM, (x, y - 12), (x, y - 16), 1)
+            pygame.draw.line(screen, CREAM, (x + 2, y - 12), (x + 2, y - 18), 1)
             # Glow effect
-            pygame.draw.circle(screen, AMBER, (int(self.x), int(self.y)), 15, 1)
+            pygame.draw.circle(screen, AMBER, (int(x), int(y)), 15, 1)
         elif self.type == "mega_book":
             # Ancient tome power-up
-            pygame.draw.rect(screen, (75, 0, 130), (self.x - 8, self.y - 10, 16, 20))
+            pygame.draw.rect(screen, (75, 0, 130), (x - 8, y - 10, 16, 20))
             # Gold binding
-            pygame.draw.rect(screen, GOLD, (self.x - 8, self.y - 10, 16, 20), 2)
+            pygame.draw.rect(screen, GOLD, (x - 8, y - 10, 16, 20), 2)
             # Mystical symbols
-            pygame.draw.circle(screen, GOLD, (int(self.x), int(self.y - 5)), 3, 1)
-            pygame.draw.circle(screen, GOLD, (int(self.x), int(self.y + 5)), 3, 1)
+            pygame.draw.circle(screen, GOLD, (int(x), int(y - 5)), 3, 1)
+            pygame.draw.circle(screen, GOLD, (int(x), int(y + 5)), 3, 1)
             # Glowing aura
-            pygame.draw.circle(screen, AMBER, (int(self.x), int(self.y)), 18, 1)
-            pygame.draw.circle(screen, AMBER, (int(self.x), int(self.y)), 20, 1)
+            pygame.draw.circle(screen, AMBER, (int(x), int(y)), 18, 1)
+            pygame.draw.circle(screen, AMBER, (int(x), int(y)), 20, 1)
         elif self.type == "silence_aura":
             # Mystical orb of silence
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 12)
-            pygame.draw.circle(screen, (150, 200, 255), (int(self.x), int(self.y)), 12, 2)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), 12)
+            pygame.draw.circle(screen, (150, 200, 255), (int(x), int(y)), 12, 2)
             # Floating runes
             for i, angle in enumerate([0, 60, 120, 180, 240, 300]):
-                rune_x = self.x + 8 * math.cos(math.radians(angle))
-                rune_y = self.y + 8 * math.sin(math.radians(angle))
+                rune_x = x + 8 * math.cos(math.radians(angle))
+                rune_y = y + 8 * math.sin(math.radians(angle))
                 pygame.draw.circle(screen, WHITE, (int(rune_x), int(rune_y)), 2)
             # Pulsing effect
-            pygame.draw.circle(screen, (200, 220, 255), (int(self.x), int(self.y)), 15, 1)
+            pygame.draw.circle(screen, (200, 220, 255), (int(x), int(y)), 15, 1)
         elif self.type == "shield":
             # Protective shield
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 12)
-            pygame.draw.circle(screen, (200, 200, 255), (int(self.x), int(self.y)), 12, 2)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), 12)
+            pygame.draw.circle(screen, (200, 200, 255), (int(x), int(y)), 12, 2)
             # Shield cross
-            pygame.draw.line(screen, (100, 100, 255), (self.x - 6, self.y), (self.x + 6, self.y), 2)
-            pygame.draw.line(screen, (100, 100, 255), (self.x, self.y - 6), (self.x, self.y + 6), 2)
+            pygame.draw.line(screen, (100, 100, 255), (x - 6, y), (x + 6, y), 2)
+            pygame.draw.line(screen, (100, 100, 255), (x, y - 6), (x, y + 6), 2)
             # Glow effect
-            pygame.draw.circle(screen, (150, 150, 255), (int(self.x), int(self.y)), 15, 1)
+            pygame.draw.circle(screen, (150, 150, 255), (int(x), int(y)), 15, 1)
         elif self.type == "multi_shot":
             # Multiple arrows
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 12)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), 12)
             # Three arrows pointing outward
-            pygame.draw.line(screen, WHITE, (self.x, self.y), (self.x - 8, self.y - 4), 2)
-            pygame.draw.line(screen, WHITE, (self.x, self.y), (self.x + 8, self.y - 4), 2)
-            pygame.draw.line(screen, WHITE, (self.x, self.y), (self.x, self.y + 8), 2)
+            pygame.draw.line(screen, WHITE, (x, y), (x - 8, y - 4), 2)
+            pygame.draw.line(screen, WHITE, (x, y), (x + 8, y - 4), 2)
+            pygame.draw.line(screen, WHITE, (x, y), (x, y + 8), 2)
             # Glow effect
-            pygame.draw.circle(screen, (255, 150, 0), (int(self.x), int(self.y)), 15, 1)
+            pygame.draw.circle(screen, (255, 150, 0), (int(x), int(y)), 15, 1)
         elif self.type == "magnet":
             # Magnetic field
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 12)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), 12)
             # Magnetic field lines
             for i in range(6):
                 angle = i * 60
-                start_x = self.x + 6 * math.cos(math.radians(angle))
-                start_y = self.y + 6 * math.sin(math.radians(angle))
-                end_x = self.x + 10 * math.cos(math.radians(angle))
-                end_y = self.y + 10 * math.sin(math.radians(angle))
+                start_x = x + 6 * math.cos(math.radians(angle))
+                start_y = y + 6 * math.sin(math.radians(angle))
+                end_x = x + 10 * math.cos(math.radians(angle))
+                end_y = y + 10 * math.sin(math.radians(angle))
                 pygame.draw.line(screen, WHITE, (int(start_x), int(start_y)), (int(end_x), int(end_y)), 1)
             # Glow effect
-            pygame.draw.circle(screen, (100, 0, 200), (int(self.x), int(self.y)), 15, 1)
+            pygame.draw.circle(screen, (100, 0, 200), (int(x), int(y)), 15, 1)
         elif self.type == "freeze_time":
             # Ice crystal
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 12)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), 12)
             # Ice spikes
             for i in range(6):
                 angle = i * 60
-                spike_x = self.x + 8 * math.cos(math.radians(angle))
-                spike_y = self.y + 8 * math.sin(math.radians(angle))
-                pygame.draw.line(screen, WHITE, (self.x, self.y), (int(spike_x), int(spike_y)), 2)
+                spike_x = x + 8 * math.cos(math.radians(angle))
+                spike_y = y + 8 * math.sin(math.radians(angle))
+                pygame.draw.line(screen, WHITE, (x, y), (int(spike_x), int(spike_y)), 2)
             # Glow effect
-            pygame.draw.circle(screen, (0, 200, 255), (int(self.x), int(self.y)), 15, 1)
+            pygame.draw.circle(screen, (0, 200, 255), (int(x), int(y)), 15, 1)
         else:  # time_freeze
             # Clockwork mechanism
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), 12)
-            pygame.draw.circle(screen, BLACK, (int(self.x), int(self.y)), 12, 2)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), 12)
+            pygame.draw.circle(screen, BLACK, (int(x), int(y)), 12, 2)
             # Clock hands
-            pygame.draw.line(screen, BLACK, (self.x, self.y), (self.x, self.y - 8), 2)
-            pygame.draw.line(screen, BLACK, (self.x, self.y), (self.x + 6, self.y), 2)
+            pygame.draw.line(screen, BLACK, (x, y), (x, y - 8), 2)
+            pygame.draw.line(screen, BLACK, (x, y), (x + 6, y), 2)
             # Clock numbers
             for i in range(4):
                 angle = i * 90
-                num_x = self.x + 8 * math.cos(math.radians(angle))
-                num_y = self.y + 8 * math.sin(math.radians(angle))
+                num_x = x + 8 * math.cos(math.radians(angle))
+                num_y = y + 8 * math.sin(math.radians(angle))
                 pygame.draw.circle(screen, BLACK, (int(num_x), int(num_y)), 1)
             # Glowing effect
-            pygame.draw.circle(screen, AMBER, (int(self.x), int(self.y)), 16, 1)
+            pygame.draw.circle(screen, AMBER, (int(x), int(y)), 16, 1)
 
-class Particle:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.life = 30  # frames
-        self.max_life = 30
-        self.dx = random.uniform(-3, 3)
-        self.dy = random.uniform(-3, 3)
-        self.size = random.randint(2, 5)
+class ParticleSystem:
+    """Fixed-capacity particle pool stored as NumPy columns, stepped and drawn in bulk"""
+    MAX_LIFE = 30   # frames
+    GRAVITY = 0.1
+    
+    def __init__(self, capacity=4096, rng=None):
+        self.capacity = capacity
+        self.rng = rng or np.random.default_rng()
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.dx = np.zeros(capacity)
+        self.dy = np.zeros(capacity)
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color_index = np.zeros(capacity, dtype=np.int32)
+        
+        # Colours are stored as palette indices; dots are rasterised once per (colour, radius)
+        self.palette = []
+        self.palette_index = {}
+        self.dot_atlas = {}
+    
+    def clear(self):
+        """Drop every particle"""
+        self.count = 0
+    
+    def emit(self, x, y, color, count=5):
+        """Spawn a burst at (x, y); bursts beyond capacity are dropped"""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        if color not in self.palette_index:
+            self.palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        
+        new = slice(self.count, self.count + count)
+        self.x[new] = x
+        self.y[new] = y
+        self.dx[new] = self.rng.uniform(-3, 3, count)
+        self.dy[new] = self.rng.uniform(-3, 3, count)
+        self.life[new] = self.MAX_LIFE
+        self.size[new] = self.rng.integers(2, 6, count)
+        self.color_index[new] = self.palette_index[color]
+        self.count += count
     
     def update(self):
-        self.x += self.dx
-        self.y += self.dy
-        self.life -= 1
-        self.dy += 0.1  # gravity
+        """Advance every particle one frame, then pack the survivors to the front"""
+        alive = slice(0, self.count)
+        self.x[alive] += self.dx[alive]
+        self.y[alive] += self.dy[alive]
+        self.life[alive] -= 1
+        self.dy[alive] += self.GRAVITY
+        
+        keep = self.life[alive] > 0
+        survivors = int(keep.sum())
+        if survivors < self.count:
+            for column in (self.x, self.y, self.dx, self.dy, self.life, self.size, self.color_index):
+                column[:survivors] = column[alive][keep]
+            self.count = survivors
+    
+    def get_dot(self, color_index, radius):
+        """Pre-rasterised filled circle for a palette colour and radius"""
+        dot = self.dot_atlas.get((color_index, radius))
+        if dot is None:
+            dot = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(dot, self.palette[color_index], (radius, radius), radius)
+            if pygame.display.get_surface() is not None:
+                dot = dot.convert_alpha()
+            self.dot_atlas[(color_index, radius)] = dot
+        return dot
     
     def draw(self, screen):
-        alpha = int(255 * (self.life / self.max_life))
-        size = int(self.size * (self.life / self.max_life))
-        if size > 0:
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), size)
+        # Particles shrink as they fade
+        alive = slice(0, self.count)
+        radius = (self.size[alive] * (self.life[alive] / self.MAX_LIFE)).astype(np.int32)
+        visible = radius > 0
+        radius = radius[visible]
+        left = self.x[alive][visible].astype(np.int32) - radius
+        top = self.y[alive][visible].astype(np.int32) - radius
+        color_index = self.color_index[alive][visible]
+        
+        keys = list(zip(color_index.tolist(), radius.tolist()))
+        dots = {key: self.get_dot(*key) for key in set(keys)}
+        screen.blits([(dots[key], position) for key, position in zip(keys, zip(left.tolist(), top.tolist()))],
+                     doreturn=False)
+    
+    def get_draw_rects(self):
+        """Screen area each live particle can touch"""
+        alive = slice(0, self.count)
+        size = self.size[alive]
+        left = (self.x[alive] - size - 1).astype(np.int32)
+        top = (self.y[alive] - size - 1).astype(np.int32)
+        extent = size * 2 + 3
+        return [pygame.Rect(x, y, w, w) for x, y, w in zip(left.tolist(), top.tolist(), extent.tolist())]
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Library Defender")
+    parser.add_argument("--monster-engine", action="store_true",
+                        help="move enemies with the batched NumPy monster engine")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="only repaint and push the screen areas that changed during play")
+    parser.add_argument("--monster-archetypes", metavar="PATH",
+                        help="load monster types from a JSON archetype table")
+    parser.add_argument("--render-fps", type=int, default=RENDER_FPS, metavar="N",
+                        help="cap on drawn frames per second, 0 for uncapped; the simulation always runs at %d ticks per second" % FPS)
+    parser.add_argument("--seed", type=int, help="seed every run with this number instead of a random one")
+    parser.add_argument("--record", metavar="PATH", help="save each run's seed, settings and inputs to PATH")
+    parser.add_argument("--replay", metavar="PATH", help="replay a recorded run in real time")
+    parser.add_argument("--max-speed", action="store_true",
+                        help="with --replay: replay headless as fast as possible and check the result matches")
+    parser.add_argument("--headless", type=int, metavar="TICKS",
+                        help="simulate TICKS ticks without a window, drawing or sound and print the tick rate")
+    args = parser.parse_args()
+    
+    archetypes = load_monster_archetypes(args.monster_archetypes) if args.monster_archetypes else None
+    game = Game(monster_engine=args.monster_engine, dirty_rects=args.dirty_rects, archetypes=archetypes,
+                render_fps=args.render_fps, headless=args.headless is not None or args.max_speed,
+                seed=args.seed, record_path=args.record)
+    if args.replay:
+        recording = InputRecording.load(args.replay)
+        game.start_replay(recording)
+        if args.max_speed:
+            stats = game.run_headless(recording.ticks, restart=False)
+            result = game.run_result()
+            print(f"{stats['ticks']} ticks in {stats['seconds']:.2f}s: {stats['ticks_per_second']:.0f} ticks/s")
+            print("replay matches the recording" if result == recording.result
+                  else f"replay diverged: recorded {recording.result}, replayed {result}")
+        else:
+            game.run()
+    elif args.headless is not None:
+        stats = game.run_headless(args.headless)
+        print(f"{stats['ticks']} ticks over {stats['runs']} runs in {stats['seconds']:.2f}s: "
+              f"{stats['ticks_per_second']:.0f} ticks/s")
+    else:
+        game.run()
@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+import main
+
+
+def test_built_in_spawn_weights_open_new_types_over_time():
+    director = main.SpawnDirector()
+    bands = {start: set(table.items) for start, table in director.bands}
+    assert sorted(bands) == [0, 30000, 60000]
+    assert bands[0] == {"student", "animal", "ghost", "book_worm"}
+    assert bands[30000] == bands[0] | {"literary_villain"}
+    assert bands[60000] == bands[30000] | {"chaos_lord", "noise_demon"}
+
+
+def test_a_loaded_table_can_add_a_monster_type(tmp_path):
+    rows = {
+        "student": {"color": [255, 200, 200], "noise_value": [8, 12], "speed": [2.0, 3.0]},
+        "card_catalogue": {"color": [90, 60, 30], "noise_value": [4, 6], "speed": [1.0, 1.5], "health": 2,
+                           "width": 28, "height": 22, "spawn_weights": [[0, 1]]},
+    }
+    path = tmp_path / "archetypes.json"
+    path.write_text(json.dumps(rows))
+    archetypes = main.load_monster_archetypes(path)
+    assert archetypes["card_catalogue"].spawn_weights == ((0, 1),)
+
+    game = main.Game(headless=True, seed=1, archetypes=archetypes)
+    game.state = main.PLAYING
+    game.restart_game()
+    assert game.spawn_director.spawn_group(main.DIFFICULTY_NORMAL, 5000, game.rng.spawn)[0] == "card_catalogue"
+    for _ in range(300):
+        game.update()
+    monsters = [enemy for enemy in game.enemies.live() if enemy.monster_type == "card_catalogue"]
+    assert monsters and all(enemy.health == 2 for enemy in monsters)
+    monsters[0].draw(game.screen)  # Gets its own plain look rather than another type's sprite
+
+
+def test_a_table_with_no_spawn_weights_is_rejected():
+    with pytest.raises(ValueError):
+        main.monster_archetypes_from_rows({"student": {"color": [1, 2, 3], "noise_value": [1, 2], "speed": [1, 2]}})
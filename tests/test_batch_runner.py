@@ -0,0 +1,58 @@
+import itertools
+import json
+
+import numpy as np
+
+import batch_runner
+import main
+
+
+def settings(**overrides):
+    base = {
+        'monster_engine': False,
+        'archetypes': None,
+        'difficulty_multiplier': None,
+        'monster_types': list(main.MONSTER_ARCHETYPES),
+        'max_ticks': 600,
+    }
+    base.update(overrides)
+    return base
+
+
+def test_simulate_a_tiny_grid_and_save_aligned_columns(tmp_path):
+    config = settings()
+    jobs = list(itertools.product([main.DIFFICULTY_EASY, main.DIFFICULTY_EXPERT], ["default"], [0, 1], ["turret"]))
+    rows = [batch_runner.simulate(config, job) for job in jobs]
+    assert all(0 < row['ticks'] <= config['max_ticks'] for row in rows)
+    assert any(sum(row['kills']) for row in rows)
+
+    path = tmp_path / "results.npz"
+    batch_runner.save_results(path, jobs, rows, config['monster_types'])
+    results = np.load(path)
+    assert results['kills'].shape == (len(jobs), len(config['monster_types']))
+    assert list(results['monster_types']) == config['monster_types']
+    for i, row in enumerate(rows):
+        assert results['score'][i] == row['score']
+        assert results['seed'][i] == jobs[i][2]
+        assert list(results['kills'][i]) == row['kills']
+    # Only types the opening spawn weights allow can have been defeated in the first ten seconds
+    opening = {"student", "animal", "ghost", "book_worm"}
+    for column, name in enumerate(config['monster_types']):
+        if name not in opening:
+            assert not results['kills'][:, column].any()
+
+
+def test_spawn_weight_and_difficulty_overrides_reach_the_game(tmp_path):
+    path = tmp_path / "weights.json"
+    path.write_text(json.dumps({"book_worm": [[0, 1]]}))
+    rows = batch_runner.batch_archetypes(spawn_weights_path=path)
+    multipliers = {main.DIFFICULTY_EASY: 0.5, main.DIFFICULTY_NORMAL: 0.5,
+                   main.DIFFICULTY_HARD: 0.5, main.DIFFICULTY_EXPERT: 0.5}
+    config = settings(archetypes=rows, difficulty_multiplier=multipliers)
+
+    game = batch_runner.new_game(config, (main.DIFFICULTY_HARD, "default", 0, "idle"))
+    assert [table.items for _, table in game.spawn_director.bands] == [["book_worm"]]
+    assert game.spawn_director.spawn_delay(main.DIFFICULTY_HARD, 0) == 750
+
+    row = batch_runner.simulate(config, (main.DIFFICULTY_NORMAL, "default", 0, "turret"))
+    assert row['kills'][config['monster_types'].index("book_worm")] == sum(row['kills']) > 0
@@ -0,0 +1,17 @@
+import main
+
+
+def test_run_headless_counts_every_tick_across_restarts():
+    game = main.Game(headless=True, seed=1)
+    stats = game.run_headless(3000)
+    assert stats["runs"] > 1  # An idle player loses, so the budget spans several runs
+    assert stats["ticks"] == 3000
+
+
+def test_run_headless_records_the_run_cut_off_by_the_budget(tmp_path):
+    path = tmp_path / "run.json"
+    game = main.Game(headless=True, seed=1, record_path=str(path))
+    game.run_headless(3000)
+    recording = main.InputRecording.load(path)
+    assert recording.result == game.run_result()
+    assert not recording.result["game_over"]
@@ -0,0 +1,21 @@
+import main
+
+
+def test_recycled_monster_does_not_interpolate_from_its_old_spot():
+    game = main.Game(headless=True, seed=1)
+    game.state = main.PLAYING
+    game.restart_game()
+    game.spawn_enemy(['student'])
+    old = game.enemies[-1]
+    old.x, old.y = 100, 100
+    game.snapshot_positions()
+
+    game.remove_enemy(old)
+    game.monster_pool.release(game.enemies.compact())
+    game.spawn_enemy(['student'])
+    recycled = game.enemies[-1]
+    assert recycled is old  # The pool handed the same object back out
+    recycled.x, recycled.y = 140, 100
+
+    assert recycled not in [entity for entity, _, _ in game.interpolate_positions(0.5)]
+    assert (recycled.x, recycled.y) == (140, 100)
@@ -0,0 +1,17 @@
+import os
+import time
+
+import main
+
+
+def test_prune_cache_keeps_used_entries_and_temp_files_still_being_written(tmp_path):
+    sounds = main.SoundManager(enabled=False)
+    sounds.cache_path = tmp_path
+    sounds.cache_files_used = {"kept.npy"}
+    for name in ("kept.npy", "stale.npy", "writing.tmp", "abandoned.tmp", "notes.txt"):
+        (tmp_path / name).write_bytes(b"")
+    old = time.time() - sounds.STALE_TEMP_SECONDS - 1
+    os.utime(tmp_path / "abandoned.tmp", (old, old))
+
+    sounds.prune_cache()
+    assert sorted(entry.name for entry in tmp_path.iterdir()) == ["kept.npy", "notes.txt", "writing.tmp"]
@@ -0,0 +1,17 @@
+import itertools
+
+import main
+
+
+def test_animated_menu_labels_do_not_churn_the_cache(monkeypatch):
+    game = main.Game(headless=True, seed=1)
+    game.high_score_manager.high_scores = [1200, 800]  # Show the pulsing latest-score panel too
+    clock = itertools.count(0, 16)
+    monkeypatch.setattr(main.pygame.time, "get_ticks", lambda: next(clock))
+
+    game.draw_menu()
+    first_frame_misses = game.text_cache.misses
+    for _ in range(300):
+        game.draw_menu()
+    assert game.text_cache.misses == first_frame_misses  # Only the first frame renders the stable labels
+    assert game.text_cache.hits > 0